@@ -1,14 +1,29 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
-import threading
-from typing import Any, Dict, Iterable, Tuple, Optional
+import random
+import time
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    NamedTuple,
+    Sequence,
+    Tuple,
+    Optional,
+)
 
 
-from pymodbus.client import ModbusTcpClient
+from pymodbus.client import AsyncModbusTcpClient
 
-from pymodbus.exceptions import ConnectionException
+from pymodbus.exceptions import (
+    ConnectionException,
+    ModbusException,
+    ModbusIOException,
+)
 
 import voluptuous as vol
 
@@ -23,27 +38,63 @@ from homeassistant.const import (
     Platform,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 
 from . import const
+from .metrics import HubMetrics, read_request_bytes, write_request_bytes
+from .scheduler import FleetScheduler
+from .gateway import ModbusGateway
 from .const import (
     DEFAULT_NAME,
     DEFAULT_PORT,
     DEFAULT_HOSTID,
+    DEFAULT_PERSISTENT_CONNECTION,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     CONF_HOSTID,
+    CONF_PERSISTENT_CONNECTION,
+    CONF_FAST_SCAN_INTERVAL,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    C_POLL_FAST,
+    C_POLL_NORMAL,
+    C_POLL_SLOW,
+    C_POLL_TIERS,
+    C_POLL_SLOW_INTERVAL,
+    CONF_ADAPTIVE_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_PIPELINED_READS,
+    DEFAULT_PIPELINED_READS,
+    DEFAULT_ADAPTIVE_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    C_ADAPTIVE_BACKOFF_FACTOR,
+    C_BREAKER_THRESHOLD,
+    C_BREAKER_DELAY_MIN,
+    C_BREAKER_DELAY_MAX,
+    C_BREAKER_JITTER,
+    C_RECOVERY_THRESHOLD,
+    C_RECOVERY_PROBE_INTERVAL,
+    ISSUE_EMPTY_RESPONSES,
+    C_FLEET_SCHEDULER,
+    C_GATEWAYS,
+    STORAGE_VERSION,
+    C_STORE_SAVE_DELAY,
+    C_WRITE_DEBOUNCE,
+    C_WRITE_MAX_DELAY,
+    C_MAX_WRITE_REGISTERS,
+    C_MAX_WRITE_BITS,
+    C_OPTIMISTIC_TIMEOUT,
+    C_POLL_ON_DEMAND,
+    EVENT_WRITE_REVERTED,
+    C_HUB_METRICS,
     ENTITIES_DICT,
-    BINARYSENSOR_TYPES,
-    SENSOR_TYPES,
-    SELECT_TYPES,
-    CLIMATE_TYPES,
-    NUMBER_TYPES,
-    BINARY_TYPES,
-    get_entity_switch,
-    get_entity_type,
-    get_entity_select,
+    C_DT_BITS,
+    DataType,
     get_entity_factor,
     get_entity_max,
     get_entity_min,
@@ -53,31 +104,36 @@ from .const import (
     is_entity_switch,
     is_entity_select,
     is_entity_climate,
-    C_MIN_INPUT_REGISTER,
-    C_MAX_INPUT_REGISTER,
-    C_MIN_HOLDING_REGISTER,
-    C_MAX_HOLDING_REGISTER,
-    C_MIN_COILS,
-    C_MAX_COILS,
-    C_MIN_DISCRETE_INPUTS,
-    C_MAX_DISCRETE_INPUTS,
+    BlockDecoder,
+    ReadRequest,
+    compile_cycle_read,
+    compile_targeted_read,
+    get_entity_poll_tier,
+    make_entity_decoder,
 )
 
 
+if TYPE_CHECKING:
+    # catalog.py lädt die Entitäts-Plattformen von Home Assistant, daher erst bei Bedarf
+    from .catalog import EntityCatalog
+
 import sys
 import logging
 
 thismodule = sys.modules[__name__]
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.info(f"{thismodule} loaded")
+# Trace der Lese-Zyklen (ein Eintrag je Zyklus), aktivieren über
+# logger: logs: custom_components.ha_comfoconnectpro.trace: debug
+_TRACE_LOGGER = logging.getLogger(f"{__name__}.trace")
 
 PLATFORMS = [
-    Platform.BINARY_SENSOR,  # BINARYSENSOR_TYPES (r/o)
-    Platform.SENSOR,  # SENSOR_TYPES (r/o)
-    Platform.SELECT,  # SELECT_TYPES (r/w)
-    Platform.SWITCH,  # BINARY_TYPES (r/w)
-    Platform.CLIMATE,  # CLIMATE_TYPES (r/w)
-    Platform.NUMBER,  # NUMBER_TYPES (r/w)
+    Platform.BINARY_SENSOR,  # binary_sensor_types (r/o)
+    Platform.SENSOR,  # sensor_types (r/o)
+    Platform.SELECT,  # select_types (r/w)
+    Platform.SWITCH,  # binary_types (r/w)
+    Platform.CLIMATE,  # climate_types (r/w)
+    Platform.NUMBER,  # number_types (r/w)
 ]
 
 
@@ -101,23 +157,112 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     if scan_interval < 5:
         scan_interval = DEFAULT_SCAN_INTERVAL
 
+    fast_scan_interval = entry.options.get(
+        CONF_FAST_SCAN_INTERVAL,
+        entry.data.get(CONF_FAST_SCAN_INTERVAL, DEFAULT_FAST_SCAN_INTERVAL),
+    )
+    try:
+        fast_scan_interval = int(fast_scan_interval)
+    except (TypeError, ValueError):
+        fast_scan_interval = scan_interval
+
+    # Schnelle Stufe: mindestens 5 s, höchstens das normale Intervall
+    fast_scan_interval = min(max(fast_scan_interval, 5), scan_interval)
+
+    adaptive = bool(
+        entry.options.get(
+            CONF_ADAPTIVE_SCAN_INTERVAL,
+            entry.data.get(CONF_ADAPTIVE_SCAN_INTERVAL, DEFAULT_ADAPTIVE_SCAN_INTERVAL),
+        )
+    )
+    try:
+        min_scan_interval = int(
+            entry.options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)
+        )
+        max_scan_interval = int(
+            entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+        )
+    except (TypeError, ValueError):
+        min_scan_interval = DEFAULT_MIN_SCAN_INTERVAL
+        max_scan_interval = DEFAULT_MAX_SCAN_INTERVAL
+    min_scan_interval = max(min_scan_interval, 5)
+    max_scan_interval = max(max_scan_interval, min_scan_interval)
+
     hostid = entry.options.get(CONF_HOSTID, entry.data.get(CONF_HOSTID, DEFAULT_HOSTID))
     try:
         hostid = int(hostid)
     except (TypeError, ValueError):
         hostid = DEFAULT_HOSTID
 
+    persistent = bool(
+        entry.options.get(
+            CONF_PERSISTENT_CONNECTION,
+            entry.data.get(CONF_PERSISTENT_CONNECTION, DEFAULT_PERSISTENT_CONNECTION),
+        )
+    )
+
+    pipelined = bool(entry.options.get(CONF_PIPELINED_READS, DEFAULT_PIPELINED_READS))
+
     _LOGGER.info("Setup %s.%s", DOMAIN, name)
 
-    hub = MyModbusHub(hass, name, host, port, scan_interval, hostid)
+    # Ein Scheduler für alle Config-Entries: Zyklen staffeln, Nebenläufigkeit begrenzen
+    scheduler = hass.data[DOMAIN].get(C_FLEET_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DOMAIN][C_FLEET_SCHEDULER] = FleetScheduler()
+    # Eine TCP-Verbindung je Gateway (host, port) für alle Geräte-IDs dahinter
+    gateways = hass.data[DOMAIN].get(C_GATEWAYS)
+    if gateways is None:
+        gateways = hass.data[DOMAIN][C_GATEWAYS] = {}
+    gateway = gateways.get((host, port))
+    if gateway is None:
+        gateway = gateways[(host, port)] = ModbusGateway(host, port)
+
+    hub = MyModbusHub(
+        hass,
+        name,
+        host,
+        port,
+        scan_interval,
+        hostid,
+        persistent,
+        fast_scan_interval,
+        adaptive=adaptive,
+        min_scan_interval=min_scan_interval,
+        max_scan_interval=max_scan_interval,
+        scheduler=scheduler,
+        gateway=gateway,
+        pipelined=pipelined,
+        store=Store(hass, STORAGE_VERSION, _storage_key(entry)),
+        entry_id=entry.entry_id,
+        catalog=await hass.async_add_executor_job(_load_catalog),
+    )
+    # Zuletzt bekannte Werte sofort anzeigen, das erste Lesen folgt im Hintergrund
+    await hub.async_restore()
     # """Register the hub."""
-    hass.data[DOMAIN][name] = {"hub": hub}
+    # Schlüssel ist die entry_id: der Name ist nicht eindeutig (Standard DEFAULT_NAME)
+    hass.data[DOMAIN][entry.entry_id] = {"hub": hub}
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
+def _load_catalog() -> EntityCatalog:
+    """Katalog laden (Import und erstes Kompilieren blockieren, daher im Executor)."""
+    from .catalog import get_catalog
+
+    return get_catalog()
+
+
+def _storage_key(entry: ConfigEntry) -> str:
+    return f"{DOMAIN}.{entry.entry_id}"
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Gespeicherten Zustand beim Entfernen des Config-Entry löschen."""
+    await Store(hass, STORAGE_VERSION, _storage_key(entry)).async_remove()
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     await hass.config_entries.async_reload(entry.entry_id)
 
@@ -135,13 +280,66 @@ async def async_unload_entry(hass, entry):
     if not unload_ok:
         return False
 
-    name = entry.data[CONF_NAME]
-    hass.data[DOMAIN].pop(name, None)
+    hub_data = hass.data[DOMAIN].pop(entry.entry_id, None)
+    if hub_data:
+        await hub_data["hub"].async_close()
+    scheduler = hass.data[DOMAIN].get(C_FLEET_SCHEDULER)
+    if scheduler is not None and not scheduler.hubs:
+        hass.data[DOMAIN].pop(C_FLEET_SCHEDULER)
+    gateways = hass.data[DOMAIN].get(C_GATEWAYS, {})
+    for key, gateway in list(gateways.items()):
+        if not gateway.hubs:
+            del gateways[key]
     return True
 
 
+class PendingWrite(NamedTuple):
+    """Vorgemerkter Schreibzugriff einer Entität in der Schreib-Queue."""
+
+    reg: int
+    words: Tuple[int, ...]
+    dt: DataType
+    futures: list[asyncio.Future]
+
+
+def _merge_pending_writes(
+    pending: Iterable[PendingWrite],
+) -> list[tuple[int, list[int], DataType, list[asyncio.Future]]]:
+    """
+    Vorgemerkte Schreibzugriffe nach Registerart und Adresse sortieren und
+    direkt aneinander anschließende Register/Coils zu einem Request zusammenfassen.
+    Überlappende Adressen werden nicht zusammengefasst.
+    """
+    bits = C_DT_BITS
+    runs: list[tuple[int, list[int], DataType, list[asyncio.Future]]] = []
+    for item in sorted(pending, key=lambda p: (p.dt != bits, p.reg)):
+        is_bits = item.dt == bits
+        limit = C_MAX_WRITE_BITS if is_bits else C_MAX_WRITE_REGISTERS
+        if runs:
+            base_reg, words, dt, futures = runs[-1]
+            if (
+                (dt == bits) == is_bits
+                and base_reg + len(words) == item.reg
+                and len(words) + len(item.words) <= limit
+            ):
+                words.extend(item.words)
+                futures.extend(item.futures)
+                continue
+        runs.append((item.reg, list(item.words), item.dt, list(item.futures)))
+    return runs
+
+
+@dataclass
+class OptimisticValue:
+    """Erwarteter Wert einer Entität zwischen Schreiben und Bestätigung durch Lesen."""
+
+    value: Any
+    future: asyncio.Future
+    unsub_timeout: Callable[[], None] | None = None
+
+
 class MyModbusHub:
-    """Thread safe wrapper class for pymodbus."""
+    """Asyncio wrapper class for pymodbus."""
 
     def __init__(
         self,
@@ -151,77 +349,734 @@ class MyModbusHub:
         port,
         scan_interval,
         hostid,
+        persistent: bool = DEFAULT_PERSISTENT_CONNECTION,
+        fast_scan_interval: int | None = None,
+        adaptive: bool = DEFAULT_ADAPTIVE_SCAN_INTERVAL,
+        min_scan_interval: int = DEFAULT_MIN_SCAN_INTERVAL,
+        max_scan_interval: int = DEFAULT_MAX_SCAN_INTERVAL,
+        scheduler: FleetScheduler | None = None,
+        gateway: ModbusGateway | None = None,
+        pipelined: bool = DEFAULT_PIPELINED_READS,
+        store: Store | None = None,
+        entry_id: str | None = None,
+        catalog: EntityCatalog | None = None,
     ):
         """Initialize the Modbus hub."""
         self._hass = hass
-        self._client = ModbusTcpClient(host=host, port=port, timeout=3, retries=3)
-        self._lock = threading.Lock()
+        self._scheduler = scheduler
+        if scheduler is not None:
+            scheduler.register(self)
+        # Verbindung ggf. mit anderen Hubs (Geräte-IDs) am selben Gateway geteilt
+        self._gateway = gateway if gateway is not None else ModbusGateway(host, port)
+        self._gateway.register(self)
+        self._client = self._gateway.client
+        self._pipelined = pipelined
+        self._store = store
+        self._entry_id = entry_id
+        self._persistent = persistent
+        # Circuit Breaker: offen <=> not self.available
+        self.available = True
+        self._failures = 0
+        self._breaker_delay = 0.0
+        self._breaker_retry_at = 0.0
+        # Leere Antworten trotz Verbindung (Zeitumstellung): langsames Proben
+        self._empty_response = False
+        self._recovery = False
+        # Gesundheit je Block: Entitäten, deren Block zuletzt nicht gelesen werden konnte
+        self._unhealthy: set[str] = set()
+        self._failed_requests: list[ReadRequest] = []
+        self._lock = asyncio.Lock()
         self._name = name
-        self._scan_interval = timedelta(seconds=scan_interval)
+        # Der Timer läuft im Takt der schnellen Stufe (self._tick), die übrigen Stufen
+        # werden gelesen, sobald ihr Intervall abgelaufen ist (C_POLL_ON_DEMAND nur bei
+        # full). Im adaptiven Modus bewegt sich der Takt zwischen min und max.
+        fast_scan_interval = fast_scan_interval or scan_interval
+        self._adaptive = adaptive
+        self._min_tick = float(min_scan_interval)
+        self._max_tick = float(max_scan_interval)
+        self._tick = self._min_tick if adaptive else float(fast_scan_interval)
+        self._activity = False
+        self._adaptive_ref: Dict[str, Any] = {}
+        self._closed = False
+        self._cycle_running = False
+        self._tier_intervals: Dict[str, float] = {
+            C_POLL_FAST: self._tick,
+            C_POLL_NORMAL: scan_interval,
+            C_POLL_SLOW: max(C_POLL_SLOW_INTERVAL, scan_interval),
+        }
+        self._tier_last_read: Dict[str, float] = {}
         self._hostid = hostid
         self._unsub_interval_method = None
         self._sensors = []
+        # entity_key -> Callbacks der Entitäten, die von diesem Wert abhängen
+        self._listeners: Dict[str, list[Callable[[], None]]] = {}
+        # Callbacks ohne deklarierte Abhängigkeiten (bei jedem Zyklus benachrichtigt)
+        self._unkeyed_listeners: list[Callable[[], None]] = []
+        self._tasks: set[asyncio.Task] = set()
+        # Schreib-Queue: entity_key -> PendingWrite (letzter Wert gewinnt)
+        self._pending_writes: Dict[str, PendingWrite] = {}
+        self._pending_since: float = 0.0
+        self._unsub_write_flush = None
+        # Optimistische Werte (entity_key -> OptimisticValue), überlagern self.data
+        self._optimistic: Dict[str, OptimisticValue] = {}
+        self._tier_keys: Dict[str, set[str]] = {}
+        for key, props in ENTITIES_DICT.items():
+            self._tier_keys.setdefault(get_entity_poll_tier(props), set()).add(key)
+        self._last_read_tiers: set[str] = set()
+        self.metrics = HubMetrics()
+        # Read-Plan und Decoder-Tabellen (beim ersten Hub des Prozesses erzeugt)
+        self._catalog = catalog if catalog is not None else _load_catalog()
+        # Letzter Antwort-Puffer je Request des Read-Plans (Rohwerte für den
+        # Diagnose-Download und den gespeicherten Zustand)
+        self.raw_buffers: Dict[ReadRequest, list] = {}
+        self._raw_targets: Dict[ReadRequest, tuple] = {}
+        self._request_labels: Dict[ReadRequest, str] = {}
         self.data: Dict[str, Any] = {}
 
     @callback
-    def async_add_my_modbus_sensor(self, update_callback):
-        """Listen for data updates."""
+    def async_add_my_modbus_sensor(
+        self, update_callback, keys: Iterable[str] | None = None
+    ):
+        """
+        Listen for data updates.
+        keys: Schlüssel in self.data, von denen die Entität abhängt. Die Entität wird
+        nur benachrichtigt, wenn sich einer dieser Werte geändert hat.
+        """
         # This is the first sensor, set up interval.
         if not self._sensors:
             # DO NOT open connection here anymore: self.connect()
-            self._unsub_interval_method = async_track_time_interval(
-                self._hass, self.async_refresh_modbus_data, self._scan_interval
-            )
+            # Erstes Lesen sofort (im Hintergrund), nicht erst nach einem Intervall
+            self._async_schedule_next(0, align=False)
 
         self._sensors.append(update_callback)
+        if keys is None:
+            self._unkeyed_listeners.append(update_callback)
+        else:
+            for key in keys:
+                self._listeners.setdefault(key, []).append(update_callback)
 
     @callback
     def async_remove_my_modbus_sensor(self, update_callback):
         """Remove data update."""
         self._sensors.remove(update_callback)
+        if update_callback in self._unkeyed_listeners:
+            self._unkeyed_listeners.remove(update_callback)
+        for key, callbacks in list(self._listeners.items()):
+            if update_callback in callbacks:
+                callbacks.remove(update_callback)
+                if not callbacks:
+                    del self._listeners[key]
 
         if not self._sensors:
             # """stop the interval timer upon removal of last sensor"""
+            if self._unsub_interval_method:
+                self._unsub_interval_method()
+                self._unsub_interval_method = None
+            # Läuft gerade ein Zyklus, trennt dessen finally die Verbindung
+            if not self._cycle_running:
+                self.close()
+
+    async def _async_ensure_connected(self) -> bool:
+        """
+        Verbindung sicherstellen. Aufruf nur unter self._lock, bei Erfolg muss
+        _release_connection folgen.
+        Eine bestehende (persistente oder von einem anderen Hub am selben Gateway
+        aufgebaute) Verbindung wird weiterverwendet, sonst wird neu verbunden.
+        Fehlschläge zählen für den Circuit Breaker.
+        """
+        gateway = self._gateway
+        if not self._client.connected:
+            async with gateway.connect_lock:
+                if not self._client.connected and not await self._async_connect():
+                    return False
+        gateway.active += 1
+        return True
+
+    async def _async_connect(self) -> bool:
+        started = time.perf_counter()
+        connected = await self._client.connect()
+        self.metrics.record_connect((time.perf_counter() - started) * 1000)
+        if connected:
+            if self._persistent:
+                self._gateway.enable_keepalive()
+            return True
+
+        self.metrics.record_error("Verbindungsaufbau fehlgeschlagen")
+        _LOGGER.warning("Modbus connect failed")
+        self._async_record_failure()
+        return False
+
+    def _release_connection(self, failed: bool = False) -> None:
+        """
+        Verbindung nach einem Zyklus schließen (nicht persistent oder Fehler, sofern
+        kein anderer Hub am Gateway gerade liest) und das Ergebnis für den Circuit
+        Breaker zählen.
+        """
+        gateway = self._gateway
+        gateway.active -= 1
+        if (failed or not self._persistent) and gateway.active == 0:
+            self._client.close()
+            gateway.close_pipeline()
+        empty_response, self._empty_response = self._empty_response, False
+        if not failed:
+            self._async_record_success()
+        elif empty_response:
+            self._async_record_empty_response()
+        else:
+            self._async_record_failure()
+
+    # ---- Circuit Breaker ---------------------------------------------------------
+
+    @property
+    def _recovery_issue_id(self) -> str:
+        return f"{ISSUE_EMPTY_RESPONSES}_{self._entry_id or self._name}"
+
+    @callback
+    def _async_record_empty_response(self) -> None:
+        """
+        Verbindung steht, das Gerät liefert aber nur leere Antworten (nach der
+        Zeitumstellung bis zum Neustart). Statt voller Zyklen im normalen Takt nur noch
+        alle C_RECOVERY_PROBE_INTERVAL Sekunden proben und ein Repair-Issue anzeigen.
+        """
+        self._failures += 1
+        if not self._recovery and self._failures < C_RECOVERY_THRESHOLD:
+            return
+        self._breaker_delay = C_RECOVERY_PROBE_INTERVAL
+        self._breaker_retry_at = time.monotonic() + C_RECOVERY_PROBE_INTERVAL
+        if not self._recovery:
+            self._recovery = True
+            _LOGGER.warning(
+                "%s: ComfoConnect PRO liefert leere Antworten. Nach der Zeitumstellung "
+                "(Sommer-/Winterzeit) muss es neu gestartet werden (Stand V1.0.5). "
+                "Prüfe alle %.0f s, ob wieder Daten kommen",
+                self._name,
+                C_RECOVERY_PROBE_INTERVAL,
+            )
+            ir.async_create_issue(
+                self._hass,
+                DOMAIN,
+                self._recovery_issue_id,
+                is_fixable=False,
+                severity=ir.IssueSeverity.WARNING,
+                translation_key=ISSUE_EMPTY_RESPONSES,
+                translation_placeholders={"name": self._name},
+            )
+        if self.available:
+            self.available = False
+            self._async_dispatch_all()
+
+    def _breaker_blocks(self) -> bool:
+        """True, solange der Breaker offen ist und die Wartezeit noch läuft."""
+        return not self.available and time.monotonic() < self._breaker_retry_at
+
+    @callback
+    def _async_record_success(self) -> None:
+        self._failures = 0
+        if self._recovery:
+            self._recovery = False
+            ir.async_delete_issue(self._hass, DOMAIN, self._recovery_issue_id)
+        if not self.available:
+            self.available = True
+            self._breaker_delay = 0.0
+            _LOGGER.warning("%s: ComfoConnect PRO wieder erreichbar", self._name)
+            self._async_dispatch_all()
+
+    @callback
+    def _async_record_failure(self) -> None:
+        """
+        Fehlschlag zählen. Ab C_BREAKER_THRESHOLD in Folge (bzw. bei fehlgeschlagenem
+        Probe-Request) öffnen: Entitäten nicht verfügbar, Wartezeit verdoppeln.
+        """
+        self._failures += 1
+        if self.available and self._failures < C_BREAKER_THRESHOLD:
+            return
+        self._breaker_delay = min(
+            max(self._breaker_delay * 2, C_BREAKER_DELAY_MIN), C_BREAKER_DELAY_MAX
+        )
+        delay = self._breaker_delay * random.uniform(
+            1 - C_BREAKER_JITTER, 1 + C_BREAKER_JITTER
+        )
+        self._breaker_retry_at = time.monotonic() + delay
+        if self.available:
+            self.available = False
+            _LOGGER.warning(
+                "%s: ComfoConnect PRO nicht erreichbar (%d Fehler in Folge), "
+                "nächster Versuch in %.0f s",
+                self._name,
+                self._failures,
+                delay,
+            )
+            self._async_dispatch_all()
+        else:
+            _LOGGER.debug(
+                "%s: Probe fehlgeschlagen, nächster Versuch in %.0f s",
+                self._name,
+                delay,
+            )
+
+    # ---- Zeitsteuerung ----------------------------------------------------------
+
+    @callback
+    def _async_schedule_next(self, delay: float, align: bool = True) -> None:
+        """
+        Nächsten Zyklus in delay Sekunden einplanen (ersetzt einen geplanten).
+        align: Verzögerung an die Phase des Hubs im FleetScheduler anpassen.
+        """
+        if self._unsub_interval_method:
             self._unsub_interval_method()
-            self._unsub_interval_method = None
-            self.close()
+        if align and self._scheduler is not None:
+            delay = self._scheduler.align(self, delay, self._tick)
+        self._unsub_interval_method = async_call_later(
+            self._hass, delay, self._async_timer_refresh
+        )
 
-    def _do_read_cycle(self) -> bool:
-        """Connect, read all registers, close. Runs in executor under self._lock."""
-        with self._lock:
-            if not self._client.connect():
-                _LOGGER.warning("Modbus connect failed")
-                return False
+    async def _async_timer_refresh(self, _now=None) -> None:
+        self._unsub_interval_method = None
+        self._cycle_running = True
+        started = time.monotonic()
+        try:
+            if self._scheduler is not None:
+                async with self._scheduler.cycle():
+                    await self.async_refresh_modbus_data()
+            else:
+                await self.async_refresh_modbus_data()
+        finally:
+            self._cycle_running = False
+            if not self._sensors:
+                # Letzte Entität während des Zyklus entfernt: nicht neu einplanen
+                self.close()
+            # Neu einplanen, sofern nicht entladen oder zwischenzeitlich neu geplant
+            elif not self._closed and not self._unsub_interval_method:
+                elapsed = time.monotonic() - started
+                self._async_schedule_next(max(self._tick - elapsed, 0.0))
+
+    @callback
+    def _async_update_tick(self) -> None:
+        """
+        Adaptives Intervall: Takt auf das Minimum setzen, solange sich Werte bewegen
+        (DELTA überschritten, ACTIVE-Wert anliegend, nach einem Schreibzugriff),
+        sonst schrittweise bis zum Maximum verlängern.
+        """
+        if not self._adaptive:
+            return
+        moving = self._activity
+        self._activity = False
+        data = self.data
+        for key, active_value in self._catalog.adaptive_active_values.items():
+            if data.get(key) == active_value:
+                moving = True
+        for key, delta in self._catalog.adaptive_deltas.items():
+            value = data.get(key)
+            reference = self._adaptive_ref.get(key)
+            if value is not None and reference is not None:
+                if abs(value - reference) >= delta:
+                    moving = True
+            self._adaptive_ref[key] = value
+
+        if moving:
+            tick = self._min_tick
+        else:
+            tick = min(self._tick * C_ADAPTIVE_BACKOFF_FACTOR, self._max_tick)
+        if tick != self._tick:
+            _LOGGER.debug("Adaptives Abfrage-Intervall: %.1f s", tick)
+        self._tick = tick
+        self._tier_intervals[C_POLL_FAST] = tick
+
+    def _due_tiers(self, now: float, full: bool) -> set[str]:
+        """Abfrage-Stufen, die in diesem Zyklus gelesen werden müssen."""
+        if full or not self._tier_last_read:
+            return set(C_POLL_TIERS)
+        # Toleranz von einem halben Takt gegen Timer-Jitter
+        tolerance = self._tick / 2
+        due = set()
+        for tier, interval in self._tier_intervals.items():
+            last = self._tier_last_read.get(tier)
+            if last is None or now - last + tolerance >= interval:
+                due.add(tier)
+        return due
+
+    async def _async_read_cycle(self, full: bool = False) -> set[str] | None:
+        """
+        Connect (falls nötig), read the due registers. Runs under self._lock.
+        Liefert die Schlüssel der geänderten Werte oder None bei Fehler.
+        """
+        if self._breaker_blocks():
+            return None
+        async with self._lock:
+            self.metrics.begin_cycle()
+            if not await self._async_ensure_connected():
+                return None
+            failed = True
+            try:
+                if not self.available:
+                    # Half-open: ein kleiner Request entscheidet, ob wieder gelesen wird
+                    probe = min(
+                        self._catalog.read_plan, key=lambda request: request.count
+                    )
+                    if await self._async_read_request(probe) is None:
+                        return None
+                    full = True
+                now = time.monotonic()
+                tiers = self._due_tiers(now, full)
+                # Fällige Stufen gemeinsam lesen (ein Plan je Kombination, gecacht)
+                cycle = compile_cycle_read(frozenset(tiers))
+                changed = await self.read_modbus_registers(
+                    tiers, cycle.plan, cycle.blocks
+                )
+                if changed is not None:
+                    # Stufen mit fehlgeschlagenem Block im nächsten Zyklus wiederholen
+                    failed_tiers: set[str] = set()
+                    for request in self._failed_requests:
+                        failed_tiers |= cycle.tiers[cycle.plan.index(request)]
+                    for tier in tiers - failed_tiers:
+                        self._tier_last_read[tier] = now
+                    self._last_read_tiers = tiers
+                failed = changed is None
+                return changed
+            except ModbusException as exc:
+                self.metrics.record_error(
+                    f"Lesen: {exc}", timeout=isinstance(exc, ModbusIOException)
+                )
+                _LOGGER.warning("Modbus-Fehler beim Lesen: %s", exc)
+                return None
+            finally:
+                self._release_connection(failed)
+
+    async def _async_read_keys(self, keys: Iterable[str]) -> set[str] | None:
+        """
+        Gezieltes Lesen nach dem Schreiben: nur die geschriebenen Entitäten und deren
+        abhängige Entitäten (AFFECTS) statt aller Register. Runs under self._lock.
+        """
+        if not self.available:
+            return None
+        targeted = compile_targeted_read(frozenset(keys))
+        async with self._lock:
+            if not await self._async_ensure_connected():
+                return None
+            failed = True
             try:
-                return self.read_modbus_registers()
+                changed = await self.read_modbus_registers(
+                    C_POLL_TIERS, targeted.plan, targeted.blocks
+                )
+                failed = changed is None
+                return changed
+            except ModbusException as exc:
+                self.metrics.record_error(
+                    f"Lesen nach dem Schreiben: {exc}",
+                    timeout=isinstance(exc, ModbusIOException),
+                )
+                _LOGGER.warning("Modbus-Fehler beim Lesen nach dem Schreiben: %s", exc)
+                return None
             finally:
-                self._client.close()
+                self._release_connection(failed)
+
+    @callback
+    def _async_dispatch_metrics(self) -> None:
+        """Diagnose-Sensoren (Kennzahlen) benachrichtigen."""
+        for update_callback in self._listeners.get(C_HUB_METRICS, ()):
+            update_callback()
 
-    async def async_refresh_modbus_data(self, _now: Optional[int] = None) -> None:
-        """Time to update."""
+    @callback
+    def _async_dispatch_all(self) -> None:
+        """Alle Entitäten benachrichtigen (z.B. Wechsel der Verfügbarkeit)."""
+        for update_callback in list(self._sensors):
+            update_callback()
+
+    @callback
+    def _async_dispatch(self, changed: Iterable[str]) -> None:
+        """Nur die Entitäten benachrichtigen, deren Eingangswerte sich geändert haben."""
+        notified: Dict[Callable[[], None], None] = dict.fromkeys(
+            self._unkeyed_listeners
+        )
+        listeners = self._listeners
+        for key in changed:
+            callbacks = listeners.get(key)
+            if callbacks:
+                notified.update(dict.fromkeys(callbacks))
+        for update_callback in notified:
+            update_callback()
+
+    async def async_refresh_modbus_data(
+        self, _now: Optional[int] = None, full: bool = False
+    ) -> None:
+        """Time to update. full=True liest alle Abfrage-Stufen."""
         if not self._sensors:
             return
 
-        update_result = await self._hass.async_add_executor_job(self._do_read_cycle)
+        # Laufende Zyklen merken, damit sie beim Entladen abgebrochen werden können
+        task = asyncio.current_task()
+        if task is not None:
+            self._tasks.add(task)
+        started = time.perf_counter()
+        try:
+            changed = await self._async_read_cycle(full)
+        finally:
+            if task is not None:
+                self._tasks.discard(task)
+
+        if changed is not None:
+            if self._optimistic:
+                read_keys = set().union(
+                    *(self._tier_keys.get(tier, ()) for tier in self._last_read_tiers)
+                )
+                read_keys -= self._unhealthy
+                changed |= self._async_confirm_optimistic(read_keys)
+            dispatch_started = time.perf_counter()
+            self._async_dispatch(changed)
+            finished = time.perf_counter()
+            self.metrics.record_cycle(
+                (finished - started) * 1000, (finished - dispatch_started) * 1000
+            )
+            self._async_update_tick()
+            if changed:
+                self._async_schedule_save()
+        self._async_dispatch_metrics()
+
+    # ---- Zuletzt bekannter Zustand ------------------------------------------------
+
+    async def async_restore(self) -> None:
+        """Zuletzt gespeicherte Werte und Rohpuffer laden (vor dem ersten Lesen)."""
+        if self._store is None:
+            return
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        try:
+            for key, value in stored["data"].items():
+                if key in ENTITIES_DICT:
+                    self.data.setdefault(key, value)
+            plan = set(self._catalog.read_plan)
+            for item in stored["raw"]:
+                request = ReadRequest(
+                    item["reg_type"], item["address"], item["count"], item["tier"]
+                )
+                # Nur Puffer, deren Request es im aktuellen Read-Plan noch gibt
+                if request in plan:
+                    self.raw_buffers.setdefault(request, item["raw"])
+        except (KeyError, TypeError, AttributeError) as exc:
+            _LOGGER.warning("%s: gespeicherter Zustand ungültig: %r", self._name, exc)
+            return
+        _LOGGER.debug("%s: %d gespeicherte Werte geladen", self._name, len(self.data))
+
+    def _store_data(self) -> Dict[str, Any]:
+        return {
+            "data": dict(self.data),
+            "raw": [
+                {
+                    "reg_type": request.reg_type,
+                    "address": request.address,
+                    "count": request.count,
+                    "tier": request.tier,
+                    "raw": [int(word) for word in buf[: request.count]],
+                }
+                for request, buf in self.raw_buffers.items()
+            ],
+        }
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Zustand gebündelt speichern (Store schreibt spätestens beim Beenden von HA)."""
+        if self._store is not None:
+            self._store.async_delay_save(self._store_data, C_STORE_SAVE_DELAY)
+
+    # ---- Optimistischer Zustand ---------------------------------------------------
+
+    def is_key_available(self, entity_key: str) -> bool:
+        """False, solange der Block der Entität zuletzt nicht gelesen werden konnte."""
+        return self.available and entity_key not in self._unhealthy
+
+    def get_value(self, entity_key: str, default: Any = None) -> Any:
+        """Wert für die Anzeige: optimistischer Wert, solange unbestätigt, sonst hub.data."""
+        optimistic = self._optimistic.get(entity_key)
+        if optimistic is not None:
+            return optimistic.value
+        return self.data.get(entity_key, default)
+
+    @callback
+    def _async_set_optimistic(
+        self, entity_key: str, value: Any, future: asyncio.Future
+    ) -> None:
+        """Erwarteten Wert sofort veröffentlichen und Schreibergebnis überwachen."""
+        previous = self._optimistic.pop(entity_key, None)
+        if previous is not None and previous.unsub_timeout:
+            previous.unsub_timeout()
+
+        @callback
+        def _async_timeout(_now) -> None:
+            optimistic = self._optimistic.get(entity_key)
+            if optimistic is not None and optimistic.future is future:
+                optimistic.unsub_timeout = None
+                self._async_revert_optimistic(entity_key, "timeout")
+
+        @callback
+        def _async_write_done(done: asyncio.Future) -> None:
+            optimistic = self._optimistic.get(entity_key)
+            if optimistic is None or optimistic.future is not done:
+                return
+            if done.cancelled() or not done.result():
+                self._async_revert_optimistic(entity_key, "write_failed")
+
+        self._optimistic[entity_key] = OptimisticValue(
+            value,
+            future,
+            async_call_later(self._hass, C_OPTIMISTIC_TIMEOUT, _async_timeout),
+        )
+        future.add_done_callback(_async_write_done)
+        self._async_dispatch((entity_key,))
 
-        if update_result:
-            for update_callback in self._sensors:
-                update_callback()
+    @callback
+    def _async_confirm_optimistic(self, read_keys: Iterable[str]) -> set[str]:
+        """
+        Optimistische Werte mit frisch gelesenen Werten abgleichen. Bestätigte Werte
+        werden entfernt, abweichende zurückgenommen.
+        Liefert die Schlüssel, deren angezeigter Wert sich dadurch ändert.
+        """
+        changed: set[str] = set()
+        for entity_key in [key for key in read_keys if key in self._optimistic]:
+            optimistic = self._optimistic[entity_key]
+            future = optimistic.future
+            # Schreiben noch nicht abgeschlossen: gelesener Wert ist noch der alte
+            if not future.done() or future.cancelled() or not future.result():
+                continue
+            if self.data.get(entity_key) == optimistic.value:
+                del self._optimistic[entity_key]
+                if optimistic.unsub_timeout:
+                    optimistic.unsub_timeout()
+            else:
+                self._async_revert_optimistic(entity_key, "rejected", dispatch=False)
+                changed.add(entity_key)
+        return changed
+
+    @callback
+    def _async_revert_optimistic(
+        self, entity_key: str, reason: str, dispatch: bool = True
+    ) -> None:
+        """Optimistischen Wert zurücknehmen (Gerätewert anzeigen) und Event auslösen."""
+        optimistic = self._optimistic.pop(entity_key, None)
+        if optimistic is None:
+            return
+        if optimistic.unsub_timeout:
+            optimistic.unsub_timeout()
+        _LOGGER.warning(
+            "Schreiben von %s nicht bestätigt (%s), setze auf Gerätewert zurück",
+            entity_key,
+            reason,
+        )
+        self._hass.bus.async_fire(
+            EVENT_WRITE_REVERTED,
+            {
+                "hub": self._name,
+                "entity_key": entity_key,
+                "value": optimistic.value,
+                "device_value": self.data.get(entity_key),
+                "reason": reason,
+            },
+        )
+        if dispatch:
+            self._async_dispatch((entity_key,))
 
     @property
     def name(self):
         """Return the name of this hub."""
         return self._name
 
+    def diagnostics(self) -> Dict[str, Any]:
+        """Momentaufnahme für den Diagnose-Download (Read-Plan, Rohpuffer, Werte)."""
+        now = time.monotonic()
+        slots_by_block: Dict[int, list[str]] = {}
+        for key, (block, _offset) in self._catalog.read_plan_slots.items():
+            slots_by_block.setdefault(block, []).append(key)
+
+        read_plan = []
+        for index, request in enumerate(self._catalog.read_plan):
+            reg_type_name = self._READ_FUNCTIONS[request.reg_type][1]
+            buf = self.raw_buffers.get(request)
+            read_plan.append(
+                {
+                    "reg_type": reg_type_name,
+                    "address": request.address,
+                    "count": request.count,
+                    "tier": request.tier,
+                    "entities": slots_by_block.get(index, []),
+                    "raw": [int(word) for word in buf[: request.count]]
+                    if buf is not None
+                    else None,
+                }
+            )
+
+        return {
+            "connected": self._client.connected,
+            "gateway_units": len(self._gateway.hubs),
+            "pipelined_reads": self._pipelined and self._gateway.pipeline_supported,
+            "persistent": self._persistent,
+            "tick": self._tick,
+            "adaptive": self._adaptive,
+            "tier_intervals": dict(self._tier_intervals),
+            "tier_last_read_age": {
+                tier: round(now - last, 1)
+                for tier, last in self._tier_last_read.items()
+            },
+            "available": self.available,
+            "consecutive_failures": self._failures,
+            "breaker_delay": self._breaker_delay,
+            "empty_response_recovery": self._recovery,
+            "unavailable_entities": sorted(self._unhealthy),
+            "pending_writes": list(self._pending_writes),
+            "optimistic": {
+                key: optimistic.value for key, optimistic in self._optimistic.items()
+            },
+            "read_plan": read_plan,
+            "data": dict(self.data),
+            "metrics": self.metrics.as_dict(),
+        }
+
+    @property
+    def gateway(self) -> ModbusGateway:
+        return self._gateway
+
     def close(self):
-        """Disconnect client."""
-        with self._lock:
+        """Disconnect client (nicht, solange weitere Hubs das Gateway nutzen)."""
+        if not self._gateway.shared_with_others(self):
             self._client.close()
+            self._gateway.close_pipeline()
 
-    def connect(self):
+    async def connect(self):
         """Connect client."""
-        with self._lock:
-            self._client.connect()
+        async with self._lock:
+            await self._async_ensure_connected()
+
+    async def async_close(self) -> None:
+        """Cancel running read/write cycles and disconnect client (on unload)."""
+        self._closed = True
+        if self._scheduler is not None:
+            self._scheduler.unregister(self)
+        if self._unsub_interval_method:
+            self._unsub_interval_method()
+            self._unsub_interval_method = None
+        if self._unsub_write_flush:
+            self._unsub_write_flush()
+            self._unsub_write_flush = None
+        for pending in self._pending_writes.values():
+            for future in pending.futures:
+                if not future.done():
+                    future.set_result(False)
+        self._pending_writes.clear()
+        for optimistic in self._optimistic.values():
+            if optimistic.unsub_timeout:
+                optimistic.unsub_timeout()
+        self._optimistic.clear()
+        if self._recovery:
+            ir.async_delete_issue(self._hass, DOMAIN, self._recovery_issue_id)
+        current = asyncio.current_task()
+        tasks = [task for task in self._tasks if task is not current]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self.close()
+        self._gateway.unregister(self)
+        if self._store is not None and self.data:
+            await self._store.async_save(self._store_data())
 
     # ---- Helper ----------------------------------------------------------
 
@@ -233,15 +1088,6 @@ class MyModbusHub:
         else:
             return 1 if bool(v) else 0
 
-    def _decode_switch(self, props: Dict[str, Any], raw: int) -> str:
-        """
-        SWITCH-Mapping -> 'off'/'on'.
-        Erlaubt {"off": 0}  oder {"off": 0, "on": 1}.
-        """
-        m: Dict[str, int] = get_entity_switch(props) or {}
-        off_v = m.get("off", 0)
-        return "off" if raw == off_v else "on"
-
     # ---- Numerische Werte ----------------------------------------------------------
     def _encode_numeric(
         self, value: float, faktor: float, min_v: float | None, max_v: float | None
@@ -259,26 +1105,6 @@ class MyModbusHub:
 
         return round(value / faktor)
 
-    def _decode_numeric(self, props: Dict[str, Any], raw: int) -> float:
-        """Rohwert -> physikalischer Wert mittels FAKTOR (raw * faktor)."""
-        # Sentinel für 'ungültig': -500
-        if raw == -500:
-            return None
-        faktor = get_entity_factor(props) or 1.0
-        value = raw * faktor
-        return float(value)
-
-    def _decode_climate(self, props: Dict[str, Any], raw: int) -> dict:
-        value = self._decode_numeric(props, raw)
-        min_value = get_entity_min(props)
-        max_value = get_entity_max(props)
-
-        return {
-            "temperature": value,
-            "target_temp_low": min_value,
-            "target_temp_high": max_value,
-        }
-
     # ---- Select Werte ----------------------------------------------------------
     def _encode_select(self, props: Dict[str, Any], value: Any) -> int:
         """Ermittle den zu schreibenden Integer aus VALUES-Mapping (Label oder Index erlaubt)."""
@@ -306,28 +1132,30 @@ class MyModbusHub:
             )
         return iv
 
-    def _decode_select(self, props: Dict[str, Any], raw: int) -> str | None:
-        """
-        Invertiere VALUES (Index->Text) zu Text
-        Unbekannte Indizes -> None.
-        """
-        values: Dict[Any, Any] = get_entity_select(props) or {}
-        return values.get(raw, f"Ungültiger Wert: {raw}")
-
     # ***************************************** SCHREIBEN **************************************************************
 
-    async def write_entity_value(self, entity_key: str, value: Any) -> None:
+    @callback
+    def write_entity_value(self, entity_key: str, value: Any) -> asyncio.Future:
         """
         Generisches Schreiben für alle beschreibbaren Entitäten.
+        Der Wert wird in die Schreib-Queue gestellt (siehe _async_queue_write), damit
+        z.B. Automationen, die mehrere Werte nacheinander setzen, in einem Batch mit
+        nur einem Refresh landen. Das zurückgegebene Future liefert True, sobald der
+        Batch erfolgreich geschrieben wurde.
         - SWITCH: akzeptiert bool / 'on'/'off'/0/1
         - SELECT (VALUES): akzeptiert Label (String) oder Index (int)
         - NUMBER/CLIMATE: beachtet FAKTOR, MIN/MAX
-        - UINT32: wird Big-Endian in zwei Registern geschrieben (REG, REG+1)
+        - UINT32: wird Big-Endian in zwei Registern geschrieben (REG, REG+1),
+          als eine Transaktion (write_registers)
         - HA (Hand-Aktiv): falls vorhanden und activate_hand=True -> 1 schreiben
         """
 
-        _LOGGER.info(f"Schreibe Entität {entity_key} -> {value}")
-        print(f"write_entity_value: {entity_key} -> {value}")
+        _LOGGER.debug("Schreibe Entität %s -> %s", entity_key, value)
+        if not self.available:
+            raise HomeAssistantError(
+                f"{self._name}: ComfoConnect PRO nicht erreichbar, "
+                f"{entity_key} wurde nicht geschrieben."
+            )
 
         # Props finden
         props = get_entity_props(entity_key)
@@ -365,50 +1193,139 @@ class MyModbusHub:
                 get_entity_max(props),
             )
 
-        if dt == ModbusTcpClient.DATATYPE.BITS:
+        if dt == C_DT_BITS:
             reg_words = (bool(raw),)
         else:
-            reg_words = self._client.convert_to_registers(value=raw, data_type=dt)
+            reg_words = self._client.convert_to_registers(
+                value=raw, data_type=AsyncModbusTcpClient.DATATYPE[dt.name]
+            )
+
+        # 2) In die Schreib-Queue stellen (Schreiben + Refresh im Batch)
+        future = self._async_queue_write(entity_key, reg, reg_words, dt)
+
+        # 3) Erwarteten Wert sofort anzeigen (nicht bei selbstrücksetzenden Coils)
+        if get_entity_poll_tier(props) != C_POLL_ON_DEMAND:
+            self._async_set_optimistic(
+                entity_key, make_entity_decoder(props)(raw), future
+            )
+        return future
+
+    # ---- Schreib-Queue ----------------------------------------------------------
 
-        # 2) Schreiben (run blocking modbus in executor)
-        await self._hass.async_add_executor_job(
-            self._write_modbus_registers, reg, reg_words, dt
+    @callback
+    def _async_queue_write(
+        self,
+        entity_key: str,
+        reg: int,
+        reg_words: Iterable[int],
+        dt: DataType,
+    ) -> asyncio.Future:
+        """
+        Schreibzugriff vormerken. Weitere Schreibzugriffe innerhalb von
+        C_WRITE_DEBOUNCE verlängern das Sammelfenster (max. C_WRITE_MAX_DELAY);
+        ein erneuter Wert für dieselbe Entität ersetzt den vorherigen.
+        """
+        future: asyncio.Future[bool] = self._hass.loop.create_future()
+        previous = self._pending_writes.get(entity_key)
+        futures = previous.futures if previous else []
+        futures.append(future)
+        self._pending_writes[entity_key] = PendingWrite(
+            reg, tuple(reg_words), dt, futures
         )
 
-        # 3) Daten neu lesen
-        _LOGGER.info("Schreibvorgang abgeschlossen. Löse Refresh-Zyklus aus.")
-        await self.async_refresh_modbus_data()
+        now = time.monotonic()
+        if self._unsub_write_flush:
+            self._unsub_write_flush()
+        else:
+            self._pending_since = now
+        delay = min(C_WRITE_DEBOUNCE, self._pending_since + C_WRITE_MAX_DELAY - now)
+        self._unsub_write_flush = async_call_later(
+            self._hass, max(delay, 0.0), self._async_flush_writes
+        )
+        return future
+
+    async def _async_flush_writes(self, _now=None) -> None:
+        """Gesammelte Schreibzugriffe senden und einmal neu lesen."""
+        self._unsub_write_flush = None
+        pending = self._pending_writes
+        self._pending_writes = {}
+        if not pending:
+            return
+
+        task = asyncio.current_task()
+        if task is not None:
+            self._tasks.add(task)
+        try:
+            # Breaker zwischenzeitlich offen: sofort verwerfen statt auf Timeouts warten
+            if not self.available:
+                return
+            for base_reg, words, dt, futures in _merge_pending_writes(pending.values()):
+                if not self.available:
+                    break
+                ok = await self._write_modbus_registers(base_reg, words, dt)
+                for future in futures:
+                    if not future.done():
+                        future.set_result(ok)
+
+            # Geschriebene und abhängige Werte einmal für den gesamten Batch lesen
+            _LOGGER.info("Schreibvorgang abgeschlossen. Lese geschriebene Werte.")
+            self._activity = True
+            if self._sensors:
+                changed = await self._async_read_keys(pending)
+                if changed is not None:
+                    changed |= self._async_confirm_optimistic(
+                        pending.keys() - self._unhealthy
+                    )
+                    self._async_dispatch(changed)
+                    self._async_update_tick()
+                    if changed:
+                        self._async_schedule_save()
+            # Adaptiver Modus: nach dem Schreiben wieder im schnellen Takt abfragen
+            if self._adaptive and self._sensors and not self._closed:
+                self._async_schedule_next(self._tick)
+        finally:
+            if task is not None:
+                self._tasks.discard(task)
+            # Abgebrochen (Entladen) bzw. nicht mehr geschrieben
+            for item in pending.values():
+                for future in item.futures:
+                    if not future.done():
+                        future.set_result(False)
+
+    async def async_write_entity_value(self, entity_key: str, value: Any) -> None:
+        """
+        Schreiben wie write_entity_value, wartet aber auf den Batch. Schlägt das
+        Schreiben fehl, erhält der Aufrufer (Service-Aufruf) einen HomeAssistantError.
+        """
+        if not await self.write_entity_value(entity_key, value):
+            raise HomeAssistantError(
+                f"{self._name}: Schreiben von {entity_key} fehlgeschlagen."
+            )
 
     async def setter_function_callback(self, entity: Entity, option):
-        await self.write_entity_value(entity.entity_description.key, option)
+        await self.async_write_entity_value(entity.entity_description.key, option)
 
     # ***************************************** LESEN **************************************************************
 
-    def read_entity_value(
-        self, buf: list[int | bool], idx: int, dt: ModbusTcpClient.DATATYPE
-    ):
-        if buf:
-            if dt == ModbusTcpClient.DATATYPE.BITS:
-                dtlen = 1
-            else:
-                dtlen = dt.value[1]
-            buflen = len(buf)
-            out_of_bounds = (idx < 0) or (idx + dtlen > buflen)
-            if out_of_bounds:
-                raise ValueError(
-                    f"Puffer hat nur {buflen} Elemente und ist damit zu klein zum Lesen von {dtlen} Elementen ab Index {idx}!!"
-                )
-            else:
-                if dt == ModbusTcpClient.DATATYPE.BITS:
-                    return buf[idx]
-                else:
-                    return self._client.convert_from_registers(
-                        registers=buf[idx : idx + dtlen], data_type=dt
-                    )
-        else:
-            raise ValueError(
-                "Puffer hat keine Elemente. Fehler in Definition const.ENTITIES_DICT!!"
-            )
+    # Registerart -> (pymodbus-Lesefunktion, Bezeichnung, Attribut der Antwort)
+    _READ_FUNCTIONS: Dict[int, Tuple[str, str, str]] = {
+        const.C_REG_TYPE_INPUT_REGISTERS: (
+            "read_input_registers",
+            "Input-Register",
+            "registers",
+        ),
+        const.C_REG_TYPE_HOLDING_REGISTERS: (
+            "read_holding_registers",
+            "Holding-Register",
+            "registers",
+        ),
+        const.C_REG_TYPE_COILS: ("read_coils", "Coils", "bits"),
+        const.C_REG_TYPE_DISCRETE_INPUTS: (
+            "read_discrete_inputs",
+            "Discrete Inputs",
+            "bits",
+        ),
+    }
 
     def _validate_modbus_response(
         self, response, reg_type_name: str, attr_name: str
@@ -425,176 +1342,314 @@ class MyModbusHub:
             )
             return False
         if not getattr(response, attr_name):
-            _LOGGER.error(f"Fehler beim Lesen der {reg_type_name}: leere Antwort.")
-            _LOGGER.error(
-                "Nach der Zeitumstellung (Sommer-/Winterzeit) muss das ComfoConnectPRO neu gestartet werden! (Stand V1.0.5)"
-            )
+            # Typisch nach der Zeitumstellung, siehe _async_record_empty_response
+            _LOGGER.debug("Fehler beim Lesen der %s: leere Antwort.", reg_type_name)
+            self._empty_response = True
             return False
         return True
 
-    def read_modbus_registers(self):
-        """Read from modbus registers"""
-
-        if C_MAX_INPUT_REGISTER >= C_MIN_INPUT_REGISTER:
-            _LOGGER.debug(
-                f"Lese Input-Register {C_MIN_INPUT_REGISTER} bis {C_MAX_INPUT_REGISTER}..."
-            )
-            modbusdata_input = self._client.read_input_registers(
-                address=C_MIN_INPUT_REGISTER,
-                count=C_MAX_INPUT_REGISTER - C_MIN_INPUT_REGISTER + 1,
-                device_id=self._hostid,
-            )
-            if not self._validate_modbus_response(
-                modbusdata_input, "Input-Register", "registers"
-            ):
-                return False
-            _LOGGER.debug(
-                f"{len(modbusdata_input.registers)} Input-Register: {modbusdata_input.registers}"
+    async def _async_read_request(self, request: ReadRequest) -> list | None:
+        """Einen Request des Read-Plans ausführen. Liefert den Puffer oder None."""
+        func_name, reg_type_name, attr_name = self._READ_FUNCTIONS[request.reg_type]
+        started = time.perf_counter()
+        response = await getattr(self._client, func_name)(
+            address=request.address,
+            count=request.count,
+            device_id=self._hostid,
+        )
+        sent, received = read_request_bytes(request.count, attr_name == "bits")
+        label = self._request_label(request)
+        self.metrics.record_request(
+            label, sent, received, (time.perf_counter() - started) * 1000
+        )
+        if not self._validate_modbus_response(response, reg_type_name, attr_name):
+            self.metrics.record_error(f"{label}: ungültige Antwort {response!r}")
+            return None
+        buf = getattr(response, attr_name)
+        if len(buf) < request.count:
+            self.metrics.record_error(f"{label}: nur {len(buf)} Elemente")
+            _LOGGER.error(
+                "Fehler beim Lesen der %s: %s statt %s Elemente ab %s.",
+                reg_type_name,
+                len(buf),
+                request.count,
+                request.address,
             )
-            input_regs = modbusdata_input.registers
-        else:
-            _LOGGER.debug("Keine Input-Register definiert.")
-            input_regs = None
+            return None
+        self._store_raw_buffer(request, buf)
+        return buf
 
-        if C_MAX_HOLDING_REGISTER >= C_MIN_HOLDING_REGISTER:
-            _LOGGER.debug(
-                f"Lese Holding-Register {C_MIN_HOLDING_REGISTER} bis {C_MAX_HOLDING_REGISTER}..."
+    def _store_raw_buffer(self, request: ReadRequest, buf: list) -> None:
+        """
+        Antwort-Puffer in raw_buffers übernehmen. Requests außerhalb des Read-Plans
+        (gezieltes Lesen) aktualisieren die überlappenden Blöcke des Read-Plans.
+        """
+        targets = self._raw_targets.get(request)
+        if targets is None:
+            # (Block, erste Adresse, Ende) der Überlappung, Ende exklusiv
+            end = request.address + request.count
+            overlaps = []
+            for block in self._catalog.read_plan:
+                block_end = block.address + block.count
+                if block.reg_type != request.reg_type:
+                    continue
+                if block.address < end and request.address < block_end:
+                    overlaps.append(
+                        (
+                            block,
+                            max(block.address, request.address),
+                            min(block_end, end),
+                        )
+                    )
+            targets = self._raw_targets[request] = tuple(overlaps)
+        for block, first, end in targets:
+            words = buf[first - request.address : end - request.address]
+            if first == block.address and end - first == block.count:
+                self.raw_buffers[block] = words
+                continue
+            current = self.raw_buffers.get(block)
+            if current is None:
+                # Block nur teilweise gelesen: ohne älteren Puffer nicht darstellbar
+                continue
+            current = list(current[: block.count])
+            current[first - block.address : end - block.address] = words
+            self.raw_buffers[block] = current
+
+    def _request_label(self, request: ReadRequest) -> str:
+        """Bezeichnung eines Requests für Kennzahlen/Fehler, z.B. 'Coils 5-8'."""
+        label = self._request_labels.get(request)
+        if label is None:
+            reg_type_name = self._READ_FUNCTIONS[request.reg_type][1]
+            last = request.address + request.count - 1
+            label = self._request_labels[request] = (
+                f"{reg_type_name} {request.address}-{last}"
             )
-            modbusdata_holding = self._client.read_holding_registers(
-                address=C_MIN_HOLDING_REGISTER,
-                count=C_MAX_HOLDING_REGISTER - C_MIN_HOLDING_REGISTER + 1,
-                device_id=self._hostid,
+        return label
+
+    async def _async_read_pipelined(
+        self, requests: list[ReadRequest]
+    ) -> list[list | None]:
+        """
+        Requests pipelined lesen (siehe pipeline.py). None je Request, der seriell
+        nachgelesen werden muss (Fehler, Timeout, leere Antwort, Verbindungsproblem).
+        """
+        pipeline = self._gateway.pipeline
+        try:
+            responses = await pipeline.async_read(requests, self._hostid)
+        except (OSError, asyncio.TimeoutError) as exc:
+            _LOGGER.debug("Pipelined Lesen nicht möglich, lese seriell: %r", exc)
+            self._gateway.close_pipeline()
+            return [None] * len(requests)
+
+        results: list[list | None] = []
+        for request, response in zip(requests, responses):
+            buf = response.buf
+            if buf is None or len(buf) < request.count:
+                results.append(None)
+                continue
+            bits = request.reg_type in (
+                const.C_REG_TYPE_COILS,
+                const.C_REG_TYPE_DISCRETE_INPUTS,
             )
-            if not self._validate_modbus_response(
-                modbusdata_holding, "Holding-Register", "registers"
-            ):
-                return False
-            _LOGGER.debug(
-                f"{len(modbusdata_holding.registers)} Holding-Register: {modbusdata_holding.registers}"
+            self.metrics.record_request(
+                self._request_label(request),
+                *read_request_bytes(request.count, bits),
+                response.duration_ms,
             )
-            holding_regs = modbusdata_holding.registers
+            self._store_raw_buffer(request, buf)
+            results.append(buf)
+        return results
+
+    async def read_modbus_registers(
+        self,
+        tiers: Iterable[str] = C_POLL_TIERS,
+        plan: Sequence[ReadRequest] | None = None,
+        blocks: Iterable[BlockDecoder] | None = None,
+    ) -> set[str] | None:
+        """
+        Read from modbus registers according to the compiled read plan, restricted to
+        the requests of the given poll tiers. plan/blocks erlauben einen abweichenden
+        (Zyklus- oder gezielten) Read-Plan mit passender Decoder-Tabelle, der dann
+        vollständig gelesen wird (Standard: Read-Plan des Katalogs).
+        Schlägt nur ein Teil der Requests fehl, werden die übrigen Blöcke dekodiert und
+        nur die Entitäten der fehlgeschlagenen Blöcke als nicht verfügbar markiert.
+        Liefert die Schlüssel der geänderten Werte (inkl. geänderter Verfügbarkeit)
+        oder None, wenn kein Request erfolgreich war.
+        """
+
+        if plan is None:
+            plan = self._catalog.read_plan
+            blocks = self._catalog.block_decoders
+            due = [
+                (index, request)
+                for index, request in enumerate(plan)
+                if request.tier in tiers
+            ]
         else:
-            _LOGGER.debug("Keine Holding-Register definiert.")
-            holding_regs = None
-
-        if C_MAX_COILS >= C_MIN_COILS:
-            _LOGGER.debug(f"Lese Coils {C_MIN_COILS} bis {C_MAX_COILS}...")
-            modbusdata_coils = self._client.read_coils(
-                address=C_MIN_COILS,
-                count=C_MAX_COILS - C_MIN_COILS + 1,
-                device_id=self._hostid,
+            due = list(enumerate(plan))
+        pipelined: list[list | None] = []
+        if self._pipelined and self._gateway.pipeline_supported and len(due) > 1:
+            pipelined = await self._async_read_pipelined(
+                [request for _, request in due]
             )
-            if not self._validate_modbus_response(
-                modbusdata_coils, "Coils", "bits"
-            ):
-                return False
-            _LOGGER.debug(
-                f"{len(modbusdata_coils.bits)} Coils: {modbusdata_coils.bits}"
+        # Im Pipeline-Modus nur noch die dort fehlgeschlagenen Requests seriell lesen
+        serial_ok = 0
+
+        buffers: Dict[int, list] = {}
+        failed: list[int] = []
+        for position, (index, request) in enumerate(due):
+            if pipelined and pipelined[position] is not None:
+                buffers[index] = pipelined[position]
+                continue
+            if failed and not self._client.connected:
+                # Verbindung verloren: restliche Requests nicht mehr versuchen
+                failed.append(index)
+                continue
+            try:
+                buf = await self._async_read_request(request)
+            except ModbusIOException as exc:
+                # Timeout eines Blocks: die übrigen Blöcke trotzdem lesen
+                self.metrics.record_error(
+                    f"{self._request_label(request)}: {exc}", timeout=True
+                )
+                buf = None
+            if buf is None:
+                failed.append(index)
+            else:
+                buffers[index] = buf
+                serial_ok += 1
+        if pipelined and serial_ok:
+            # Seriell klappt, was pipelined fehlschlug: Gateway verträgt keine
+            # parallelen Transaktionen
+            self._gateway.pipeline_supported = False
+            self._gateway.close_pipeline()
+            _LOGGER.warning(
+                "%s: Gateway beantwortet parallele Modbus-Transaktionen nicht "
+                "zuverlässig, lese wieder seriell",
+                self._name,
             )
-            coils = modbusdata_coils.bits
-        else:
-            _LOGGER.debug("Keine Coils definiert.")
-            coils = None
+        self._failed_requests = [plan[index] for index in failed]
+        if failed and not buffers:
+            return None
 
-        if C_MAX_DISCRETE_INPUTS >= C_MIN_DISCRETE_INPUTS:
-            _LOGGER.debug(
-                f"Lese Discrete Inputs {C_MIN_DISCRETE_INPUTS} bis {C_MAX_DISCRETE_INPUTS} ..."
-            )
-            modbusdata_discrete = self._client.read_discrete_inputs(
-                address=C_MIN_DISCRETE_INPUTS,
-                count=C_MAX_DISCRETE_INPUTS - C_MIN_DISCRETE_INPUTS + 1,
-                device_id=self._hostid,
+        # Gerade Schleife über die vorkompilierte Decoder-Tabelle (catalog.py),
+        # je Puffer werden alle Rohwerte in einem struct-Durchgang entpackt
+        started = time.perf_counter()
+        data = self.data
+        changed: set[str] = set()
+        unhealthy = self._unhealthy
+        for block in blocks:
+            buf = buffers.get(block.block)
+            if buf is None:
+                if block.block in failed:
+                    for slot in block.decoders:
+                        if slot.key not in unhealthy:
+                            unhealthy.add(slot.key)
+                            changed.add(slot.key)
+                continue
+            if unhealthy:
+                for slot in block.decoders:
+                    if slot.key in unhealthy:
+                        unhealthy.discard(slot.key)
+                        changed.add(slot.key)
+            raw_values = block.unpack(buf)
+            for slot, raw in zip(block.decoders, raw_values):
+                value = slot.decode(raw)
+                key = slot.key
+                if key not in data or data[key] != value:
+                    data[key] = value
+                    changed.add(key)
+
+        decode_ms = (time.perf_counter() - started) * 1000
+        self.metrics.record_decode(decode_ms)
+        # Ein kompakter Eintrag je Zyklus statt je Request/Entität; ohne aktiven
+        # Trace wird nichts formatiert
+        if _TRACE_LOGGER.isEnabledFor(logging.DEBUG):
+            _TRACE_LOGGER.debug(
+                "%s: %d Requests (%s), Dekodieren %.3f ms, geändert %s",
+                self._name,
+                len(buffers),
+                ",".join(sorted(tiers)),
+                decode_ms,
+                {key: data[key] for key in changed},
             )
-            if not self._validate_modbus_response(
-                modbusdata_discrete, "Discrete Inputs", "bits"
-            ):
-                return False
-            _LOGGER.debug(
-                f"{len(modbusdata_discrete.bits)} Discrete Inputs: {modbusdata_discrete.bits}"
-            )
-            discrete = modbusdata_discrete.bits
-        else:
-            _LOGGER.debug("Keine Discrete Inputs definiert.")
-            discrete = None
-
-        for entity_key, props in ENTITIES_DICT.items():
-            reg_type = get_entity_type(props)
-            reg, dt = get_entity_reg(props)
-            if reg is None:
-                continue  # defensiv
-            _LOGGER.debug(f"Lese Entität '{entity_key}'.")
-            match reg_type:
-                case const.C_REG_TYPE_COILS:
-                    raw = self.read_entity_value(coils, reg - C_MIN_COILS, dt)
-                case const.C_REG_TYPE_DISCRETE_INPUTS:
-                    raw = self.read_entity_value(
-                        discrete, reg - C_MIN_DISCRETE_INPUTS, dt
-                    )
-                case const.C_REG_TYPE_INPUT_REGISTERS:
-                    raw = self.read_entity_value(
-                        input_regs, reg - C_MIN_INPUT_REGISTER, dt
-                    )
-                case const.C_REG_TYPE_HOLDING_REGISTERS:
-                    raw = self.read_entity_value(
-                        holding_regs, reg - C_MIN_HOLDING_REGISTER, dt
-                    )
-
-            if is_entity_switch(props):
-                value = self._decode_switch(props, raw)
-            elif is_entity_select(props):
-                value = self._decode_select(props, raw)
-            elif is_entity_climate(props):
-                if is_entity_readonly(props):
-                    value = self._decode_numeric(props, raw)
-                else:
-                    value = self._decode_climate(props, raw)
-            else:
-                value = self._decode_numeric(props, raw)
-
-            _LOGGER.debug(f"Value: '{value}'")
-            self.data[entity_key] = value
-
-        _LOGGER.info("Lesen der Register erfolgreich abgeschlossen.")
-        return True
+        return changed
 
     # ***************************************** SCHREIBEN **************************************************************
 
-    def _write_modbus_registers(
-        self, base_reg: int, reg_values: Iterable[int], dt: ModbusTcpClient.DATATYPE
-    ):
+    async def _write_modbus_registers(
+        self,
+        base_reg: int,
+        reg_values: Iterable[int],
+        dt: DataType,
+    ) -> bool:
         """
-        Schreibt eine Sequenz 16-bit Registerwerte ab base_reg.
+        Schreibt eine Sequenz 16-bit Registerwerte (bzw. Coils) ab base_reg.
+
+        Mehrere zusammenhängende Werte gehen als eine Transaktion raus
+        (FC 0x10 write_registers bzw. FC 0x0F write_coils), damit z.B. UINT32-Werte
+        nie halb geschrieben vom nächsten Poll gelesen werden. Einzelwerte weiter
+        über FC 0x06 / 0x05.
 
         Mit int(word) & 0xFFFF: sicherstellen, dass der Wert in den gültigen Bereich passt.
         Beispiel: 70000 & 0xFFFF → 4464
                   -1 & 0xFFFF → 65535
+
+        Rückgabe: True, wenn das Gerät den Schreibzugriff bestätigt hat.
         """
-        _LOGGER.info(f"Schreibzugriff auf Register {base_reg}: {reg_values}")
+        _LOGGER.debug("Schreibzugriff auf Register %s: %s", base_reg, reg_values)
 
-        with self._lock:
-            if not self._client.connect():
-                _LOGGER.warning("Modbus connect failed")
-                return
+        bits = C_DT_BITS
+        if dt == bits:
+            values = [bool(word) for word in reg_values]
+        else:
+            values = [int(word) & 0xFFFF for word in reg_values]
+        if not values:
+            return True
+
+        async with self._lock:
+            if not await self._async_ensure_connected():
+                return False
 
+            failed = True
             try:
-                for offset, word in enumerate(reg_values):
-                    if dt == ModbusTcpClient.DATATYPE.BITS:
-                        response = self._client.write_coil(
-                            address=base_reg + offset,
-                            value=bool(word),
-                            device_id=self._hostid,
+                if dt == bits:
+                    if len(values) == 1:
+                        response = await self._client.write_coil(
+                            address=base_reg, value=values[0], device_id=self._hostid
                         )
                     else:
-                        response = self._client.write_register(
-                            address=base_reg + offset,
-                            value=int(word) & 0xFFFF,
-                            device_id=self._hostid,
-                        )
-                    if hasattr(response, "isError") and response.isError():
-                        _LOGGER.error(
-                            "Fehler beim Schreiben von Register %s: %s",
-                            base_reg + offset,
-                            response,
+                        response = await self._client.write_coils(
+                            address=base_reg, values=values, device_id=self._hostid
                         )
+                elif len(values) == 1:
+                    response = await self._client.write_register(
+                        address=base_reg, value=values[0], device_id=self._hostid
+                    )
+                else:
+                    response = await self._client.write_registers(
+                        address=base_reg, values=values, device_id=self._hostid
+                    )
+                failed = False
+                self.metrics.record_write(*write_request_bytes(len(values), dt == bits))
+                if hasattr(response, "isError") and response.isError():
+                    self.metrics.record_error(f"Schreiben {base_reg}: {response}")
+                    _LOGGER.error(
+                        "Fehler beim Schreiben von Register %s (%d Werte): %s",
+                        base_reg,
+                        len(values),
+                        response,
+                    )
+                    return False
+                return True
+            except ModbusException as exc:
+                self.metrics.record_error(
+                    f"Schreiben {base_reg}: {exc}",
+                    timeout=isinstance(exc, ModbusIOException),
+                )
+                _LOGGER.error(
+                    "Modbus-Fehler beim Schreiben von Register %s: %s", base_reg, exc
+                )
+                return False
             finally:
-                self._client.close()
+                self._release_connection(failed)
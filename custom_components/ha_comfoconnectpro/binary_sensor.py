@@ -8,7 +8,7 @@ from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.core import callback
 
 from .entity_common import HubBackedEntity, setup_platform_from_types
-from .const import BINARYSENSOR_TYPES, MyBinarySensorEntityDescription
+from .catalog import MyBinarySensorEntityDescription, get_catalog
 
 thismodule = sys.modules[__name__]
 _LOGGER = logging.getLogger(__name__)
@@ -21,7 +21,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
         hass=hass,
         entry=entry,
         async_add_entities=async_add_entities,
-        types_dict=BINARYSENSOR_TYPES,
+        types_dict=get_catalog().binary_sensor_types,
         entity_cls=MyBinarySensor,
     )
 
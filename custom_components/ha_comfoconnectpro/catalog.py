@@ -0,0 +1,549 @@
+"""
+Entitäts-Katalog: die aus ENTITIES_DICT abgeleiteten Entitätsbeschreibungen je
+Plattform, der kompilierte Read-Plan mit Decoder-Tabellen und die Werte für das
+adaptive Intervall.
+
+Wird nicht beim Import erzeugt, sondern beim ersten Aufruf von get_catalog() (Setup
+des ersten Config-Entry) und danach für alle Hubs des Prozesses wiederverwendet.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cache
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from homeassistant.components.binary_sensor import BinarySensorEntityDescription
+from homeassistant.components.climate import (
+    ClimateEntityDescription,
+    ClimateEntityFeature,
+)
+from homeassistant.components.number import NumberEntityDescription
+from homeassistant.components.select import SelectEntityDescription
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfEnergy,
+    UnitOfInformation,
+    UnitOfPower,
+    UnitOfPressure,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+
+from .const import (
+    ENTITIES_DICT,
+    C_ROOM_TEMPERATURE,
+    C_EXTRACT_TEMPERATURE,
+    C_EXHAUST_TEMPERATURE,
+    C_OUTDOOR_TEMPERATURE,
+    C_SUPPLY_TEMPERATURE,
+    C_ROOM_HUMIDITY,
+    C_EXTRACT_HUMIDITY,
+    C_EXHAUST_HUMIDITY,
+    C_OUTDOOR_HUMIDITY,
+    C_SUPPLY_HUMIDITY,
+    C_ROOM_DEW_POINT,
+    C_EXTRACT_DEW_POINT,
+    C_EXHAUST_DEW_POINT,
+    C_OUTDOOR_DEW_POINT,
+    C_SUPPLY_DEW_POINT,
+    C_ROOM_ABSOLUTE_HUMIDITY,
+    C_EXTRACT_ABSOLUTE_HUMIDITY,
+    C_EXHAUST_ABSOLUTE_HUMIDITY,
+    C_OUTDOOR_ABSOLUTE_HUMIDITY,
+    C_SUPPLY_ABSOLUTE_HUMIDITY,
+    C_METRIC_CYCLE_DURATION,
+    C_METRIC_CONNECT_DURATION,
+    C_METRIC_READ_DURATION,
+    C_METRIC_DECODE_DURATION,
+    C_METRIC_DISPATCH_DURATION,
+    C_METRIC_BYTES_TRANSFERRED,
+    C_METRIC_REQUESTS,
+    C_METRIC_ERRORS,
+    C_METRIC_TIMEOUTS,
+    C_METRIC_LAST_SUCCESS,
+    BlockDecoder,
+    EntityDecoder,
+    ReadRequest,
+    compile_block_decoders,
+    compile_decoder_table,
+    compile_read_plan,
+    compile_read_plan_slots,
+    get_entity_hvac_modes,
+    get_entity_max,
+    get_entity_min,
+    get_entity_name,
+    get_entity_reg,
+    get_entity_select_values_and_default,
+    get_entity_step,
+    get_entity_unit,
+    is_entity_climate,
+    is_entity_readonly,
+    is_entity_readwrite,
+    is_entity_select,
+    is_entity_switch,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------
+# Klassendefinitionen für die unterschiedlichen Entitätstypen
+# ------------------------------------------------------------
+
+
+@dataclass
+class MyBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """A class that describes Modbus binarysensor entities."""
+
+
+@dataclass
+class MySensorEntityDescription(SensorEntityDescription):
+    """A class that describes Modbus sensor entities."""
+
+
+@dataclass
+class DerivedSensorSpec:
+    """Links a synthetic sensor description to its two source hub keys."""
+
+    description: MySensorEntityDescription
+    temp_key: str
+    humidity_key: str
+
+
+@dataclass
+class MyBinaryEntityDescription(BinarySensorEntityDescription):
+    """A class that describes Modbus binary entities."""
+
+    # Hinweis: Falls echte Schalter-Entities verwendet werden, ggf. SwitchEntityDescription verwenden.
+
+
+@dataclass
+class MySelectEntityDescription(SelectEntityDescription):
+    """A class that describes Modbus select entities."""
+
+    default_select_option: str | None = None
+    setter_function: Callable[[Any, str], Awaitable[None]] | None = None
+
+
+@dataclass
+class MyClimateEntityDescription(ClimateEntityDescription):
+    """A class that describes Modbus climate sensor entities."""
+
+    min_value: float = None
+    max_value: float = None
+    step: float = None
+    hvac_modes: list[str] = None
+    temperature_unit: str = "°C"
+    supported_features: ClimateEntityFeature = ClimateEntityFeature.TARGET_TEMPERATURE
+
+
+@dataclass
+class MyNumberEntityDescription(NumberEntityDescription):
+    """A class that describes Modbus number entities."""
+
+    mode: str = "slider"
+    initial: float = None
+    editable: bool = True
+
+
+@dataclass(frozen=True)
+class EntityCatalog:
+    """Alle aus ENTITIES_DICT abgeleiteten Datenstrukturen (einmal je Prozess)."""
+
+    binary_sensor_types: dict[str, MyBinarySensorEntityDescription]
+    sensor_types: dict[str, MySensorEntityDescription]
+    select_types: dict[str, MySelectEntityDescription]
+    climate_types: dict[str, MyClimateEntityDescription]
+    number_types: dict[str, MyNumberEntityDescription]
+    binary_types: dict[str, MyBinaryEntityDescription]
+    dew_point_sensor_types: dict[str, DerivedSensorSpec]
+    absolute_humidity_sensor_types: dict[str, DerivedSensorSpec]
+    metric_sensor_types: dict[str, MySensorEntityDescription]
+    # Read-Plan und Position jeder Entität darin:
+    # entity_key -> (Index in read_plan, Offset im Antwort-Puffer)
+    read_plan: tuple[ReadRequest, ...]
+    read_plan_slots: dict[str, tuple[int, int]]
+    # Decoder-Tabelle für die Lese-Schleife (eine Zeile je Entität im Read-Plan),
+    # gruppiert je Antwort-Puffer für das Batch-Entpacken
+    decoder_table: tuple[EntityDecoder, ...]
+    block_decoders: tuple[BlockDecoder, ...]
+    # Adaptives Intervall: entity_key -> DELTA bzw. ACTIVE-Wert
+    adaptive_deltas: dict[str, float]
+    adaptive_active_values: dict[str, Any]
+
+
+@cache
+def get_catalog() -> EntityCatalog:
+    """Katalog beim ersten Aufruf erzeugen, danach den zwischengespeicherten liefern."""
+    return _build_catalog()
+
+
+_DEW_POINT_PAIRS = [
+    (C_ROOM_DEW_POINT, C_ROOM_TEMPERATURE, C_ROOM_HUMIDITY),
+    (C_EXTRACT_DEW_POINT, C_EXTRACT_TEMPERATURE, C_EXTRACT_HUMIDITY),
+    (C_EXHAUST_DEW_POINT, C_EXHAUST_TEMPERATURE, C_EXHAUST_HUMIDITY),
+    (C_OUTDOOR_DEW_POINT, C_OUTDOOR_TEMPERATURE, C_OUTDOOR_HUMIDITY),
+    (C_SUPPLY_DEW_POINT, C_SUPPLY_TEMPERATURE, C_SUPPLY_HUMIDITY),
+]
+
+_ABSOLUTE_HUMIDITY_PAIRS = [
+    (C_ROOM_ABSOLUTE_HUMIDITY, C_ROOM_TEMPERATURE, C_ROOM_HUMIDITY),
+    (C_EXTRACT_ABSOLUTE_HUMIDITY, C_EXTRACT_TEMPERATURE, C_EXTRACT_HUMIDITY),
+    (C_EXHAUST_ABSOLUTE_HUMIDITY, C_EXHAUST_TEMPERATURE, C_EXHAUST_HUMIDITY),
+    (C_OUTDOOR_ABSOLUTE_HUMIDITY, C_OUTDOOR_TEMPERATURE, C_OUTDOOR_HUMIDITY),
+    (C_SUPPLY_ABSOLUTE_HUMIDITY, C_SUPPLY_TEMPERATURE, C_SUPPLY_HUMIDITY),
+]
+
+
+def _derived_sensor_types(
+    pairs: list[tuple[str, str, str]],
+    unit: str,
+    device_class: SensorDeviceClass | None,
+) -> dict[str, DerivedSensorSpec]:
+    return {
+        key: DerivedSensorSpec(
+            description=MySensorEntityDescription(
+                key=key,
+                translation_key=key,
+                native_unit_of_measurement=unit,
+                device_class=device_class,
+                state_class=SensorStateClass.MEASUREMENT,
+            ),
+            temp_key=temp_key,
+            humidity_key=humidity_key,
+        )
+        for key, temp_key, humidity_key in pairs
+    }
+
+
+def _metric_description(
+    key: str,
+    unit: str | None = None,
+    device_class: SensorDeviceClass | None = None,
+    state_class: SensorStateClass | None = SensorStateClass.MEASUREMENT,
+    enabled: bool = False,
+) -> MySensorEntityDescription:
+    return MySensorEntityDescription(
+        key=key,
+        translation_key=key,
+        native_unit_of_measurement=unit,
+        device_class=device_class,
+        state_class=state_class,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=enabled,
+    )
+
+
+def _metric_sensor_types() -> dict[str, MySensorEntityDescription]:
+    """Diagnose-Sensoren: nur Fehler und letzter Erfolg sind standardmäßig aktiv."""
+    return {
+        C_METRIC_CYCLE_DURATION: _metric_description(
+            C_METRIC_CYCLE_DURATION,
+            UnitOfTime.MILLISECONDS,
+            SensorDeviceClass.DURATION,
+        ),
+        C_METRIC_CONNECT_DURATION: _metric_description(
+            C_METRIC_CONNECT_DURATION,
+            UnitOfTime.MILLISECONDS,
+            SensorDeviceClass.DURATION,
+        ),
+        C_METRIC_READ_DURATION: _metric_description(
+            C_METRIC_READ_DURATION, UnitOfTime.MILLISECONDS, SensorDeviceClass.DURATION
+        ),
+        C_METRIC_DECODE_DURATION: _metric_description(
+            C_METRIC_DECODE_DURATION,
+            UnitOfTime.MILLISECONDS,
+            SensorDeviceClass.DURATION,
+        ),
+        C_METRIC_DISPATCH_DURATION: _metric_description(
+            C_METRIC_DISPATCH_DURATION,
+            UnitOfTime.MILLISECONDS,
+            SensorDeviceClass.DURATION,
+        ),
+        C_METRIC_BYTES_TRANSFERRED: _metric_description(
+            C_METRIC_BYTES_TRANSFERRED,
+            UnitOfInformation.BYTES,
+            SensorDeviceClass.DATA_SIZE,
+            SensorStateClass.TOTAL_INCREASING,
+        ),
+        C_METRIC_REQUESTS: _metric_description(
+            C_METRIC_REQUESTS, state_class=SensorStateClass.TOTAL_INCREASING
+        ),
+        C_METRIC_ERRORS: _metric_description(
+            C_METRIC_ERRORS, state_class=SensorStateClass.TOTAL_INCREASING, enabled=True
+        ),
+        C_METRIC_TIMEOUTS: _metric_description(
+            C_METRIC_TIMEOUTS, state_class=SensorStateClass.TOTAL_INCREASING
+        ),
+        C_METRIC_LAST_SUCCESS: _metric_description(
+            C_METRIC_LAST_SUCCESS,
+            device_class=SensorDeviceClass.TIMESTAMP,
+            state_class=None,
+            enabled=True,
+        ),
+    }
+
+
+# --------------------------------------------------------------------------------
+# Hilfsfunktionen zur Erstellen der aus ENTITIES_DICT abgeleiteten Datenstrukturen
+# --------------------------------------------------------------------------------
+
+
+def _classify_register(props: Dict[str, Any]) -> type | None:
+    reg_from, dt = get_entity_reg(props)
+    if reg_from is None or dt is None:
+        return None
+
+    if is_entity_readonly(props):
+        if is_entity_switch(props):
+            """Nicht beschreibbar, Schalter (SWITCH!=None)."""
+            return MyBinarySensorEntityDescription  # C_REGISTERCLASS_BINARY_SENSOR
+        elif is_entity_select(props):
+            """Nicht beschreibbar, Auswahl (VALUES enthält mindestens ein Element)."""
+            return MySensorEntityDescription  # C_REGISTERCLASS_SELECT_ENTITY
+        else:
+            """Nicht beschreibbar, kein Schalter (SWITCH=None)."""
+            return MySensorEntityDescription  # C_REGISTERCLASS_SENSOR
+    else:
+        if is_entity_switch(props):
+            """Beschreibbar, Schalter (SWITCH!=None)."""
+            return MyBinaryEntityDescription  # C_REGISTERCLASS_BINARY_ENTITY
+        elif is_entity_select(props):
+            """Beschreibbar, Auswahl (VALUES enthält mindestens ein Element)."""
+            return MySelectEntityDescription  # C_REGISTERCLASS_SELECT_ENTITY
+        elif is_entity_climate(props):
+            """Beschreibbar, Nur Temperatureinheiten (°C oder K) zulassen"""
+            return MyClimateEntityDescription  # C_REGISTERCLASS_CLIMATE_ENTITY
+        else:
+            """Beschreibbar, kein Schalter (SWITCH=None), keine Auswahl (VALUES ist None), Einheit optional, aber nicht °C oder K."""
+            return MyNumberEntityDescription  # C_REGISTERCLASS_NUMBER_ENTITY
+
+
+def _unit_mapping(
+    unit: str | None,
+) -> tuple[str | None, SensorDeviceClass | None, SensorStateClass | None]:
+    """
+    Mappt unsere Einheit (UNIT) auf Home-Assistant native_unit_of_measurement + device_class + state_class.
+    Für unbekannte Einheiten bleiben Klassen leer.
+    """
+    if unit is None:
+        return None, None, None
+
+    u = unit.strip()
+    # Temperatur
+    if u == "°C":
+        return (
+            UnitOfTemperature.CELSIUS,
+            SensorDeviceClass.TEMPERATURE,
+            SensorStateClass.MEASUREMENT,
+        )
+    if u == "K":
+        # Selten als absolute Temperatur; hier i. d. R. Offsets -> als °C nicht sinnvoll.
+        return (
+            UnitOfTemperature.KELVIN,
+            SensorDeviceClass.TEMPERATURE,
+            SensorStateClass.MEASUREMENT,
+        )
+
+    # Druck
+    if u.lower() in {"bar"}:
+        return (
+            UnitOfPressure.BAR,
+            SensorDeviceClass.PRESSURE,
+            SensorStateClass.MEASUREMENT,
+        )
+
+    # Energie & Leistung
+    if u.lower() in {"kwh", "kW/h".lower()}:  # akzeptiere beide Schreibweisen
+        return (
+            UnitOfEnergy.KILO_WATT_HOUR,
+            SensorDeviceClass.ENERGY,
+            SensorStateClass.TOTAL_INCREASING,
+        )
+    if u.lower() in {"w"}:
+        return UnitOfPower.WATT, SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT
+    if u.lower() in {"kw"}:
+        return (
+            UnitOfPower.KILO_WATT,
+            SensorDeviceClass.POWER,
+            SensorStateClass.MEASUREMENT,
+        )
+
+    # Volumenstrom
+    if u.lower() in {"l/min", "l/Min", "l pro min"}:
+        return "l/min", None, SensorStateClass.MEASUREMENT
+    if u.lower() in {"m³/h"}:
+        return "m³/h", None, SensorStateClass.MEASUREMENT
+
+    # Drehzahl / Stellgrad
+    if u == "‰":
+        return "‰", None, SensorStateClass.MEASUREMENT
+    if u == "%":
+        return "%", None, SensorStateClass.MEASUREMENT
+
+    # PPM, Anteil
+    if u == "ppm":
+        return "ppm", None, SensorStateClass.MEASUREMENT
+
+    # Zeit/Dauer
+    if u.lower() in {"h", "std"}:
+        return "h", SensorDeviceClass.DURATION, SensorStateClass.TOTAL_INCREASING
+    if u.lower() in {"min"}:
+        return "min", SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT
+    if u.lower() in {"s", "sek", "sec"}:
+        return "s", SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT
+
+    # Restdauer
+    if u.lower() in {"d", "days"}:
+        return "d", SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT
+
+    # Fallback: nutze Roh-Einheit ohne Device-Class
+    return u, None, SensorStateClass.MEASUREMENT
+
+
+def _build_catalog() -> EntityCatalog:
+    started = time.perf_counter()
+    binary_sensor_types: dict[str, MyBinarySensorEntityDescription] = {}
+    sensor_types: dict[str, MySensorEntityDescription] = {}
+    select_types: dict[str, MySelectEntityDescription] = {}
+    climate_types: dict[str, MyClimateEntityDescription] = {
+        "ventilation_climate": MyClimateEntityDescription(
+            key="ventilation_climate",
+            name="Climate",
+            translation_key="ventilation_climate",
+            supported_features=(
+                ClimateEntityFeature.PRESET_MODE
+                | ClimateEntityFeature.TARGET_TEMPERATURE
+            ),
+        )
+    }
+    number_types: dict[str, MyNumberEntityDescription] = {}
+    binary_types: dict[str, MyBinaryEntityDescription] = {}
+
+    for entity_key, props in ENTITIES_DICT.items():
+        name: str = get_entity_name(props, entity_key)
+        registerclass = _classify_register(props)
+
+        if registerclass is MySensorEntityDescription:
+            unit, device_class, state_class = _unit_mapping(get_entity_unit(props))
+            sensor_types[entity_key] = registerclass(
+                name=name,
+                key=entity_key,
+                translation_key=entity_key,
+                native_unit_of_measurement=unit,
+                device_class=device_class,
+                state_class=state_class,
+            )
+        elif registerclass is MyBinarySensorEntityDescription:
+            binary_sensor_types[entity_key] = registerclass(
+                name=name,
+                key=entity_key,
+                translation_key=entity_key,
+            )
+        elif registerclass is MyClimateEntityDescription:
+            climate_types[entity_key] = registerclass(
+                name=name,
+                key=entity_key,
+                translation_key=entity_key,
+                min_value=get_entity_min(props),
+                max_value=get_entity_max(props),
+                step=get_entity_step(props),
+                hvac_modes=get_entity_hvac_modes(props),
+                temperature_unit=get_entity_unit(props),
+                supported_features=props.get(
+                    "FEATURES", ClimateEntityFeature.TARGET_TEMPERATURE
+                ),
+            )
+        elif registerclass is MyNumberEntityDescription:
+            number_types[entity_key] = registerclass(
+                name=name,
+                key=entity_key,
+                translation_key=entity_key,
+                min_value=get_entity_min(props),
+                max_value=get_entity_max(props),
+                step=get_entity_step(props),
+                unit_of_measurement=get_entity_unit(props),
+                editable=is_entity_readwrite(props),
+                mode="box",
+            )
+        elif registerclass is MyBinaryEntityDescription:
+            binary_types[entity_key] = registerclass(
+                name=name,
+                key=entity_key,
+                translation_key=entity_key,
+            )
+        elif registerclass is MySelectEntityDescription:
+            values, default = get_entity_select_values_and_default(props)
+            select_types[entity_key] = registerclass(
+                name=name,
+                key=entity_key,
+                translation_key=entity_key,
+                options=values,
+                default_select_option=default,
+            )
+        else:
+            _LOGGER.warning("Unbekannter Entitätstyp %s: %s", entity_key, props)
+
+    read_plan = tuple(compile_read_plan())
+    read_plan_slots = compile_read_plan_slots(list(read_plan))
+    decoder_table = compile_decoder_table(read_plan_slots)
+    catalog = EntityCatalog(
+        binary_sensor_types=binary_sensor_types,
+        sensor_types=sensor_types,
+        select_types=select_types,
+        climate_types=climate_types,
+        number_types=number_types,
+        binary_types=binary_types,
+        dew_point_sensor_types=_derived_sensor_types(
+            _DEW_POINT_PAIRS, UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE
+        ),
+        absolute_humidity_sensor_types=_derived_sensor_types(
+            _ABSOLUTE_HUMIDITY_PAIRS, "g/m³", None
+        ),
+        metric_sensor_types=_metric_sensor_types(),
+        read_plan=read_plan,
+        read_plan_slots=read_plan_slots,
+        decoder_table=decoder_table,
+        block_decoders=compile_block_decoders(decoder_table),
+        adaptive_deltas={
+            key: props["DELTA"]
+            for key, props in ENTITIES_DICT.items()
+            if "DELTA" in props
+        },
+        adaptive_active_values={
+            key: props["ACTIVE"]
+            for key, props in ENTITIES_DICT.items()
+            if "ACTIVE" in props
+        },
+    )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        for request in read_plan:
+            _LOGGER.debug(
+                "Read-Plan (%s): Registerart %s, %s ab %s",
+                request.tier,
+                request.reg_type,
+                request.count,
+                request.address,
+            )
+        _LOGGER.debug(
+            "Katalog in %.1f ms erstellt: %d Sensoren, %d Binär-Sensoren, "
+            "%d Auswahl-Entitäten, %d Schalter, %d Temperatur-Stellwerte, "
+            "%d Numerische Stellwerte",
+            (time.perf_counter() - started) * 1000,
+            len(sensor_types),
+            len(binary_sensor_types),
+            len(select_types),
+            len(binary_types),
+            len(climate_types),
+            len(number_types),
+        )
+    return catalog
@@ -25,9 +25,8 @@ from .const import (
     C_TEMPERATURE_PROFILE,
     C_TEMPERATURE_PROFILE_MODE,
     C_VENTILATION_PRESET,
-    CLIMATE_TYPES,
-    MyClimateEntityDescription,
 )
+from .catalog import MyClimateEntityDescription, get_catalog
 from .entity_common import HubBackedEntity, setup_platform_from_types
 
 thismodule = sys.modules[__name__]
@@ -41,7 +40,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
         hass=hass,
         entry=entry,
         async_add_entities=async_add_entities,
-        types_dict=CLIMATE_TYPES,
+        types_dict=get_catalog().climate_types,
         entity_cls=MyClimate,
     )
 
@@ -79,30 +78,41 @@ class MyClimate(HubBackedEntity, ClimateEntity):
         self._attr_max_temp = 29.0
         self._attr_target_temperature_step = 0.1
 
+    @property
+    def _hub_keys(self) -> tuple[str, ...]:
+        return (
+            C_SUPPLY_TEMPERATURE,
+            C_SUPPLY_HUMIDITY,
+            C_STANDBY,
+            C_TEMPERATURE_PROFILE,
+            C_VENTILATION_PRESET,
+            C_EXTERNAL_SETPOINT,
+        )
+
     @callback
     def _on_hub_update(self) -> None:
-        supply_temp = self._hub.data.get(C_SUPPLY_TEMPERATURE)
+        supply_temp = self._hub_value(C_SUPPLY_TEMPERATURE)
         if supply_temp is not None:
             self._attr_current_temperature = float(supply_temp)
 
-        supply_hum = self._hub.data.get(C_SUPPLY_HUMIDITY)
+        supply_hum = self._hub_value(C_SUPPLY_HUMIDITY)
         if supply_hum is not None:
             self._attr_current_humidity = int(supply_hum)
 
-        if self._hub.data.get(C_STANDBY) == "on":
+        if self._hub_value(C_STANDBY) == "on":
             self._attr_hvac_action = HVACAction.IDLE
         else:
-            profile = self._hub.data.get(C_TEMPERATURE_PROFILE)
+            profile = self._hub_value(C_TEMPERATURE_PROFILE)
             if profile is not None:
                 self._attr_hvac_action = self._PROFILE_TO_ACTION.get(
                     profile, HVACAction.FAN
                 )
 
-        preset = self._hub.data.get(C_VENTILATION_PRESET)
+        preset = self._hub_value(C_VENTILATION_PRESET)
         if preset is not None:
             self._attr_preset_mode = self._DEVICE_TO_PRESET.get(preset, PRESET_HOME)
 
-        setpoint = self._hub.data.get(C_EXTERNAL_SETPOINT)
+        setpoint = self._hub_value(C_EXTERNAL_SETPOINT)
         if setpoint is not None:
             self._attr_target_temperature = float(setpoint)
 
@@ -113,12 +123,11 @@ class MyClimate(HubBackedEntity, ClimateEntity):
         temp = kwargs.get(ATTR_TEMPERATURE)
         if temp is None:
             return
-        if self._hub.data.get(C_TEMPERATURE_PROFILE_MODE) == "adaptive":
+        if self._hub_value(C_TEMPERATURE_PROFILE_MODE) == "adaptive":
             return
-        await self._hub.write_entity_value(C_EXTERNAL_SETPOINT, temp)
+        await self._hub.async_write_entity_value(C_EXTERNAL_SETPOINT, temp)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set ventilation preset."""
-        self._attr_preset_mode = preset_mode
         device_value = self._PRESET_TO_DEVICE.get(preset_mode, "medium")
-        await self._hub.write_entity_value(C_VENTILATION_PRESET, device_value)
+        await self._hub.async_write_entity_value(C_VENTILATION_PRESET, device_value)
@@ -24,8 +24,20 @@ from .const import (
     DEFAULT_NAME,
     DEFAULT_PORT,
     DEFAULT_HOSTID,
+    DEFAULT_PERSISTENT_CONNECTION,
     DEFAULT_SCAN_INTERVAL,
     CONF_HOSTID,
+    CONF_PERSISTENT_CONNECTION,
+    CONF_FAST_SCAN_INTERVAL,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    CONF_ADAPTIVE_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    DEFAULT_ADAPTIVE_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    CONF_PIPELINED_READS,
+    DEFAULT_PIPELINED_READS,
 )
 
 import sys
@@ -41,7 +53,11 @@ DATA_SCHEMA = vol.Schema(
         vol.Required(CONF_HOST): cv.string,
         vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.port,
         vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
+        vol.Optional(CONF_FAST_SCAN_INTERVAL, default=DEFAULT_FAST_SCAN_INTERVAL): int,
         vol.Optional(CONF_HOSTID, default=DEFAULT_HOSTID): int,
+        vol.Optional(
+            CONF_PERSISTENT_CONNECTION, default=DEFAULT_PERSISTENT_CONNECTION
+        ): bool,
     }
 )
 
@@ -57,14 +73,19 @@ def host_valid(host):
 
 
 @callback
-def ha_my_modbus_entries(hass: HomeAssistant):
-    """Return the hosts already configured."""
-    hosts = set()
+def ha_my_modbus_entries(hass: HomeAssistant, exclude_entry_id: str | None = None):
+    """Return the (host, hostid) pairs already configured (ohne exclude_entry_id)."""
+    devices = set()
     for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.entry_id == exclude_entry_id:
+            continue
         host = entry.options.get(CONF_HOST, entry.data.get(CONF_HOST))
+        hostid = entry.options.get(
+            CONF_HOSTID, entry.data.get(CONF_HOSTID, DEFAULT_HOSTID)
+        )
         if host:
-            hosts.add(host)
-    return hosts
+            devices.add((host, int(hostid)))
+    return devices
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -74,9 +95,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
 
-    def _host_in_configuration_exists(self, host) -> bool:
-        """Return True if host exists in configuration."""
-        if host in ha_my_modbus_entries(self.hass):
+    def _host_in_configuration_exists(self, host, hostid) -> bool:
+        """
+        Return True if the device (host + Modbus-Geräte-ID) exists in configuration.
+        Mehrere Geräte-IDs hinter einem Gateway teilen sich eine Verbindung.
+        """
+        if (host, int(hostid)) in ha_my_modbus_entries(self.hass):
             return True
         return False
 
@@ -86,13 +110,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             host = user_input[CONF_HOST]
+            hostid = user_input.get(CONF_HOSTID, DEFAULT_HOSTID)
 
-            if self._host_in_configuration_exists(host):
+            if self._host_in_configuration_exists(host, hostid):
                 errors[CONF_HOST] = "already_configured"
             elif not host_valid(user_input[CONF_HOST]):
-                errors[CONF_HOST] = "invalid host IP"
+                errors[CONF_HOST] = "invalid_host"
             else:
-                await self.async_set_unique_id(user_input[CONF_HOST])
+                await self.async_set_unique_id(f"{host}_{hostid}")
                 self._abort_if_unique_id_configured()
                 return self.async_create_entry(
                     title=user_input[CONF_NAME], data=user_input
@@ -119,13 +144,29 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        errors = {}
 
         if user_input is not None:
             user_input.pop(CONF_NAME, None)
-            return self.async_create_entry(title="", data=user_input)
+            host = user_input[CONF_HOST]
+            hostid = int(user_input.get(CONF_HOSTID, DEFAULT_HOSTID))
+            entry = self._config_entry
+            # Geänderte Adresse darf kein anderes Gerät (host, Geräte-ID) treffen
+            if (host, hostid) in ha_my_modbus_entries(self.hass, entry.entry_id):
+                errors[CONF_HOSTID] = "already_configured"
+            elif not host_valid(host):
+                errors[CONF_HOST] = "invalid_host"
+            else:
+                unique_id = f"{host}_{hostid}"
+                if entry.unique_id != unique_id:
+                    self.hass.config_entries.async_update_entry(
+                        entry, unique_id=unique_id
+                    )
+                return self.async_create_entry(title="", data=user_input)
 
         return self.async_show_form(
             step_id="init",
+            errors=errors,
             data_schema=vol.Schema(
                 {
                     vol.Required(
@@ -150,6 +191,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             ),
                         ),
                     ): vol.Coerce(int),
+                    vol.Optional(
+                        CONF_FAST_SCAN_INTERVAL,
+                        default=self._config_entry.options.get(
+                            CONF_FAST_SCAN_INTERVAL,
+                            self._config_entry.data.get(
+                                CONF_FAST_SCAN_INTERVAL, DEFAULT_FAST_SCAN_INTERVAL
+                            ),
+                        ),
+                    ): vol.Coerce(int),
                     vol.Optional(
                         CONF_HOSTID,
                         default=self._config_entry.options.get(
@@ -157,6 +207,41 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             self._config_entry.data.get(CONF_HOSTID, DEFAULT_HOSTID),
                         ),
                     ): vol.Coerce(int),
+                    vol.Optional(
+                        CONF_PERSISTENT_CONNECTION,
+                        default=self._config_entry.options.get(
+                            CONF_PERSISTENT_CONNECTION,
+                            self._config_entry.data.get(
+                                CONF_PERSISTENT_CONNECTION,
+                                DEFAULT_PERSISTENT_CONNECTION,
+                            ),
+                        ),
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_ADAPTIVE_SCAN_INTERVAL,
+                        default=self._config_entry.options.get(
+                            CONF_ADAPTIVE_SCAN_INTERVAL,
+                            DEFAULT_ADAPTIVE_SCAN_INTERVAL,
+                        ),
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_MIN_SCAN_INTERVAL,
+                        default=self._config_entry.options.get(
+                            CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+                    vol.Optional(
+                        CONF_MAX_SCAN_INTERVAL,
+                        default=self._config_entry.options.get(
+                            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+                    vol.Optional(
+                        CONF_PIPELINED_READS,
+                        default=self._config_entry.options.get(
+                            CONF_PIPELINED_READS, DEFAULT_PIPELINED_READS
+                        ),
+                    ): cv.boolean,
                 }
             ),
         )
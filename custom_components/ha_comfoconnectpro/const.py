@@ -1,49 +1,23 @@
-"""Constants for the integration."""
+"""
+Constants for the integration.
+
+Reine Konstanten und Hilfsfunktionen, ohne Entitäts-Plattformen oder pymodbus und ohne
+Arbeit beim Import. Die daraus abgeleiteten Entitätsbeschreibungen und der Read-Plan
+entstehen erst beim ersten Setup in catalog.py.
+"""
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Callable, Awaitable
+from enum import Enum
+from functools import lru_cache, partial
+import struct
+from typing import Dict, Any, Callable, Iterable
 
 import sys
 
-from homeassistant.components.climate import (
-    ClimateEntityDescription,
-    ClimateEntityFeature,
-)
-from homeassistant.components.select import SelectEntityDescription
-from homeassistant.components.sensor import (
-    SensorDeviceClass,
-    SensorEntity,
-    SensorEntityDescription,
-    SensorStateClass,
-)
-from homeassistant.components.binary_sensor import (
-    BinarySensorDeviceClass,
-    BinarySensorEntity,
-    BinarySensorEntityDescription,
-)
-from homeassistant.components.number import (
-    NumberEntity,
-    NumberEntityDescription,
-    NumberDeviceClass,
-)
-from homeassistant.const import (
-    UnitOfPressure,
-    UnitOfTemperature,
-    UnitOfEnergy,
-    UnitOfPower,
-    CONF_NAME,
-    Platform,
-)
-
-from pymodbus.client import ModbusTcpClient
-
-import logging
-
-thismodule = sys.modules[__name__]
-_LOGGER = logging.getLogger(__name__)
-_LOGGER.info(f"{thismodule} loaded")
+from homeassistant.const import Platform
 
 
 DOMAIN = "ha_comfoconnectpro"
@@ -51,10 +25,55 @@ DEFAULT_NAME = "ComfoConnect PRO"
 DEFAULT_SCAN_INTERVAL = 15
 DEFAULT_PORT = 502
 DEFAULT_HOSTID = 1
+DEFAULT_PERSISTENT_CONNECTION = True
+DEFAULT_FAST_SCAN_INTERVAL = DEFAULT_SCAN_INTERVAL
 CONF_HOSTID = "hostid"
+CONF_PERSISTENT_CONNECTION = "persistent_connection"
+CONF_FAST_SCAN_INTERVAL = "fast_scan_interval"
+CONF_ADAPTIVE_SCAN_INTERVAL = "adaptive_scan_interval"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_PIPELINED_READS = "pipelined_reads"
+DEFAULT_ADAPTIVE_SCAN_INTERVAL = False
+DEFAULT_MIN_SCAN_INTERVAL = 5
+DEFAULT_MAX_SCAN_INTERVAL = 60
+# Lese-Requests eines Zyklus ohne Warten auf die Antworten senden (pipeline.py)
+DEFAULT_PIPELINED_READS = False
+# Adaptives Intervall: Faktor, um den das Intervall bei stabilen Werten wächst
+C_ADAPTIVE_BACKOFF_FACTOR = 1.5
 CONF_HUB = "hacomfoconnectpro_hub"
 ATTR_MANUFACTURER = "Zehnder"
 
+# Circuit Breaker: nach C_BREAKER_THRESHOLD Fehlschlägen in Folge (Verbindung, Lesen,
+# Schreiben) wird nicht mehr abgefragt, bis die Wartezeit (exponentiell zwischen MIN
+# und MAX Sekunden, ± JITTER) abgelaufen ist; dann entscheidet ein einzelner
+# Probe-Request (half-open), ob wieder regulär gelesen wird
+C_BREAKER_THRESHOLD = 3
+C_BREAKER_DELAY_MIN = 10.0
+C_BREAKER_DELAY_MAX = 300.0
+C_BREAKER_JITTER = 0.2
+# Nach der Zeitumstellung liefert das ComfoConnect PRO trotz Verbindung nur leere
+# Antworten (bis zum Neustart, Stand V1.0.5): ab C_RECOVERY_THRESHOLD solcher Zyklen in
+# Folge wird nur noch alle C_RECOVERY_PROBE_INTERVAL Sekunden mit einem kleinen Request
+# geprüft und ein Repair-Issue angezeigt
+C_RECOVERY_THRESHOLD = 2
+C_RECOVERY_PROBE_INTERVAL = 120.0
+ISSUE_EMPTY_RESPONSES = "empty_responses"
+# Gemeinsamer Poll-Scheduler aller Config-Entries (Schlüssel in hass.data[DOMAIN]):
+# max. C_FLEET_MAX_CONCURRENT Hubs lesen gleichzeitig, die Zyklen werden gestaffelt
+C_FLEET_SCHEDULER = "_fleet_scheduler"
+C_FLEET_MAX_CONCURRENT = 2
+# Gemeinsame Verbindungen je Gateway (host, port) -> ModbusGateway in hass.data[DOMAIN]
+C_GATEWAYS = "_gateways"
+# Zuletzt bekannter Zustand (hub.data, Rohpuffer) im HA-Storage, je Config-Entry;
+# gespeichert gebündelt spätestens C_STORE_SAVE_DELAY Sekunden nach einer Änderung
+STORAGE_VERSION = 1
+C_STORE_SAVE_DELAY = 60
+# TCP-Keep-Alive für die persistente Verbindung (Sekunden)
+C_KEEPALIVE_IDLE = 30
+C_KEEPALIVE_INTERVAL = 10
+C_KEEPALIVE_COUNT = 3
+
 
 # ------------------------------------------------------------
 # 1) Error-Konstanten (C_<NAME> = "<error_num>")
@@ -197,23 +216,49 @@ ERROR_DICT: Dict[str, Any] = {
 
 # --- Konstanten ---
 
+
+class DataType(Enum):
+    """
+    Datentyp eines Registers: (struct-Formatzeichen, Anzahl Register). Namen und Werte
+    entsprechen ModbusClientMixin.DATATYPE von pymodbus (Umsetzung beim Schreiben).
+    """
+
+    BITS = ("bits", 0)
+    INT16 = ("h", 1)
+    UINT16 = ("H", 1)
+    INT32 = ("i", 2)
+    UINT32 = ("I", 2)
+
+
 # Datentyp für coils oder discrete_inputs
-C_DT_BITS = ModbusTcpClient.DATATYPE.BITS  # "bit"     # 1 Bit
+C_DT_BITS = DataType.BITS  # "bit"     # 1 Bit
 
 # Datentypen für input_registers or holding_registers
-C_DT_INT16 = ModbusTcpClient.DATATYPE.INT16  # "INT16"     # 1 Register
-C_DT_UINT16 = ModbusTcpClient.DATATYPE.UINT16  # "UINT16"   # 1 Register
-C_DT_INT32 = ModbusTcpClient.DATATYPE.INT32  # "INT32"   # 2 Register
-C_DT_UINT32 = ModbusTcpClient.DATATYPE.UINT32  # "UINT32"   # 2 Register
-
-C_MIN_INPUT_REGISTER = sys.maxsize
-C_MAX_INPUT_REGISTER = -1
-C_MIN_HOLDING_REGISTER = sys.maxsize
-C_MAX_HOLDING_REGISTER = -1
-C_MIN_COILS = sys.maxsize
-C_MAX_COILS = -1
-C_MIN_DISCRETE_INPUTS = sys.maxsize
-C_MAX_DISCRETE_INPUTS = -1
+C_DT_INT16 = DataType.INT16  # "INT16"     # 1 Register
+C_DT_UINT16 = DataType.UINT16  # "UINT16"   # 1 Register
+C_DT_INT32 = DataType.INT32  # "INT32"   # 2 Register
+C_DT_UINT32 = DataType.UINT32  # "UINT32"   # 2 Register
+
+# Read-Plan: Obergrenzen je Lese-Request (Modbus-PDU max. 125 Register / 2000 Bits)
+C_MAX_READ_REGISTERS = 125
+C_MAX_READ_BITS = 2000
+# Lücken bis zu dieser Größe werden mitgelesen, da dies günstiger ist als ein
+# zusätzlicher Request (Round-Trip). Größere Lücken trennen den Request auf.
+C_MAX_READ_GAP_REGISTERS = 16
+C_MAX_READ_GAP_BITS = 256
+
+# Schreib-Queue: Schreibzugriffe werden C_WRITE_DEBOUNCE Sekunden gesammelt
+# (je Entität gewinnt der letzte Wert), spätestens nach C_WRITE_MAX_DELAY gesendet.
+# Zusammenhängende Register gehen als ein Request raus (PDU max. 123 Register / 1968 Bits).
+C_WRITE_DEBOUNCE = 0.25
+C_WRITE_MAX_DELAY = 1.0
+C_MAX_WRITE_REGISTERS = 123
+C_MAX_WRITE_BITS = 1968
+# Optimistischer Zustand: spätestens nach dieser Zeit (s) muss ein geschriebener Wert
+# gelesen und bestätigt sein, sonst wird auf den Gerätewert zurückgesetzt
+C_OPTIMISTIC_TIMEOUT = 15.0
+# Event bei Rücknahme eines optimistischen Werts
+EVENT_WRITE_REVERTED = f"{DOMAIN}_write_reverted"
 
 # Konstanten zur Definition der Registerart
 C_REG_TYPE_UNKNOWN = 0
@@ -222,6 +267,22 @@ C_REG_TYPE_DISCRETE_INPUTS = 2
 C_REG_TYPE_HOLDING_REGISTERS = 3
 C_REG_TYPE_INPUT_REGISTERS = 4
 
+# Abfrage-Stufen (Attribut "POLL" in ENTITIES_DICT)
+C_POLL_FAST = "fast"  # in jedem Zyklus (Intervall CONF_FAST_SCAN_INTERVAL)
+C_POLL_NORMAL = "normal"  # alle CONF_SCAN_INTERVAL Sekunden (Standard)
+C_POLL_SLOW = "slow"  # alle C_POLL_SLOW_INTERVAL Sekunden
+C_POLL_ON_DEMAND = "on_demand"  # nur beim ersten Lesen und nach Schreibzugriffen
+C_POLL_TIERS = (C_POLL_FAST, C_POLL_NORMAL, C_POLL_SLOW, C_POLL_ON_DEMAND)
+C_POLL_SLOW_INTERVAL = 300
+
+# Reihenfolge, in der die Registerarten gelesen werden
+C_READ_ORDER = (
+    C_REG_TYPE_INPUT_REGISTERS,
+    C_REG_TYPE_HOLDING_REGISTERS,
+    C_REG_TYPE_COILS,
+    C_REG_TYPE_DISCRETE_INPUTS,
+)
+
 # ------------------------------------------------------------
 # 2) Entity-Konstanten (C_<NAME> = "<entity_key>")
 #    >> Diese Konstanten dienen als Keys im ENTITIES_DICT.
@@ -256,6 +317,20 @@ C_EXHAUST_ABSOLUTE_HUMIDITY = "exhaust_absolute_humidity"
 C_OUTDOOR_ABSOLUTE_HUMIDITY = "outdoor_absolute_humidity"
 C_SUPPLY_ABSOLUTE_HUMIDITY = "supply_absolute_humidity"
 
+# Diagnose-Sensoren (Kennzahlen des Hubs, siehe metrics.py)
+# Listener-Schlüssel, unter dem der Hub nach jedem Zyklus die Kennzahlen meldet
+C_HUB_METRICS = "hub_metrics"
+C_METRIC_CYCLE_DURATION = "metric_cycle_duration"
+C_METRIC_CONNECT_DURATION = "metric_connect_duration"
+C_METRIC_READ_DURATION = "metric_read_duration"
+C_METRIC_DECODE_DURATION = "metric_decode_duration"
+C_METRIC_DISPATCH_DURATION = "metric_dispatch_duration"
+C_METRIC_BYTES_TRANSFERRED = "metric_bytes_transferred"
+C_METRIC_REQUESTS = "metric_requests"
+C_METRIC_ERRORS = "metric_errors"
+C_METRIC_TIMEOUTS = "metric_timeouts"
+C_METRIC_LAST_SUCCESS = "metric_last_success"
+
 C_CO2_SENSOR_ZONE_1 = "co2_sensor_zone_1"
 C_CO2_SENSOR_ZONE_2 = "co2_sensor_zone_2"
 C_CO2_SENSOR_ZONE_3 = "co2_sensor_zone_3"
@@ -308,6 +383,11 @@ C_COMFOCOOL = "comfocool"
 #    INC: 1, wenn Entität stetig steigende Werte liefert.
 #    SWITCH: Werte für "aus" und optional für "ein". Wenn "ein" nicht angegeben ist, sind alle anderen ganzahligen Werte "ein" gültig
 #    PF: Anzeige-Variante in HA übersteuern. "PF":Platform.NUMBER v=> Temperaturwert wird nicht als CLIMATE, sondern als NUMBER behandelt.
+#    POLL: Abfrage-Stufe C_POLL_FAST, C_POLL_NORMAL (Standard), C_POLL_SLOW oder C_POLL_ON_DEMAND
+#    DELTA: Adaptives Intervall: Änderung je Zyklus, ab der der Wert als "in Bewegung" gilt
+#    ACTIVE: Adaptives Intervall: Wert in hub.data, bei dem schnell abgefragt wird (z.B. "on")
+#    AFFECTS: Entitäten, deren Wert sich durch Schreiben dieser Entität ändern kann
+#             (werden beim Lesen nach dem Schreiben mitgelesen)
 #
 #    *: Obligatorischer Wert
 # --------------------------------------------------------------------------------------------
@@ -331,6 +411,7 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
             50: "no_unit_detected",
         },
         "DT": C_DT_UINT16,
+        "POLL": C_POLL_SLOW,
     },
     C_ACTIVEERROR1: {
         "RT": C_REG_TYPE_INPUT_REGISTERS,
@@ -381,6 +462,8 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "FAKTOR": 0.1,
         "UNIT": "°C",
         "DT": C_DT_INT16,
+        "POLL": C_POLL_FAST,
+        "DELTA": 0.5,
     },
     C_EXTRACT_TEMPERATURE: {
         "RT": C_REG_TYPE_INPUT_REGISTERS,
@@ -389,6 +472,8 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "FAKTOR": 0.1,
         "UNIT": "°C",
         "DT": C_DT_INT16,
+        "POLL": C_POLL_FAST,
+        "DELTA": 0.5,
     },
     C_EXHAUST_TEMPERATURE: {
         "RT": C_REG_TYPE_INPUT_REGISTERS,
@@ -397,6 +482,8 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "FAKTOR": 0.1,
         "UNIT": "°C",
         "DT": C_DT_INT16,
+        "POLL": C_POLL_FAST,
+        "DELTA": 0.5,
     },
     C_OUTDOOR_TEMPERATURE: {
         "RT": C_REG_TYPE_INPUT_REGISTERS,
@@ -405,6 +492,8 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "FAKTOR": 0.1,
         "UNIT": "°C",
         "DT": C_DT_INT16,
+        "POLL": C_POLL_FAST,
+        "DELTA": 0.5,
     },
     C_SUPPLY_TEMPERATURE: {
         "RT": C_REG_TYPE_INPUT_REGISTERS,
@@ -413,6 +502,8 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "FAKTOR": 0.1,
         "UNIT": "°C",
         "DT": C_DT_INT16,
+        "POLL": C_POLL_FAST,
+        "DELTA": 0.5,
     },
     C_ROOM_HUMIDITY: {
         "RT": C_REG_TYPE_INPUT_REGISTERS,
@@ -455,6 +546,8 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "NAME": "CO2 Sensor Zone 1",
         "UNIT": "ppm",
         "DT": C_DT_UINT16,
+        "POLL": C_POLL_FAST,
+        "DELTA": 20,
     },
     C_CO2_SENSOR_ZONE_2: {
         "RT": C_REG_TYPE_INPUT_REGISTERS,
@@ -462,6 +555,8 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "NAME": "CO2 Sensor Zone 2",
         "UNIT": "ppm",
         "DT": C_DT_UINT16,
+        "POLL": C_POLL_FAST,
+        "DELTA": 20,
     },
     C_CO2_SENSOR_ZONE_3: {
         "RT": C_REG_TYPE_INPUT_REGISTERS,
@@ -469,6 +564,8 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "NAME": "CO2 Sensor Zone 3",
         "UNIT": "ppm",
         "DT": C_DT_UINT16,
+        "POLL": C_POLL_FAST,
+        "DELTA": 20,
     },
     C_CO2_SENSOR_ZONE_4: {
         "RT": C_REG_TYPE_INPUT_REGISTERS,
@@ -476,6 +573,8 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "NAME": "CO2 Sensor Zone 4",
         "UNIT": "ppm",
         "DT": C_DT_UINT16,
+        "POLL": C_POLL_FAST,
+        "DELTA": 20,
     },
     C_CO2_SENSOR_ZONE_5: {
         "RT": C_REG_TYPE_INPUT_REGISTERS,
@@ -483,6 +582,8 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "NAME": "CO2 Sensor Zone 5",
         "UNIT": "ppm",
         "DT": C_DT_UINT16,
+        "POLL": C_POLL_FAST,
+        "DELTA": 20,
     },
     C_CO2_SENSOR_ZONE_6: {
         "RT": C_REG_TYPE_INPUT_REGISTERS,
@@ -490,6 +591,8 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "NAME": "CO2 Sensor Zone 6",
         "UNIT": "ppm",
         "DT": C_DT_UINT16,
+        "POLL": C_POLL_FAST,
+        "DELTA": 20,
     },
     C_CO2_SENSOR_ZONE_7: {
         "RT": C_REG_TYPE_INPUT_REGISTERS,
@@ -497,6 +600,8 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "NAME": "CO2 Sensor Zone 7",
         "UNIT": "ppm",
         "DT": C_DT_UINT16,
+        "POLL": C_POLL_FAST,
+        "DELTA": 20,
     },
     C_CO2_SENSOR_ZONE_8: {
         "RT": C_REG_TYPE_INPUT_REGISTERS,
@@ -504,6 +609,8 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "NAME": "CO2 Sensor Zone 8",
         "UNIT": "ppm",
         "DT": C_DT_UINT16,
+        "POLL": C_POLL_FAST,
+        "DELTA": 20,
     },
     C_FILTER_DAYS_REMAINING: {
         "RT": C_REG_TYPE_INPUT_REGISTERS,
@@ -511,6 +618,7 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "NAME": "Filter ersetzen in",
         "UNIT": "d",
         "DT": C_DT_UINT16,
+        "POLL": C_POLL_SLOW,
     },
     # DISCRETE_INPUTS
     C_ERROR_FLAG: {"RT": C_REG_TYPE_DISCRETE_INPUTS, "REG": 0, "NAME": "Fehler aktiv?"},
@@ -534,6 +642,7 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
             3: "high",
             "default": 2,
         },
+        "AFFECTS": (C_AUTO_MODE, C_AWAY_FUNCTION),
     },
     C_TEMPERATURE_PROFILE: {
         "RT": C_REG_TYPE_HOLDING_REGISTERS,
@@ -549,6 +658,7 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "NAME": "Temperaturprofil Modus",
         "DT": C_DT_UINT16,  # byte -> in 16 Bit Register
         "VALUES": {0: "adaptive", 1: "fixed", 2: "external_setpoint", "default": 0},
+        "POLL": C_POLL_SLOW,
     },
     C_EXTERNAL_SETPOINT: {
         "RT": C_REG_TYPE_HOLDING_REGISTERS,
@@ -573,13 +683,23 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
         "MAX": 1092,  # Sekunden: 65535,
         "DT": C_DT_UINT16,
         # Hinweis: 65535 (18h12m15s)wird als 24 Stunden betrachtet
+        "AFFECTS": (C_BOOST,),
     },
     # COILS
     C_RESET_ERRORS: {
         "RT": C_REG_TYPE_COILS,
         "REG": 0,
         "NAME": "Fehler quittieren",
+        "POLL": C_POLL_ON_DEMAND,
         # selbstrücksetzende Coil, der Wert False wird ignoriert
+        "AFFECTS": (
+            C_ERROR_FLAG,
+            C_ACTIVEERROR1,
+            C_ACTIVEERROR2,
+            C_ACTIVEERROR3,
+            C_ACTIVEERROR4,
+            C_ACTIVEERROR5,
+        ),
     },
     # # Wird schon über C_VENTILATION_PRESET gesetzt
     # C_VENTILATION_PRESET_AWAY: {
@@ -598,125 +718,85 @@ ENTITIES_DICT: Dict[str, Dict[str, Any]] = {
     #    "RT": C_REG_TYPE_COILS, "REG": 4, "NAME": "VentilationPreset3"
     #    # der Wert False wird ignoriert
     # },
-    C_AUTO_MODE: {"RT": C_REG_TYPE_COILS, "REG": 5, "NAME": "Auto Mode"},
-    C_BOOST: {"RT": C_REG_TYPE_COILS, "REG": 6, "NAME": "Boost"},
-    C_AWAY_FUNCTION: {"RT": C_REG_TYPE_COILS, "REG": 7, "NAME": "Away function"},
+    C_AUTO_MODE: {
+        "RT": C_REG_TYPE_COILS,
+        "REG": 5,
+        "NAME": "Auto Mode",
+        "AFFECTS": (C_VENTILATION_PRESET,),
+    },
+    C_BOOST: {
+        "RT": C_REG_TYPE_COILS,
+        "REG": 6,
+        "NAME": "Boost",
+        "ACTIVE": "on",
+        "AFFECTS": (C_BOOST_TIME,),
+    },
+    C_AWAY_FUNCTION: {
+        "RT": C_REG_TYPE_COILS,
+        "REG": 7,
+        "NAME": "Away function",
+        "AFFECTS": (C_VENTILATION_PRESET,),
+    },
     C_COMFOCOOL: {"RT": C_REG_TYPE_COILS, "REG": 8, "NAME": "ComfoCool"},
 }
 
 
-# ------------------------------------------------------------
-# Klassendefinitionen für die unterschiedlichen Entitätstypen
-# ------------------------------------------------------------
-
-
-@dataclass
-class MyBinarySensorEntityDescription(BinarySensorEntityDescription):
-    """A class that describes Modbus binarysensor entities."""
-
-
-@dataclass
-class MySensorEntityDescription(SensorEntityDescription):
-    """A class that describes Modbus sensor entities."""
-
-
-@dataclass
-class DerivedSensorSpec:
-    """Links a synthetic sensor description to its two source hub keys."""
-
-    description: MySensorEntityDescription
-    temp_key: str
-    humidity_key: str
-
-
-@dataclass
-class MyBinaryEntityDescription(BinarySensorEntityDescription):
-    """A class that describes Modbus binary entities."""
-
-    # Hinweis: Falls echte Schalter-Entities verwendet werden, ggf. SwitchEntityDescription verwenden.
+@dataclass(frozen=True)
+class ReadRequest:
+    """Ein zusammenhängender Lesezugriff (ein Modbus-Request) des Read-Plans."""
 
+    reg_type: int
+    address: int
+    count: int
+    tier: str = C_POLL_NORMAL
 
-@dataclass
-class MySelectEntityDescription(SelectEntityDescription):
-    """A class that describes Modbus select entities."""
+    def contains(self, tier: str, reg_type: int, reg: int, width: int) -> bool:
+        return (
+            self.tier == tier
+            and self.reg_type == reg_type
+            and self.address <= reg
+            and reg + width <= self.address + self.count
+        )
 
-    default_select_option: str | None = None
-    setter_function: Callable[[Any, str], Awaitable[None]] | None = None
 
+@dataclass(frozen=True, slots=True)
+class EntityDecoder:
+    """Vorkompilierter Lese-Slot einer Entität für die Lese-Schleife des Hubs."""
 
-@dataclass
-class MyClimateEntityDescription(ClimateEntityDescription):
-    """A class that describes Modbus climate sensor entities."""
+    key: str
+    block: int  # Index des Requests im READ_PLAN (= Antwort-Puffer)
+    offset: int  # Offset im Antwort-Puffer
+    width: int  # Anzahl Register bzw. Bits
+    dt: DataType
+    decode: Callable[[Any], Any]  # Rohwert -> Wert in hub.data (inkl. FAKTOR)
 
-    min_value: float = None
-    max_value: float = None
-    step: float = None
-    hvac_modes: list[str] = None
-    temperature_unit: str = "°C"
-    supported_features: ClimateEntityFeature = ClimateEntityFeature.TARGET_TEMPERATURE
 
+_LITTLE_ENDIAN = sys.byteorder == "little"
 
-@dataclass
-class MyNumberEntityDescription(NumberEntityDescription):
-    """A class that describes Modbus number entities."""
 
-    mode: str = "slider"
-    initial: float = None
-    editable: bool = True
+@dataclass(frozen=True, slots=True)
+class BlockDecoder:
+    """Entpackt die Rohwerte aller Entitäten eines Antwort-Puffers in einem Durchgang."""
 
+    block: int  # Index des Requests im READ_PLAN
+    decoders: tuple[EntityDecoder, ...]  # sortiert nach Offset
+    # Ein struct für den gesamten Puffer (Lücken als Pad-Bytes), oder bei
+    # überlappenden Entitäten ein struct je Feld mit Byte-Offset. Bits: beides None.
+    layout: struct.Struct | None = None
+    field_layouts: tuple[tuple[struct.Struct, int], ...] | None = None
 
-BINARYSENSOR_TYPES: dict[str, MyBinarySensorEntityDescription] = {}
-SENSOR_TYPES: dict[str, MySensorEntityDescription] = {}
-SELECT_TYPES: dict[str, MySelectEntityDescription] = {}
-CLIMATE_TYPES: dict[str, MyClimateEntityDescription] = {}
-NUMBER_TYPES: dict[str, MyNumberEntityDescription] = {}
-BINARY_TYPES: dict[str, MyBinaryEntityDescription] = {}
-
-_DEW_POINT_PAIRS = [
-    (C_ROOM_DEW_POINT, C_ROOM_TEMPERATURE, C_ROOM_HUMIDITY),
-    (C_EXTRACT_DEW_POINT, C_EXTRACT_TEMPERATURE, C_EXTRACT_HUMIDITY),
-    (C_EXHAUST_DEW_POINT, C_EXHAUST_TEMPERATURE, C_EXHAUST_HUMIDITY),
-    (C_OUTDOOR_DEW_POINT, C_OUTDOOR_TEMPERATURE, C_OUTDOOR_HUMIDITY),
-    (C_SUPPLY_DEW_POINT, C_SUPPLY_TEMPERATURE, C_SUPPLY_HUMIDITY),
-]
-
-DEW_POINT_SENSOR_TYPES: dict[str, DerivedSensorSpec] = {
-    key: DerivedSensorSpec(
-        description=MySensorEntityDescription(
-            key=key,
-            translation_key=key,
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            state_class=SensorStateClass.MEASUREMENT,
-        ),
-        temp_key=temp_key,
-        humidity_key=humidity_key,
-    )
-    for key, temp_key, humidity_key in _DEW_POINT_PAIRS
-}
-
-_ABSOLUTE_HUMIDITY_PAIRS = [
-    (C_ROOM_ABSOLUTE_HUMIDITY, C_ROOM_TEMPERATURE, C_ROOM_HUMIDITY),
-    (C_EXTRACT_ABSOLUTE_HUMIDITY, C_EXTRACT_TEMPERATURE, C_EXTRACT_HUMIDITY),
-    (C_EXHAUST_ABSOLUTE_HUMIDITY, C_EXHAUST_TEMPERATURE, C_EXHAUST_HUMIDITY),
-    (C_OUTDOOR_ABSOLUTE_HUMIDITY, C_OUTDOOR_TEMPERATURE, C_OUTDOOR_HUMIDITY),
-    (C_SUPPLY_ABSOLUTE_HUMIDITY, C_SUPPLY_TEMPERATURE, C_SUPPLY_HUMIDITY),
-]
-
-ABSOLUTE_HUMIDITY_SENSOR_TYPES: dict[str, DerivedSensorSpec] = {
-    key: DerivedSensorSpec(
-        description=MySensorEntityDescription(
-            key=key,
-            translation_key=key,
-            native_unit_of_measurement="g/m³",
-            device_class=None,
-            state_class=SensorStateClass.MEASUREMENT,
-        ),
-        temp_key=temp_key,
-        humidity_key=humidity_key,
-    )
-    for key, temp_key, humidity_key in _ABSOLUTE_HUMIDITY_PAIRS
-}
+    def unpack(self, buf: list) -> tuple | list:
+        if self.layout is None and self.field_layouts is None:
+            return [buf[decoder.offset] for decoder in self.decoders]
+        words = array("H", buf)
+        if _LITTLE_ENDIAN:
+            words.byteswap()
+        if self.layout is not None:
+            return self.layout.unpack_from(words)
+        return [
+            layout.unpack_from(words, offset)[0]
+            for layout, offset in self.field_layouts
+        ]
 
 
 # --------------------------------------------------------------------
@@ -773,6 +853,10 @@ def get_entity_type(props: Dict[str, Any]) -> int | None:
     return props.get("RT")
 
 
+def get_entity_affects(props: Dict[str, Any]) -> tuple[str, ...]:
+    return tuple(props.get("AFFECTS", ()))
+
+
 def get_entity_name(props: Dict[str, Any], default: str = None) -> str | None:
     return props.get("NAME", default)
 
@@ -822,7 +906,7 @@ def get_entity_select_values_and_default(
 
 def get_entity_reg(
     props: Dict[str, Any],
-) -> tuple[int | None, ModbusTcpClient.DATATYPE | None]:
+) -> tuple[int | None, DataType | None]:
     reg_type = get_entity_type(props)
     if reg_type in [C_REG_TYPE_COILS, C_REG_TYPE_DISCRETE_INPUTS]:
         dt = C_DT_BITS
@@ -831,6 +915,16 @@ def get_entity_reg(
     return props.get("REG"), dt
 
 
+def get_entity_width(props: Dict[str, Any]) -> int | None:
+    """Anzahl der belegten Register (bzw. Bits bei Coils/Discrete-Inputs)."""
+    _, dt = get_entity_reg(props)
+    if dt is None:
+        return None
+    if dt == C_DT_BITS:
+        return 1
+    return dt.value[1]
+
+
 def get_entity_props(entity: str) -> dict:
     return ENTITIES_DICT[entity]
 
@@ -839,306 +933,270 @@ def get_entity_factor(props: Dict[str, Any]) -> float:
     return props.get("FAKTOR", 1.0)
 
 
+def get_entity_poll_tier(props: Dict[str, Any]) -> str:
+    return props.get("POLL", C_POLL_NORMAL)
+
+
 # --------------------------------------------------------------------------------
 # Hilfsfunktionen zur Erstellen der aus ENTITIES_DICT abgeleiteten Datenstrukturen
 # --------------------------------------------------------------------------------
 
 
-def _classify_register(props: Dict[str, Any]) -> int | None:
-    global \
-        C_MIN_INPUT_REGISTER, \
-        C_MAX_INPUT_REGISTER, \
-        C_MIN_HOLDING_REGISTER, \
-        C_MAX_HOLDING_REGISTER, \
-        C_MIN_COILS, \
-        C_MAX_COILS, \
-        C_MIN_DISCRETE_INPUTS, \
-        C_MAX_DISCRETE_INPUTS
+def compile_read_plan(
+    entities: Dict[str, Dict[str, Any]] | None = None,
+    max_registers: int = C_MAX_READ_REGISTERS,
+    max_bits: int = C_MAX_READ_BITS,
+    max_gap_registers: int = C_MAX_READ_GAP_REGISTERS,
+    max_gap_bits: int = C_MAX_READ_GAP_BITS,
+) -> list[ReadRequest]:
+    """
+    Kompiliert die Entitäten zu einer geordneten Liste zusammenhängender Lese-Requests
+    je Abfrage-Stufe und Registerart. Requests werden bei großen Adresslücken oder beim
+    Erreichen der maximalen PDU-Größe aufgetrennt, kleine Lücken werden mitgelesen.
+    """
+    if entities is None:
+        entities = ENTITIES_DICT
+
+    spans: Dict[tuple[str, int], list[tuple[int, int]]] = {}
+    for props in entities.values():
+        reg = props.get("REG")
+        width = get_entity_width(props)
+        if reg is None or width is None:
+            continue
+        group = (get_entity_poll_tier(props), get_entity_type(props))
+        spans.setdefault(group, []).append((reg, reg + width - 1))
+
+    plan: list[ReadRequest] = []
+    for tier in C_POLL_TIERS:
+        for reg_type in C_READ_ORDER:
+            if (tier, reg_type) not in spans:
+                continue
+            if reg_type in (C_REG_TYPE_COILS, C_REG_TYPE_DISCRETE_INPUTS):
+                max_count, max_gap = max_bits, max_gap_bits
+            else:
+                max_count, max_gap = max_registers, max_gap_registers
+
+            ranges = sorted(spans[(tier, reg_type)])
+            start, end = ranges[0]
+            for reg_from, reg_to in ranges[1:]:
+                gap = reg_from - end - 1
+                if gap <= max_gap and max(end, reg_to) - start + 1 <= max_count:
+                    end = max(end, reg_to)
+                else:
+                    plan.append(ReadRequest(reg_type, start, end - start + 1, tier))
+                    start, end = reg_from, reg_to
+            plan.append(ReadRequest(reg_type, start, end - start + 1, tier))
+    return plan
+
+
+def compile_read_plan_slots(
+    plan: list[ReadRequest], entities: Dict[str, Dict[str, Any]] | None = None
+) -> dict[str, tuple[int, int]]:
+    """Ordnet jeder Entität (Index des Requests im Read-Plan, Offset im Puffer) zu."""
+    if entities is None:
+        entities = ENTITIES_DICT
+
+    slots: dict[str, tuple[int, int]] = {}
+    for entity_key, props in entities.items():
+        reg = props.get("REG")
+        width = get_entity_width(props)
+        if reg is None or width is None:
+            continue
+        reg_type = get_entity_type(props)
+        tier = get_entity_poll_tier(props)
+        for index, request in enumerate(plan):
+            if request.contains(tier, reg_type, reg, width):
+                slots[entity_key] = (index, reg - request.address)
+                break
+    return slots
 
-    reg_type = get_entity_type(props)
-    reg_from, dt = get_entity_reg(props)
-    if reg_from is None or dt is None:
-        return None
-    if dt == ModbusTcpClient.DATATYPE.BITS:
-        sizeofdt = 1
-    else:
-        sizeofdt = dt.value[1]
-    reg_to = reg_from + sizeofdt - 1
-
-    match reg_type:
-        case thismodule.C_REG_TYPE_DISCRETE_INPUTS:
-            C_MIN_DISCRETE_INPUTS = min(reg_from, C_MIN_DISCRETE_INPUTS)
-            C_MAX_DISCRETE_INPUTS = max(reg_to, C_MAX_DISCRETE_INPUTS)
-        case thismodule.C_REG_TYPE_COILS:
-            C_MIN_COILS = min(reg_from, C_MIN_COILS)
-            C_MAX_COILS = max(reg_to, C_MAX_COILS)
-        case thismodule.C_REG_TYPE_INPUT_REGISTERS:
-            C_MIN_INPUT_REGISTER = min(reg_from, C_MIN_INPUT_REGISTER)
-            C_MAX_INPUT_REGISTER = max(reg_to, C_MAX_INPUT_REGISTER)
-        case thismodule.C_REG_TYPE_HOLDING_REGISTERS:
-            C_MIN_HOLDING_REGISTER = min(reg_from, C_MIN_HOLDING_REGISTER)
-            C_MAX_HOLDING_REGISTER = max(reg_to, C_MAX_HOLDING_REGISTER)
-
-    if is_entity_readonly(props):
-        if is_entity_switch(props):
-            """Nicht beschreibbar, Schalter (SWITCH!=None)."""
-            return MyBinarySensorEntityDescription  # C_REGISTERCLASS_BINARY_SENSOR
-        elif is_entity_select(props):
-            """Nicht beschreibbar, Auswahl (VALUES enthält mindestens ein Element)."""
-            return MySensorEntityDescription  # C_REGISTERCLASS_SELECT_ENTITY
-        else:
-            """Nicht beschreibbar, kein Schalter (SWITCH=None)."""
-            return MySensorEntityDescription  # C_REGISTERCLASS_SENSOR
-    else:
-        if is_entity_switch(props):
-            """Beschreibbar, Schalter (SWITCH!=None)."""
-            return MyBinaryEntityDescription  # C_REGISTERCLASS_BINARY_ENTITY
-        elif is_entity_select(props):
-            """Beschreibbar, Auswahl (VALUES enthält mindestens ein Element)."""
-            return MySelectEntityDescription  # C_REGISTERCLASS_SELECT_ENTITY
-        elif is_entity_climate(props):
-            """Beschreibbar, Nur Temperatureinheiten (°C oder K) zulassen"""
-            return MyClimateEntityDescription  # C_REGISTERCLASS_CLIMATE_ENTITY
-        else:
-            """Beschreibbar, kein Schalter (SWITCH=None), keine Auswahl (VALUES ist None), Einheit optional, aber nicht °C oder K."""
-            return MyNumberEntityDescription  # C_REGISTERCLASS_NUMBER_ENTITY
+
+# -------------------------------------------------
+# Dekodierung Rohwert -> Wert in hub.data
+# -------------------------------------------------
 
 
-def _unit_mapping(
-    unit: Optional[str],
-) -> tuple[Optional[str], Optional[SensorDeviceClass], Optional[SensorStateClass]]:
+def decode_switch(off_value: int, raw: int) -> str:
     """
-    Mappt unsere Einheit (UNIT) auf Home-Assistant native_unit_of_measurement + device_class + state_class.
-    Für unbekannte Einheiten bleiben Klassen leer.
+    SWITCH-Mapping -> 'off'/'on'.
+    Erlaubt {"off": 0}  oder {"off": 0, "on": 1}.
     """
-    if unit is None:
-        return None, None, None
+    return "off" if raw == off_value else "on"
 
-    u = unit.strip()
-    # Temperatur
-    if u == "°C":
-        return (
-            UnitOfTemperature.CELSIUS,
-            SensorDeviceClass.TEMPERATURE,
-            SensorStateClass.MEASUREMENT,
-        )
-    if u == "K":
-        # Selten als absolute Temperatur; hier i. d. R. Offsets -> als °C nicht sinnvoll.
-        return (
-            UnitOfTemperature.KELVIN,
-            SensorDeviceClass.TEMPERATURE,
-            SensorStateClass.MEASUREMENT,
-        )
 
-    # Druck
-    if u.lower() in {"bar"}:
-        return (
-            UnitOfPressure.BAR,
-            SensorDeviceClass.PRESSURE,
-            SensorStateClass.MEASUREMENT,
-        )
+def decode_select(values: Dict[Any, Any], raw: int) -> str:
+    """Invertiere VALUES (Index->Text) zu Text."""
+    return values.get(raw, f"Ungültiger Wert: {raw}")
 
-    # Energie & Leistung
-    if u.lower() in {"kwh", "kW/h".lower()}:  # akzeptiere beide Schreibweisen
-        return (
-            UnitOfEnergy.KILO_WATT_HOUR,
-            SensorDeviceClass.ENERGY,
-            SensorStateClass.TOTAL_INCREASING,
-        )
-    if u.lower() in {"w"}:
-        return UnitOfPower.WATT, SensorDeviceClass.POWER, SensorStateClass.MEASUREMENT
-    if u.lower() in {"kw"}:
-        return (
-            UnitOfPower.KILO_WATT,
-            SensorDeviceClass.POWER,
-            SensorStateClass.MEASUREMENT,
-        )
 
-    # Volumenstrom
-    if u.lower() in {"l/min", "l/Min", "l pro min"}:
-        return "l/min", None, SensorStateClass.MEASUREMENT
-    if u.lower() in {"m³/h"}:
-        return "m³/h", None, SensorStateClass.MEASUREMENT
-
-    # Drehzahl / Stellgrad
-    if u == "‰":
-        return "‰", None, SensorStateClass.MEASUREMENT
-    if u == "%":
-        return "%", None, SensorStateClass.MEASUREMENT
-
-    # PPM, Anteil
-    if u == "ppm":
-        return "ppm", None, SensorStateClass.MEASUREMENT
-
-    # Zeit/Dauer
-    if u.lower() in {"h", "std"}:
-        return "h", SensorDeviceClass.DURATION, SensorStateClass.TOTAL_INCREASING
-    if u.lower() in {"min"}:
-        return "min", SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT
-    if u.lower() in {"s", "sek", "sec"}:
-        return "s", SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT
-
-    # Restdauer
-    if u.lower() in {"d", "days"}:
-        return "d", SensorDeviceClass.DURATION, SensorStateClass.MEASUREMENT
-
-    # Fallback: nutze Roh-Einheit ohne Device-Class
-    return u, None, SensorStateClass.MEASUREMENT
-
-
-_initialized = False
-
-
-def init():
-    global \
-        _initialized, \
-        BINARYSENSOR_TYPES, \
-        SENSOR_TYPES, \
-        SELECT_TYPES, \
-        CLIMATE_TYPES, \
-        NUMBER_TYPES, \
-        BINARY_TYPES
-    if _initialized:
-        return
-    _LOGGER.info(
-        "****************************************  initalizing ***************************************"
-    )
+def decode_numeric(factor: float, raw: int) -> float | None:
+    """Rohwert -> physikalischer Wert mittels FAKTOR (raw * faktor)."""
+    # Sentinel für 'ungültig': -500
+    if raw == -500:
+        return None
+    return float(raw * factor)
 
-    thismodule.BINARYSENSOR_TYPES = {}
-    thismodule.SENSOR_TYPES = {}
-    thismodule.SELECT_TYPES = {}
-    thismodule.CLIMATE_TYPES = {
-        "ventilation_climate": MyClimateEntityDescription(
-            key="ventilation_climate",
-            name="Climate",
-            translation_key="ventilation_climate",
-            supported_features=(
-                ClimateEntityFeature.PRESET_MODE
-                | ClimateEntityFeature.TARGET_TEMPERATURE
-            ),
-        )
+
+def decode_climate(
+    factor: float, min_value: float | None, max_value: float | None, raw: int
+) -> dict:
+    return {
+        "temperature": decode_numeric(factor, raw),
+        "target_temp_low": min_value,
+        "target_temp_high": max_value,
     }
-    thismodule.NUMBER_TYPES = {}
-    thismodule.BINARY_TYPES = {}
-
-    for c_key, props in ENTITIES_DICT.items():
-        entity_key: str = c_key
-        name: str = get_entity_name(props, entity_key)
-        registerclass = _classify_register(props)
-
-        match registerclass:
-            case thismodule.MySensorEntityDescription:
-                unit, device_class, state_class = _unit_mapping(get_entity_unit(props))
-                _LOGGER.debug(f"Sensor {entity_key}: {name}, Einheit {unit}")
-                SENSOR_TYPES[entity_key] = registerclass(
-                    name=name,
-                    key=entity_key,
-                    translation_key=entity_key,
-                    native_unit_of_measurement=unit,
-                    device_class=device_class,
-                    state_class=state_class,
-                )
 
-            case thismodule.MyBinarySensorEntityDescription:
-                _LOGGER.debug(f"Binär-Sensor {entity_key}: {name}")
-                BINARYSENSOR_TYPES[entity_key] = registerclass(
-                    name=name,
-                    key=entity_key,
-                    translation_key=entity_key,
-                )
 
-            case thismodule.MyClimateEntityDescription:
-                # key = f"{C_PREFIX_CLIMATE}_{entity_key}"
-                min_value = get_entity_min(props)
-                max_value = get_entity_max(props)
-                step = get_entity_step(props)
-                hvac_modes = get_entity_hvac_modes(props)
-                temperature_unit = get_entity_unit(props)
-                _LOGGER.debug(
-                    f"Temperatur-Stellwert {entity_key}: {name}, {min_value}-{max_value}{temperature_unit} in {step}-er Schritten"
-                )
-                CLIMATE_TYPES[entity_key] = registerclass(
-                    name=name,
-                    key=entity_key,
-                    translation_key=entity_key,
-                    min_value=min_value,
-                    max_value=max_value,
-                    step=step,
-                    hvac_modes=hvac_modes,
-                    temperature_unit=temperature_unit,
-                    supported_features=props.get(
-                        "FEATURES", ClimateEntityFeature.TARGET_TEMPERATURE
-                    ),
-                )
+def make_entity_decoder(props: Dict[str, Any]) -> Callable[[Any], Any]:
+    """Liefert die Dekodierfunktion (Rohwert -> Wert) einer Entität."""
+    if is_entity_switch(props):
+        return partial(decode_switch, (get_entity_switch(props) or {}).get("off", 0))
+    if is_entity_select(props):
+        return partial(decode_select, get_entity_select(props) or {})
+    factor = get_entity_factor(props) or 1.0
+    if is_entity_climate(props) and not is_entity_readonly(props):
+        return partial(
+            decode_climate, factor, get_entity_min(props), get_entity_max(props)
+        )
+    return partial(decode_numeric, factor)
+
+
+def compile_decoder_table(
+    slots: dict[str, tuple[int, int]],
+    entities: Dict[str, Dict[str, Any]] | None = None,
+) -> tuple[EntityDecoder, ...]:
+    """Erzeugt die Decoder-Tabelle aus den Slots des Read-Plans."""
+    if entities is None:
+        entities = ENTITIES_DICT
+
+    table = []
+    for entity_key, (block, offset) in slots.items():
+        props = entities[entity_key]
+        _, dt = get_entity_reg(props)
+        table.append(
+            EntityDecoder(
+                key=entity_key,
+                block=block,
+                offset=offset,
+                width=get_entity_width(props),
+                dt=dt,
+                decode=make_entity_decoder(props),
+            )
+        )
+    return tuple(table)
 
-            case thismodule.MyNumberEntityDescription:
-                # key = f"{C_PREFIX_NUMBER}_{entity_key}"
-                min_value = get_entity_min(props)
-                max_value = get_entity_max(props)
-                step = get_entity_step(props)
-                unit_of_measurement = get_entity_unit(props)
-                _LOGGER.debug(
-                    f"Numerischer Stellwert {entity_key}: {name}, {min_value}-{max_value}{unit_of_measurement} in {step}-er Schritten"
+
+def compile_block_decoders(
+    table: tuple[EntityDecoder, ...],
+) -> tuple[BlockDecoder, ...]:
+    """
+    Gruppiert die Decoder-Tabelle je Antwort-Puffer und kompiliert für Register-Puffer
+    ein struct-Format, das alle Felder in einem unpack-Aufruf liefert.
+    """
+    blocks: dict[int, list[EntityDecoder]] = {}
+    for decoder in table:
+        blocks.setdefault(decoder.block, []).append(decoder)
+
+    result = []
+    for block, decoders in sorted(blocks.items()):
+        decoders.sort(key=lambda d: d.offset)
+        if decoders[0].dt == C_DT_BITS:
+            result.append(BlockDecoder(block=block, decoders=tuple(decoders)))
+            continue
+
+        fmt = ">"
+        position = 0
+        overlapping = False
+        for decoder in decoders:
+            if decoder.offset < position:
+                overlapping = True
+                break
+            if decoder.offset > position:
+                fmt += f"{(decoder.offset - position) * 2}x"
+            # struct-Formatzeichen des Datentyps (Big-Endian, höherwertiges Wort zuerst)
+            fmt += decoder.dt.value[0]
+            position = decoder.offset + decoder.width
+
+        if overlapping:
+            field_layouts = tuple(
+                (struct.Struct(">" + d.dt.value[0]), d.offset * 2) for d in decoders
+            )
+            result.append(
+                BlockDecoder(
+                    block=block,
+                    decoders=tuple(decoders),
+                    field_layouts=field_layouts,
                 )
-                NUMBER_TYPES[entity_key] = registerclass(
-                    name=name,
-                    key=entity_key,
-                    translation_key=entity_key,
-                    min_value=min_value,
-                    max_value=max_value,
-                    step=step,
-                    unit_of_measurement=unit_of_measurement,
-                    editable=is_entity_readwrite(props),
-                    mode="box",
+            )
+        else:
+            result.append(
+                BlockDecoder(
+                    block=block, decoders=tuple(decoders), layout=struct.Struct(fmt)
                 )
+            )
+    return tuple(result)
 
-            case thismodule.MyBinaryEntityDescription:
-                # key = f"{C_PREFIX_SWITCH}_{entity_key}"
-                _LOGGER.debug(f"Schalter {entity_key}: {name}")
-                BINARY_TYPES[entity_key] = registerclass(
-                    name=name,
-                    key=entity_key,
-                    translation_key=entity_key,
-                )
 
-            case thismodule.MySelectEntityDescription:
-                # key = f"{C_PREFIX_SELECT}_{entity_key}"
-                values, default = get_entity_select_values_and_default(props)
-                _LOGGER.debug(
-                    f"Auswahl-Entität {entity_key}: {name}, Werte-Bereich: {values}, Default: {default}"
-                )
-                SELECT_TYPES[entity_key] = registerclass(
-                    name=name,
-                    key=entity_key,
-                    translation_key=entity_key,
-                    options=values,
-                    default_select_option=default,
-                )
+@dataclass(frozen=True)
+class TargetedRead:
+    """Vorkompilierter Lesezugriff für eine Teilmenge der Entitäten (Zyklus, nach dem Schreiben)."""
 
-            case _:
-                _LOGGER.warning(f"Unbekannter Entitätstyp {entity_key}: {props}")
-                print(f"Sensor konnte nicht zugeordnet werden: {entity_key}/{name}")
+    plan: tuple[ReadRequest, ...]
+    blocks: tuple[BlockDecoder, ...]
+    # Abfrage-Stufen der Entitäten je Request des Plans
+    tiers: tuple[frozenset[str], ...] = ()
 
-    _initialized = True
-    _LOGGER.debug(
-        f"Status-Register (r/o) von {C_MIN_INPUT_REGISTER} bis {C_MAX_INPUT_REGISTER}"
-    )
-    _LOGGER.debug(
-        f"Discrete Inputs-Register (r/o) von {C_MIN_DISCRETE_INPUTS} bis {C_MAX_DISCRETE_INPUTS}"
-    )
-    _LOGGER.debug(f"- {len(SENSOR_TYPES)} Sensoren")
-    _LOGGER.debug(f"- {len(BINARYSENSOR_TYPES)} Binär-Sensoren")
-    _LOGGER.debug(
-        f"Holding-Register (r/w) von {C_MIN_HOLDING_REGISTER} bis {C_MAX_HOLDING_REGISTER}"
+
+def compile_merged_read(
+    keys: Iterable[str], entities: Dict[str, Dict[str, Any]] | None = None
+) -> TargetedRead:
+    """
+    Kompiliert Read-Plan und Decoder für die angegebenen Entitäten. Abfrage-Stufen
+    werden dabei ignoriert, damit so wenige Requests wie möglich entstehen.
+    """
+    if entities is None:
+        entities = ENTITIES_DICT
+
+    subset = {key: {**entities[key], "POLL": C_POLL_NORMAL} for key in keys}
+    plan = compile_read_plan(subset)
+    slots = compile_read_plan_slots(plan, subset)
+    blocks = compile_block_decoders(compile_decoder_table(slots, subset))
+    tiers: list[set[str]] = [set() for _ in plan]
+    for key, (block, _offset) in slots.items():
+        tiers[block].add(get_entity_poll_tier(entities[key]))
+    return TargetedRead(
+        plan=tuple(plan),
+        blocks=blocks,
+        tiers=tuple(frozenset(block_tiers) for block_tiers in tiers),
     )
-    _LOGGER.debug(f"Coils (r/w) von {C_MIN_COILS} bis {C_MAX_COILS}")
-    _LOGGER.debug(f"- {len(SELECT_TYPES)} Auswahl-Entitäten")
-    _LOGGER.debug(f"- {len(BINARY_TYPES)} Schalter")
-    _LOGGER.debug(f"- {len(CLIMATE_TYPES)} Temperatur-Stellwerte")
-    _LOGGER.debug(f"- {len(NUMBER_TYPES)} Numerische Stellwerte")
-    _LOGGER.info(
-        "****************************************  initalized ****************************************"
+
+
+@lru_cache(maxsize=16)
+def compile_cycle_read(tiers: frozenset[str]) -> TargetedRead:
+    """
+    Read-Plan eines Zyklus: alle Entitäten der fälligen Abfrage-Stufen, über die
+    Stufen hinweg je Registerart zusammengefasst (Lücken- und PDU-Regeln wie im
+    Read-Plan). So braucht ein Zyklus nie mehr Requests als ein Lesen ohne Stufen.
+    """
+    return compile_merged_read(
+        key
+        for key, props in ENTITIES_DICT.items()
+        if get_entity_poll_tier(props) in tiers
     )
 
 
-init()
+@lru_cache(maxsize=64)
+def compile_targeted_read(keys: frozenset[str]) -> TargetedRead:
+    """
+    Kompiliert Read-Plan und Decoder für die angegebenen Entitäten und deren
+    abhängige Entitäten (AFFECTS).
+    """
+    subset: Dict[str, None] = {}
+    for entity_key in keys:
+        props = ENTITIES_DICT.get(entity_key)
+        if props is None:
+            continue
+        for key in (entity_key, *get_entity_affects(props)):
+            if key in ENTITIES_DICT:
+                subset[key] = None
+    return compile_merged_read(subset)
@@ -0,0 +1,31 @@
+"""Diagnose-Download des Config-Entry (Read-Plan, Rohpuffer, Werte, Zeiten, Fehler)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import C_FLEET_SCHEDULER, DOMAIN
+from .entity_common import get_hub_and_device_info
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    _hub_name, hub, _device_info = get_hub_and_device_info(hass, entry)
+    scheduler = hass.data[DOMAIN].get(C_FLEET_SCHEDULER)
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "hub": hub.diagnostics(),
+        "fleet": scheduler.stats() if scheduler is not None else None,
+    }
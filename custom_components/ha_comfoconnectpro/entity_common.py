@@ -50,15 +50,40 @@ class HubBackedEntity(Entity):
         base = f"{description.key}"
         self._attr_suggested_object_id = base
 
+    @property
+    def _hub_keys(self) -> tuple[str, ...]:
+        """Schlüssel in hub.data, bei deren Änderung die Entität aktualisiert wird."""
+        return (self.entity_description.key,)
+
     async def async_added_to_hass(self) -> None:
-        self._hub.async_add_my_modbus_sensor(self._on_hub_update)
+        keys = self._hub_keys
+        self._hub.async_add_my_modbus_sensor(self._on_hub_update, keys)
+        # Hub hat bereits gelesen (z.B. nach Reload einer Plattform): sofort übernehmen,
+        # da bis zur nächsten Änderung keine Benachrichtigung erfolgt
+        if any(key in self._hub.data for key in keys):
+            self._on_hub_update()
+
+    @property
+    def available(self) -> bool:
+        """
+        Nicht verfügbar, solange der Hub das Gerät nicht erreicht (Circuit Breaker) oder
+        der Block eines Eingangswerts zuletzt nicht gelesen werden konnte.
+        """
+        return all(self._hub.is_key_available(key) for key in self._hub_keys)
 
     async def async_will_remove_from_hass(self) -> None:
         self._hub.async_remove_my_modbus_sensor(self._on_hub_update)
 
+    def _hub_value(self, key: str) -> Any:
+        """
+        Wert aus dem Hub inkl. optimistischem Zustand: nach einem Schreibzugriff wird
+        sofort der erwartete Wert angezeigt, bis ihn das Lesen bestätigt (sonst Rücknahme).
+        """
+        return self._hub.get_value(key)
+
     @callback
     def _on_hub_update(self) -> None:
-        payload = self._hub.data.get(self.entity_description.key)
+        payload = self._hub_value(self.entity_description.key)
 
         try:
             self._apply_hub_payload(payload)
@@ -88,7 +113,7 @@ class HubBackedEntity(Entity):
 def get_hub_and_device_info(hass, entry) -> tuple:
     """Return (hub_name, hub, device_info) for a config entry."""
     hub_name = entry.options.get(CONF_NAME, entry.data[CONF_NAME])
-    hub = hass.data[DOMAIN][hub_name]["hub"]
+    hub = hass.data[DOMAIN][entry.entry_id]["hub"]
     device_info = {
         "identifiers": {(DOMAIN, entry.entry_id)},
         "name": DEFAULT_NAME,
@@ -0,0 +1,93 @@
+"""Gemeinsame Modbus/TCP-Verbindung aller Hubs (Geräte-IDs) hinter einem Gateway."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+from typing import TYPE_CHECKING
+
+from pymodbus.client import AsyncModbusTcpClient
+
+from .const import C_KEEPALIVE_COUNT, C_KEEPALIVE_IDLE, C_KEEPALIVE_INTERVAL
+from .pipeline import PipelinedReader
+
+if TYPE_CHECKING:
+    from . import MyModbusHub
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ModbusGateway:
+    """
+    Eine TCP-Verbindung je (host, port), geteilt von allen Hubs mit unterschiedlicher
+    Geräte-ID (hostid). pymodbus serialisiert die Requests einer Verbindung selbst:
+    Lesezyklen mehrerer Hubs laufen nebenläufig, ihre Requests wechseln sich ab.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        # reconnect_delay=0: kein automatisches Reconnect durch pymodbus,
+        # die Verbindung wird bei Bedarf (lazy) in _async_ensure_connected aufgebaut
+        self.client = AsyncModbusTcpClient(
+            host=host, port=port, timeout=3, retries=3, reconnect_delay=0
+        )
+        # Verbindungsaufbau nur durch einen Hub gleichzeitig
+        self.connect_lock = asyncio.Lock()
+        # Anzahl Hubs, die gerade einen Zyklus auf der Verbindung ausführen
+        self.active = 0
+        self._hubs: list[MyModbusHub] = []
+        # Optional: eigene Verbindung für pipelined Lesen (CONF_PIPELINED_READS).
+        # False, sobald das Gateway parallele Transaktionen nachweislich nicht verträgt
+        self._pipeline: PipelinedReader | None = None
+        self.pipeline_supported = True
+
+    @property
+    def hubs(self) -> list[MyModbusHub]:
+        return list(self._hubs)
+
+    def register(self, hub: MyModbusHub) -> None:
+        if hub not in self._hubs:
+            self._hubs.append(hub)
+
+    def unregister(self, hub: MyModbusHub) -> None:
+        if hub in self._hubs:
+            self._hubs.remove(hub)
+
+    @property
+    def pipeline(self) -> PipelinedReader:
+        if self._pipeline is None:
+            self._pipeline = PipelinedReader(self.host, self.port)
+        return self._pipeline
+
+    def close_pipeline(self) -> None:
+        if self._pipeline is not None:
+            self._pipeline.close()
+
+    def shared_with_others(self, hub: MyModbusHub) -> bool:
+        """True, wenn außer hub weitere Hubs die Verbindung nutzen."""
+        return any(other is not hub for other in self._hubs)
+
+    def enable_keepalive(self) -> None:
+        """TCP-Keep-Alive aktivieren, damit tote Verbindungen erkannt werden."""
+        transport = getattr(self.client.ctx, "transport", None)
+        sock = transport.get_extra_info("socket") if transport else None
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, C_KEEPALIVE_IDLE
+                )
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                sock.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, C_KEEPALIVE_INTERVAL
+                )
+            if hasattr(socket, "TCP_KEEPCNT"):
+                sock.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPCNT, C_KEEPALIVE_COUNT
+                )
+        except OSError as exc:
+            _LOGGER.debug("TCP-Keep-Alive konnte nicht gesetzt werden: %r", exc)
@@ -0,0 +1,202 @@
+"""Laufzeit-Kennzahlen des MyModbusHub (Grundlage der Diagnose-Sensoren)."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime, timezone
+import statistics
+from typing import Any, Dict
+
+from .const import (
+    C_METRIC_BYTES_TRANSFERRED,
+    C_METRIC_CONNECT_DURATION,
+    C_METRIC_CYCLE_DURATION,
+    C_METRIC_DECODE_DURATION,
+    C_METRIC_DISPATCH_DURATION,
+    C_METRIC_ERRORS,
+    C_METRIC_LAST_SUCCESS,
+    C_METRIC_READ_DURATION,
+    C_METRIC_REQUESTS,
+    C_METRIC_TIMEOUTS,
+)
+
+# Obergrenzen der Histogramm-Klassen für die Zyklusdauer [ms]
+C_HISTOGRAM_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+# Anzahl der Zyklen im rollierenden Fenster
+C_METRICS_WINDOW = 100
+# Anzahl der gemerkten Fehler (Diagnose-Download)
+C_ERROR_HISTORY = 20
+
+# Modbus/TCP: MBAP-Header (7 Byte) + Funktionscode
+_MBAP_SIZE = 7
+
+
+def read_request_bytes(count: int, bits: bool) -> tuple[int, int]:
+    """(gesendete, empfangene) Bytes eines Lese-Requests inkl. MBAP-Header."""
+    payload = (count + 7) // 8 if bits else count * 2
+    return _MBAP_SIZE + 5, _MBAP_SIZE + 2 + payload
+
+
+def write_request_bytes(count: int, bits: bool) -> tuple[int, int]:
+    """(gesendete, empfangene) Bytes eines Schreib-Requests inkl. MBAP-Header."""
+    if count == 1:
+        return _MBAP_SIZE + 5, _MBAP_SIZE + 5
+    payload = (count + 7) // 8 if bits else count * 2
+    return _MBAP_SIZE + 6 + payload, _MBAP_SIZE + 5
+
+
+class HubMetrics:
+    """Zählt Requests, Bytes und Fehler und misst die Phasen eines Lesezyklus."""
+
+    def __init__(self, window: int = C_METRICS_WINDOW) -> None:
+        self.requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.last_success: datetime | None = None
+        self.connect_ms: float | None = None
+        self.read_ms: float | None = None
+        self.decode_ms: float | None = None
+        self.dispatch_ms: float | None = None
+        self.cycle_ms: float | None = None
+        # Dauer je Block des letzten Zyklus, z.B. {"Input-Register 0-25": 12.3}
+        self.block_read_ms: Dict[str, float] = {}
+        self._cycles: deque[float] = deque(maxlen=window)
+        self._cycle_read_ms = 0.0
+        # (Zeitpunkt ISO, Meldung) der letzten Fehler
+        self.error_history: deque[tuple[str, str]] = deque(maxlen=C_ERROR_HISTORY)
+
+    # ---- Erfassung ------------------------------------------------------------------
+
+    def begin_cycle(self) -> None:
+        self._cycle_read_ms = 0.0
+        self.block_read_ms = {}
+
+    def record_connect(self, duration_ms: float) -> None:
+        self.connect_ms = duration_ms
+
+    def record_request(
+        self, label: str, sent: int, received: int, duration_ms: float
+    ) -> None:
+        self.requests += 1
+        self.bytes_sent += sent
+        self.bytes_received += received
+        self.block_read_ms[label] = duration_ms
+        self._cycle_read_ms += duration_ms
+
+    def record_write(self, sent: int, received: int) -> None:
+        self.requests += 1
+        self.bytes_sent += sent
+        self.bytes_received += received
+
+    def record_error(self, message: str, timeout: bool = False) -> None:
+        self.errors += 1
+        if timeout:
+            self.timeouts += 1
+        self.error_history.append((datetime.now(timezone.utc).isoformat(), message))
+
+    def record_decode(self, duration_ms: float) -> None:
+        self.decode_ms = duration_ms
+
+    def record_cycle(self, duration_ms: float, dispatch_ms: float) -> None:
+        """Erfolgreichen Lesezyklus abschließen."""
+        self.read_ms = self._cycle_read_ms
+        self.dispatch_ms = dispatch_ms
+        self.cycle_ms = duration_ms
+        self._cycles.append(duration_ms)
+        self.last_success = datetime.now(timezone.utc)
+
+    # ---- Auswertung -----------------------------------------------------------------
+
+    @property
+    def bytes_transferred(self) -> int:
+        return self.bytes_sent + self.bytes_received
+
+    def histogram(self) -> Dict[str, int]:
+        """Rollierendes Histogramm der Zyklusdauer (Klassenobergrenze in ms -> Anzahl)."""
+        result = {f"<={bound}ms": 0 for bound in C_HISTOGRAM_BUCKETS_MS}
+        result[f">{C_HISTOGRAM_BUCKETS_MS[-1]}ms"] = 0
+        for duration in self._cycles:
+            for bound in C_HISTOGRAM_BUCKETS_MS:
+                if duration <= bound:
+                    result[f"<={bound}ms"] += 1
+                    break
+            else:
+                result[f">{C_HISTOGRAM_BUCKETS_MS[-1]}ms"] += 1
+        return result
+
+    def percentiles(self) -> Dict[str, float]:
+        """p50/p95/p99 der Zyklusdauer im rollierenden Fenster [ms]."""
+        if len(self._cycles) < 2:
+            return {}
+        q = statistics.quantiles(self._cycles, n=100)
+        return {"p50": round(q[49], 1), "p95": round(q[94], 1), "p99": round(q[98], 1)}
+
+    def value(self, key: str) -> Any:
+        """Aktueller Wert des Diagnose-Sensors key."""
+        if key == C_METRIC_CYCLE_DURATION:
+            return _round(self.cycle_ms)
+        if key == C_METRIC_CONNECT_DURATION:
+            return _round(self.connect_ms)
+        if key == C_METRIC_READ_DURATION:
+            return _round(self.read_ms)
+        if key == C_METRIC_DECODE_DURATION:
+            return _round(self.decode_ms, 3)
+        if key == C_METRIC_DISPATCH_DURATION:
+            return _round(self.dispatch_ms, 3)
+        if key == C_METRIC_BYTES_TRANSFERRED:
+            return self.bytes_transferred
+        if key == C_METRIC_REQUESTS:
+            return self.requests
+        if key == C_METRIC_ERRORS:
+            return self.errors
+        if key == C_METRIC_TIMEOUTS:
+            return self.timeouts
+        if key == C_METRIC_LAST_SUCCESS:
+            return self.last_success
+        return None
+
+    def attributes(self, key: str) -> Dict[str, Any] | None:
+        """Zusätzliche Attribute des Diagnose-Sensors key."""
+        if key == C_METRIC_CYCLE_DURATION:
+            return {**self.percentiles(), "histogram": self.histogram()}
+        if key == C_METRIC_READ_DURATION:
+            return {
+                "blocks": {
+                    label: round(duration, 1)
+                    for label, duration in self.block_read_ms.items()
+                }
+            }
+        if key == C_METRIC_BYTES_TRANSFERRED:
+            return {"sent": self.bytes_sent, "received": self.bytes_received}
+        return None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "last_success": self.last_success.isoformat()
+            if self.last_success
+            else None,
+            "connect_ms": self.connect_ms,
+            "read_ms": self.read_ms,
+            "decode_ms": self.decode_ms,
+            "dispatch_ms": self.dispatch_ms,
+            "cycle_ms": self.cycle_ms,
+            "block_read_ms": dict(self.block_read_ms),
+            "cycle_percentiles_ms": self.percentiles(),
+            "cycle_histogram": self.histogram(),
+            "recent_cycles_ms": [round(duration, 1) for duration in self._cycles],
+            "recent_errors": [
+                {"time": when, "message": message}
+                for when, message in self.error_history
+            ],
+        }
+
+
+def _round(value: float | None, digits: int = 1) -> float | None:
+    return None if value is None else round(value, digits)
@@ -7,7 +7,7 @@ from typing import Optional, Any
 from homeassistant.components.number import NumberEntity
 
 from .entity_common import HubBackedEntity, setup_platform_from_types
-from .const import NUMBER_TYPES, MyNumberEntityDescription
+from .catalog import MyNumberEntityDescription, get_catalog
 
 thismodule = sys.modules[__name__]
 _LOGGER = logging.getLogger(__name__)
@@ -20,7 +20,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
         hass=hass,
         entry=entry,
         async_add_entities=async_add_entities,
-        types_dict=NUMBER_TYPES,
+        types_dict=get_catalog().number_types,
         entity_cls=MyNumber,
     )
 
@@ -41,7 +41,6 @@ class MyNumber(HubBackedEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Write new value via hub."""
-        self._attr_native_value = value
         # Einheitliches Schreiben wie bei select/climate:
         await self._hub.setter_function_callback(self, value)
 
@@ -0,0 +1,185 @@
+"""
+Pipelined Lesen über Modbus/TCP (optional, CONF_PIPELINED_READS).
+
+pymodbus wartet je Verbindung auf die Antwort eines Requests, bevor es den nächsten
+sendet. Modbus/TCP erlaubt aber mehrere offene Transaktionen, unterschieden über die
+Transaction-ID im MBAP-Header: PipelinedReader sendet alle Lese-Requests eines Zyklus
+am Stück auf einer eigenen Verbindung und ordnet die Antworten beim Eintreffen zu.
+Ein Zyklus dauert damit etwa eine Round-Trip-Zeit statt einer je Request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+import time
+from typing import NamedTuple, Sequence
+
+from .const import (
+    C_REG_TYPE_COILS,
+    C_REG_TYPE_DISCRETE_INPUTS,
+    C_REG_TYPE_HOLDING_REGISTERS,
+    C_REG_TYPE_INPUT_REGISTERS,
+    ReadRequest,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# MBAP-Header: Transaction-ID, Protocol-ID (0), Länge (Unit-ID + PDU), Unit-ID
+_MBAP = struct.Struct(">HHHB")
+# Unit-ID + Funktionscode mindestens, Unit-ID + PDU (max. 253 Bytes) höchstens
+_MAX_MBAP_LENGTH = 254
+_READ_PDU = struct.Struct(">BHH")
+
+_FUNCTION_CODES = {
+    C_REG_TYPE_COILS: 0x01,
+    C_REG_TYPE_DISCRETE_INPUTS: 0x02,
+    C_REG_TYPE_HOLDING_REGISTERS: 0x03,
+    C_REG_TYPE_INPUT_REGISTERS: 0x04,
+}
+
+
+class PipelinedResponse(NamedTuple):
+    """Antwort auf einen Request: Puffer oder Fehler (Exception-Code bzw. Timeout)."""
+
+    buf: list | None
+    exception_code: int | None = None
+    timeout: bool = False
+    duration_ms: float = 0.0
+
+
+class PipelinedReader:
+    """Eigene Verbindung für pipelined Lese-Requests, Zuordnung über Transaction-IDs."""
+
+    def __init__(self, host: str, port: int, timeout: float = 3.0) -> None:
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._receive_task: asyncio.Task | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._tid = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def async_connect(self) -> None:
+        """Verbindung aufbauen. OSError/TimeoutError bei Fehlschlag."""
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self._host, self._port), self._timeout
+        )
+        self._receive_task = asyncio.get_running_loop().create_task(
+            self._async_receive(self._reader)
+        )
+
+    def close(self) -> None:
+        if self._receive_task is not None:
+            self._receive_task.cancel()
+            self._receive_task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._reader = None
+        self._fail_pending(ConnectionResetError("Verbindung geschlossen"))
+
+    def _fail_pending(self, exc: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _async_receive(self, reader: asyncio.StreamReader) -> None:
+        """Antworten lesen und der wartenden Transaktion zuordnen."""
+        try:
+            while True:
+                header = await reader.readexactly(_MBAP.size)
+                tid, protocol, length, _unit = _MBAP.unpack(header)
+                if protocol != 0 or not 2 <= length <= _MAX_MBAP_LENGTH:
+                    # Strom nicht mehr synchron: Verbindung verwerfen
+                    raise ConnectionError(
+                        f"ungültiger MBAP-Header: Protokoll {protocol}, Länge {length}"
+                    )
+                pdu = await reader.readexactly(length - 1)
+                future = self._pending.pop(tid, None)
+                if future is not None and not future.done():
+                    future.set_result((pdu, time.perf_counter()))
+        except (
+            asyncio.IncompleteReadError,
+            ConnectionError,
+            OSError,
+            ValueError,
+        ) as exc:
+            _LOGGER.debug("Pipelined-Verbindung beendet: %r", exc)
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            self._fail_pending(ConnectionResetError(str(exc)))
+
+    def _next_tid(self) -> int:
+        self._tid = (self._tid + 1) & 0xFFFF
+        return self._tid
+
+    async def async_read(
+        self, requests: Sequence[ReadRequest], device_id: int
+    ) -> list[PipelinedResponse]:
+        """
+        Alle Requests ohne Warten senden und die Antworten einsammeln (Reihenfolge wie
+        requests). ConnectionError/OSError, wenn die Verbindung nicht nutzbar ist.
+        """
+        if not self.connected:
+            await self.async_connect()
+        loop = asyncio.get_running_loop()
+        frames = []
+        futures: list[asyncio.Future] = []
+        for request in requests:
+            tid = self._next_tid()
+            future = loop.create_future()
+            self._pending[tid] = future
+            futures.append(future)
+            frames.append(
+                _MBAP.pack(tid, 0, _READ_PDU.size + 1, device_id)
+                + _READ_PDU.pack(
+                    _FUNCTION_CODES[request.reg_type], request.address, request.count
+                )
+            )
+
+        started = time.perf_counter()
+        self._writer.write(b"".join(frames))
+        await self._writer.drain()
+        await asyncio.wait(futures, timeout=self._timeout)
+
+        responses = []
+        for request, future in zip(requests, futures):
+            if not future.done():
+                future.cancel()
+                responses.append(PipelinedResponse(None, timeout=True))
+                continue
+            if future.exception() is not None:
+                raise future.exception()
+            pdu, received = future.result()
+            duration_ms = (received - started) * 1000
+            if pdu[0] & 0x80:
+                responses.append(
+                    PipelinedResponse(None, pdu[1], duration_ms=duration_ms)
+                )
+                continue
+            responses.append(
+                PipelinedResponse(_decode_pdu(request, pdu), duration_ms=duration_ms)
+            )
+        # Abgelaufene Transaktionen nicht mehr zuordnen
+        for tid in [tid for tid, future in self._pending.items() if future.done()]:
+            del self._pending[tid]
+        return responses
+
+
+def _decode_pdu(request: ReadRequest, pdu: bytes) -> list:
+    """Antwort-PDU (Funktionscode, Byte-Anzahl, Daten) in Register bzw. Bits."""
+    byte_count = pdu[1]
+    data = pdu[2 : 2 + byte_count]
+    if request.reg_type in (C_REG_TYPE_COILS, C_REG_TYPE_DISCRETE_INPUTS):
+        count = min(request.count, len(data) * 8)
+        return [bool(data[i // 8] >> (i % 8) & 1) for i in range(count)]
+    return list(struct.unpack(f">{len(data) // 2}H", data[: len(data) // 2 * 2]))
@@ -0,0 +1,107 @@
+"""
+Gemeinsamer Poll-Scheduler aller Hubs (Config-Entries) der Integration.
+
+Jeder Hub behält seinen eigenen Takt (inkl. adaptivem Intervall), der Scheduler
+verteilt die Zyklen aber gleichmäßig über das Intervall (Phase je Hub) und begrenzt,
+wie viele Hubs gleichzeitig lesen. Damit feuern bei mehreren Lüftungsgeräten hinter
+wenigen Gateways nicht alle Abfragen in derselben Sekunde. Hubs hinter demselben Gateway
+teilen sich eine Phase: ihre Zyklen laufen gemeinsam und die Requests wechseln sich auf
+der geteilten Verbindung ab.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+import statistics
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict
+
+from .const import C_FLEET_MAX_CONCURRENT
+
+if TYPE_CHECKING:
+    from . import MyModbusHub
+
+
+class FleetScheduler:
+    """Staffelung und globale Nebenläufigkeitsgrenze der Lesezyklen aller Hubs."""
+
+    def __init__(self, max_concurrent: int = C_FLEET_MAX_CONCURRENT) -> None:
+        self._hubs: list[MyModbusHub] = []
+        self._max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._active = 0
+        self.cycles = 0
+        self._waits: deque[float] = deque(maxlen=100)
+        self._peak_active = 0
+
+    @property
+    def hubs(self) -> list[MyModbusHub]:
+        return list(self._hubs)
+
+    def register(self, hub: MyModbusHub) -> None:
+        if hub not in self._hubs:
+            self._hubs.append(hub)
+
+    def unregister(self, hub: MyModbusHub) -> None:
+        if hub in self._hubs:
+            self._hubs.remove(hub)
+
+    def align(self, hub: MyModbusHub, delay: float, tick: float) -> float:
+        """
+        Verzögerung bis zum nächsten Zyklus so verschieben, dass der Hub in seiner
+        Phase (Index des Gateways / Anzahl Gateways, je Takt) feuert. Verschiebung um
+        max. einen halben Takt, nie in die Vergangenheit.
+        """
+        gateways = list(dict.fromkeys(other.gateway for other in self._hubs))
+        if len(gateways) < 2 or hub not in self._hubs or tick <= 0:
+            return delay
+        phase = gateways.index(hub.gateway) / len(gateways) * tick
+        offset = (phase - (time.monotonic() + delay)) % tick
+        if offset <= tick / 2:
+            return delay + offset
+        if delay + offset - tick >= 0:
+            return delay + offset - tick
+        # Phase liegt zu weit vorn: diesmal unverändert, ab dem nächsten Zyklus ausgerichtet
+        return delay
+
+    @asynccontextmanager
+    async def cycle(self) -> AsyncIterator[None]:
+        """Einen Lesezyklus innerhalb der globalen Nebenläufigkeitsgrenze ausführen."""
+        started = time.perf_counter()
+        async with self._semaphore:
+            self._waits.append(time.perf_counter() - started)
+            self._active += 1
+            self._peak_active = max(self._peak_active, self._active)
+            try:
+                yield
+            finally:
+                self._active -= 1
+                self.cycles += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Kennzahlen über alle Hubs (Diagnose-Download)."""
+        waits_ms = [wait * 1000 for wait in self._waits]
+        cycle_ms = [hub.metrics.cycle_ms for hub in self._hubs if hub.metrics.cycle_ms]
+        result: Dict[str, Any] = {
+            "hubs": len(self._hubs),
+            "max_concurrent": self._max_concurrent,
+            "peak_concurrent": self._peak_active,
+            "cycles": self.cycles,
+            "available": sum(1 for hub in self._hubs if hub.available),
+            "last_cycle_ms": {
+                hub.name: _round(hub.metrics.cycle_ms) for hub in self._hubs
+            },
+        }
+        if waits_ms:
+            result["wait_ms_max"] = round(max(waits_ms), 1)
+            result["wait_ms_mean"] = round(statistics.fmean(waits_ms), 1)
+        if cycle_ms:
+            result["cycle_ms_mean"] = round(statistics.fmean(cycle_ms), 1)
+            result["cycle_ms_max"] = round(max(cycle_ms), 1)
+        return result
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 1)
@@ -9,7 +9,7 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.core import callback
 
 from .entity_common import HubBackedEntity, setup_platform_from_types
-from .const import SELECT_TYPES, MySelectEntityDescription
+from .catalog import MySelectEntityDescription, get_catalog
 
 thismodule = sys.modules[__name__]
 _LOGGER = logging.getLogger(__name__)
@@ -22,7 +22,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
         hass=hass,
         entry=entry,
         async_add_entities=async_add_entities,
-        types_dict=SELECT_TYPES,
+        types_dict=get_catalog().select_types,
         entity_cls=MySelect,
     )
 
@@ -50,8 +50,6 @@ class MySelect(HubBackedEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         # option ist der Key/Slug aus self.options
-        self._attr_current_option = option
-
         # Schreiben über bereitgestellte Setter-Funktion (falls vorhanden)
         if callable(self._setter_function):
             result = self._setter_function(self._hub, option)
@@ -9,13 +9,8 @@ from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.core import callback
 
 from .entity_common import HubBackedEntity, get_hub_and_device_info, setup_platform_from_types
-from .const import (
-    SENSOR_TYPES,
-    MySensorEntityDescription,
-    DerivedSensorSpec,
-    DEW_POINT_SENSOR_TYPES,
-    ABSOLUTE_HUMIDITY_SENSOR_TYPES,
-)
+from .catalog import MySensorEntityDescription, DerivedSensorSpec, get_catalog
+from .const import C_HUB_METRICS
 
 thismodule = sys.modules[__name__]
 _LOGGER = logging.getLogger(__name__)
@@ -23,21 +18,25 @@ _LOGGER.info(f"{thismodule} loaded")
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
+    catalog = get_catalog()
     await setup_platform_from_types(
         hass=hass,
         entry=entry,
         async_add_entities=async_add_entities,
-        types_dict=SENSOR_TYPES,
+        types_dict=catalog.sensor_types,
         entity_cls=MySensor,
     )
 
     hub_name, hub, device_info = get_hub_and_device_info(hass, entry)
     derived = [
         DewPointSensor(hub_name, hub, device_info, spec)
-        for spec in DEW_POINT_SENSOR_TYPES.values()
+        for spec in catalog.dew_point_sensor_types.values()
     ] + [
         AbsoluteHumiditySensor(hub_name, hub, device_info, spec)
-        for spec in ABSOLUTE_HUMIDITY_SENSOR_TYPES.values()
+        for spec in catalog.absolute_humidity_sensor_types.values()
+    ] + [
+        HubMetricSensor(hub_name, hub, device_info, description)
+        for description in catalog.metric_sensor_types.values()
     ]
     async_add_entities(derived)
     return True
@@ -94,6 +93,10 @@ class _DerivedSensorBase(HubBackedEntity, SensorEntity):
         self._temp_key = spec.temp_key
         self._humidity_key = spec.humidity_key
 
+    @property
+    def _hub_keys(self) -> tuple[str, ...]:
+        return (self._temp_key, self._humidity_key)
+
     @callback
     def _on_hub_update(self) -> None:
         T = self._hub.data.get(self._temp_key)
@@ -127,3 +130,43 @@ class AbsoluteHumiditySensor(_DerivedSensorBase):
 
     def _compute(self, T: float, RH: float) -> float:
         return (6.112 * math.exp((17.67 * T) / (T + 243.5)) * RH * 2.1674) / (273.15 + T)
+
+
+class HubMetricSensor(HubBackedEntity, SensorEntity):
+    """Diagnose-Sensor mit einer Kennzahl des Hubs (Zykluszeiten, Requests, Fehler)."""
+
+    entity_description: MySensorEntityDescription
+
+    # Ändern sich mit jedem Zyklus: nicht in die Recorder-Datenbank schreiben
+    _unrecorded_attributes = frozenset(
+        {"p50", "p95", "p99", "histogram", "blocks", "sent", "received"}
+    )
+
+    @property
+    def _hub_keys(self) -> tuple[str, ...]:
+        return (C_HUB_METRICS,)
+
+    @property
+    def available(self) -> bool:
+        # Kennzahlen bleiben auch bei nicht erreichbarem Gerät sichtbar
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._on_hub_update()
+
+    @callback
+    def _on_hub_update(self) -> None:
+        metrics = self._hub.metrics
+        key = self.entity_description.key
+        value = metrics.value(key)
+        attributes = metrics.attributes(key)
+        # Kennzahlen werden nach jedem Zyklus gemeldet: nur Änderungen schreiben
+        if (
+            self._attr_native_value == value
+            and self._attr_extra_state_attributes == attributes
+        ):
+            return
+        self._attr_native_value = value
+        self._attr_extra_state_attributes = attributes
+        self.async_write_ha_state()
@@ -7,7 +7,7 @@ from typing import Optional, Any
 from homeassistant.components.switch import SwitchEntity
 
 from .entity_common import HubBackedEntity, setup_platform_from_types
-from .const import BINARY_TYPES, MyBinaryEntityDescription
+from .catalog import MyBinaryEntityDescription, get_catalog
 
 thismodule = sys.modules[__name__]
 _LOGGER = logging.getLogger(__name__)
@@ -20,7 +20,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
         hass=hass,
         entry=entry,
         async_add_entities=async_add_entities,
-        types_dict=BINARY_TYPES,
+        types_dict=get_catalog().binary_types,
         entity_cls=MySwitch,
     )
 
@@ -46,9 +46,7 @@ class MySwitch(HubBackedEntity, SwitchEntity):
             return bool(v)
 
     async def async_turn_on(self, **kwargs) -> None:
-        self._attr_is_on = True
         await self._hub.setter_function_callback(self, True)
 
     async def async_turn_off(self, **kwargs) -> None:
-        self._attr_is_on = False
         await self._hub.setter_function_callback(self, False)
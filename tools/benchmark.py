@@ -0,0 +1,305 @@
+"""
+Benchmark für die Pipeline Lesen -> Dekodieren -> Dispatch des MyModbusHub.
+
+Gemessen werden je Zyklus (p50/p95/p99) und Allokationen (tracemalloc, Peak je Zyklus):
+- decode:   read_modbus_registers mit vorbereiteten Antwort-Puffern (ohne Netzwerk)
+- dispatch: Benachrichtigung aller Entitäten aller Plattformen inkl. abgeleiteter
+            Sensoren (Taupunkt, absolute Feuchte); async_write_ha_state ist dabei
+            ein No-Op, gemessen wird nur der Anteil der Integration
+- poll:     vollständiger Lesezyklus gegen den lokalen Simulator (tools/simulator.py)
+- write:    Schreiben + gezieltes Lesen gegen den Simulator (ohne Entprellung der Queue)
+
+Skalierung: --entities N vervielfacht ENTITIES_DICT synthetisch (Register werden je Kopie
+verschoben), --hubs M betreibt M Hubs parallel, --pipelined liest im Pipeline-Modus.
+
+    python -m tools.benchmark --cycles 500 --entities 4 --hubs 3 --latency 0.002
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict
+
+from custom_components.ha_comfoconnectpro import MyModbusHub, const
+from custom_components.ha_comfoconnectpro.binary_sensor import MyBinarySensor
+from custom_components.ha_comfoconnectpro.catalog import get_catalog
+from custom_components.ha_comfoconnectpro.climate import MyClimate
+from custom_components.ha_comfoconnectpro.const import (
+    C_POLL_TIERS,
+    C_REG_TYPE_COILS,
+    C_REG_TYPE_DISCRETE_INPUTS,
+    ENTITIES_DICT,
+    compile_cycle_read,
+    compile_merged_read,
+    get_entity_reg,
+    get_entity_type,
+    get_entity_width,
+)
+from custom_components.ha_comfoconnectpro.number import MyNumber
+from custom_components.ha_comfoconnectpro.select import MySelect
+from custom_components.ha_comfoconnectpro.sensor import (
+    AbsoluteHumiditySensor,
+    DewPointSensor,
+    MySensor,
+)
+from custom_components.ha_comfoconnectpro.switch import MySwitch
+
+from .simulator import ComfoConnectSimulator
+
+
+class _BenchBus:
+    def async_fire(self, *_args, **_kwargs) -> None:
+        pass
+
+
+def _bench_hass() -> Any:
+    """Minimaler Ersatz für hass: der Lese-/Schreibpfad nutzt nur loop und bus."""
+    return SimpleNamespace(loop=asyncio.get_running_loop(), bus=_BenchBus())
+
+
+def expand_entities(factor: int) -> Dict[str, Dict[str, Any]]:
+    """ENTITIES_DICT factor-fach kopieren, Register je Kopie hinter die vorherige legen."""
+    spans: Dict[int, int] = {}
+    for props in ENTITIES_DICT.values():
+        reg, _ = get_entity_reg(props)
+        width = get_entity_width(props)
+        if reg is not None and width is not None:
+            reg_type = get_entity_type(props)
+            spans[reg_type] = max(spans.get(reg_type, 0), reg + width)
+
+    entities: Dict[str, Dict[str, Any]] = {}
+    for copy in range(factor):
+        for key, props in ENTITIES_DICT.items():
+            name = key if copy == 0 else f"{key}_{copy}"
+            shifted = dict(props)
+            if props.get("REG") is not None:
+                shifted["REG"] = props["REG"] + copy * spans[get_entity_type(props)]
+            entities[name] = shifted
+    return entities
+
+
+def _random_buffers(plan, rnd: random.Random) -> Dict[Any, list]:
+    buffers = {}
+    for request in plan:
+        if request.reg_type in (C_REG_TYPE_COILS, C_REG_TYPE_DISCRETE_INPUTS):
+            buffers[request] = [rnd.random() < 0.5 for _ in range(request.count)]
+        else:
+            buffers[request] = [rnd.randrange(0, 1000) for _ in range(request.count)]
+    return buffers
+
+
+def _make_entities(hub) -> list:
+    """Entitäten aller Plattformen wie in async_setup_entry, ohne Home Assistant."""
+    device_info = {"identifiers": {(const.DOMAIN, "benchmark")}}
+    catalog = get_catalog()
+    entities = []
+    for types, cls in (
+        (catalog.sensor_types, MySensor),
+        (catalog.binary_sensor_types, MyBinarySensor),
+        (catalog.select_types, MySelect),
+        (catalog.climate_types, MyClimate),
+        (catalog.number_types, MyNumber),
+        (catalog.binary_types, MySwitch),
+    ):
+        entities += [cls("benchmark", hub, device_info, d) for d in types.values()]
+    for specs, cls in (
+        (catalog.dew_point_sensor_types, DewPointSensor),
+        (catalog.absolute_humidity_sensor_types, AbsoluteHumiditySensor),
+    ):
+        entities += [cls("benchmark", hub, device_info, s) for s in specs.values()]
+
+    for entity in entities:
+        entity.async_write_ha_state = lambda: None
+        hub.async_add_my_modbus_sensor(entity._on_hub_update, entity._hub_keys)
+    # Die erste Registrierung plant sofort ein Lesen ein; dessen Verbindungsversuch
+    # liefe in der Messung mit, gemessen wird hier nur das Verteilen
+    if hub._unsub_interval_method:
+        hub._unsub_interval_method()
+        hub._unsub_interval_method = None
+    return entities
+
+
+def _report(name: str, samples: list[float], peaks: list[int] | None = None) -> None:
+    if len(samples) < 2:
+        print(f"{name:<10} zu wenige Messwerte")
+        return
+    q = statistics.quantiles(samples, n=100)
+    line = (
+        f"{name:<10} n={len(samples):<6} p50={q[49] * 1e3:9.3f} ms  "
+        f"p95={q[94] * 1e3:9.3f} ms  p99={q[98] * 1e3:9.3f} ms"
+    )
+    if peaks:
+        line += f"  alloc peak={max(peaks) / 1024:8.1f} KiB/Zyklus"
+    print(line)
+
+
+async def _measure(
+    cycle: Callable[[], Awaitable[None]], cycles: int, warmup: int = 5
+) -> tuple[list[float], list[int]]:
+    """Zyklus cycles-mal messen (Zeit), danach erneut mit tracemalloc (Allokationen)."""
+    for _ in range(warmup):
+        await cycle()
+    samples = []
+    for _ in range(cycles):
+        started = time.perf_counter()
+        await cycle()
+        samples.append(time.perf_counter() - started)
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(min(cycles, 50)):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            await cycle()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - base)
+    finally:
+        tracemalloc.stop()
+    return samples, peaks
+
+
+async def bench_decode(args: argparse.Namespace) -> None:
+    entities = expand_entities(args.entities)
+    # Wie ein Zyklus, in dem alle Stufen fällig sind (zusammengefasster Read-Plan)
+    if args.entities <= 1:
+        read = compile_cycle_read(frozenset(C_POLL_TIERS))
+    else:
+        read = compile_merged_read(entities, entities)
+    plan, blocks = read.plan, read.blocks
+    print(
+        f"decode: {len(entities)} Entitäten, {len(plan)} Requests je Zyklus, "
+        f"{args.hubs} Hub(s)"
+    )
+
+    rnd = random.Random(1)
+    buffer_sets = [_random_buffers(plan, rnd) for _ in range(2)]
+    hubs = []
+    for index in range(args.hubs):
+        hub = MyModbusHub(_bench_hass(), f"bench{index}", "127.0.0.1", 1, 30, 1)
+        hubs.append(hub)
+
+    state = {"cycle": 0}
+
+    async def cycle() -> None:
+        buffers = buffer_sets[state["cycle"] % 2]
+        state["cycle"] += 1
+
+        async def read(request):
+            return buffers[request]
+
+        for hub in hubs:
+            hub._async_read_request = read
+            await hub.read_modbus_registers(C_POLL_TIERS, plan, blocks)
+
+    _report("decode", *await _measure(cycle, args.cycles))
+
+
+async def bench_dispatch(args: argparse.Namespace) -> None:
+    hubs = []
+    for index in range(args.hubs):
+        hub = MyModbusHub(_bench_hass(), f"bench{index}", "127.0.0.1", 1, 30, 1)
+        entities = _make_entities(hub)
+        hubs.append(hub)
+    print(f"dispatch: {len(entities)} Entitäten je Hub, {args.hubs} Hub(s)")
+
+    rnd = random.Random(2)
+    buffer_sets = [_random_buffers(get_catalog().read_plan, rnd) for _ in range(2)]
+    for hub in hubs:
+        for buffers in buffer_sets:
+
+            async def read(request, buffers=buffers):
+                return buffers[request]
+
+            hub._async_read_request = read
+            await hub.read_modbus_registers()
+    keys = list(ENTITIES_DICT)
+
+    async def cycle() -> None:
+        for hub in hubs:
+            hub._async_dispatch(keys)
+
+    _report("dispatch", *await _measure(cycle, args.cycles))
+
+
+async def bench_network(args: argparse.Namespace) -> None:
+    sim = ComfoConnectSimulator(port=0, latency=args.latency, seed=3)
+    await sim.start()
+    hubs = [
+        MyModbusHub(
+            _bench_hass(),
+            f"bench{index}",
+            "127.0.0.1",
+            sim.port,
+            30,
+            1,
+            pipelined=args.pipelined,
+        )
+        for index in range(args.hubs)
+    ]
+    print(
+        f"poll/write: Simulator mit {args.latency * 1e3:.1f} ms Latenz, "
+        f"{args.hubs} Hub(s){', pipelined' if args.pipelined else ''}"
+    )
+    try:
+
+        async def poll() -> None:
+            await asyncio.gather(*(hub._async_read_cycle(full=True) for hub in hubs))
+
+        _report("poll", *await _measure(poll, args.cycles))
+
+        presets = [0, 1, 2, 3]
+        state = {"cycle": 0}
+
+        async def write() -> None:
+            value = presets[state["cycle"] % 4]
+            state["cycle"] += 1
+
+            async def write_one(hub) -> None:
+                await hub._write_modbus_registers(0, [value], const.C_DT_UINT16)
+                await hub._async_read_keys((const.C_VENTILATION_PRESET,))
+
+            await asyncio.gather(*(write_one(hub) for hub in hubs))
+
+        _report("write", *await _measure(write, max(args.cycles // 5, 10)))
+    finally:
+        for hub in hubs:
+            await hub.async_close()
+        await sim.stop()
+
+
+async def _main(args: argparse.Namespace) -> None:
+    await bench_decode(args)
+    await bench_dispatch(args)
+    if not args.skip_network:
+        await bench_network(args)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cycles", type=int, default=200)
+    parser.add_argument(
+        "--entities", type=int, default=1, help="Vielfaches von ENTITIES_DICT"
+    )
+    parser.add_argument("--hubs", type=int, default=1)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Latenz des Simulators [s]"
+    )
+    parser.add_argument(
+        "--skip-network", action="store_true", help="nur decode/dispatch"
+    )
+    parser.add_argument(
+        "--pipelined", action="store_true", help="Lese-Requests pipelined senden"
+    )
+    args = parser.parse_args()
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
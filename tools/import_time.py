@@ -0,0 +1,181 @@
+"""
+Import-Zeit der Integration (Anteil am Start von Home Assistant).
+
+Jede Messung läuft in einem frischen Interpreter: zuerst werden die Module geladen, die
+Home Assistant vor jeder Integration ohnehin geladen hat, dann wird die Zeit für den
+Import der Integration bzw. zusätzlich ihrer Plattform-Module gemessen, dazu die Anzahl
+neu geladener Module. Für den Katalog (catalog.get_catalog, beim ersten Setup) werden
+erster und zweiter Aufruf gemessen; in älteren Ständen steckt dieser Anteil im Import.
+--compare REV misst denselben Ablauf für einen älteren Stand (git archive in ein
+temporäres Verzeichnis), z.B. vor dem Aufteilen von const.py (benötigt die
+Abhängigkeiten der Integration, wie tools/benchmark.py):
+
+    python -m tools.import_time --runs 20 --compare HEAD~1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PACKAGE = "custom_components.ha_comfoconnectpro"
+
+# (Bezeichnung, Module); jeder Eintrag wird in einem eigenen Interpreter gemessen
+TARGETS = (
+    ("integration", (PACKAGE,)),
+    (
+        "platforms",
+        tuple(
+            f"{PACKAGE}{suffix}"
+            for suffix in (
+                "",
+                ".sensor",
+                ".binary_sensor",
+                ".select",
+                ".switch",
+                ".number",
+                ".climate",
+            )
+        ),
+    ),
+)
+
+# Von Home Assistant vor dem Laden einer Integration bereits importiert
+BASELINE_CORE = (
+    "homeassistant.const",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.entity",
+)
+# Zusätzlich die Entitäts-Plattformen (in üblichen Installationen schon geladen)
+BASELINE_PLATFORMS = BASELINE_CORE + (
+    "homeassistant.components.sensor",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.select",
+    "homeassistant.components.switch",
+    "homeassistant.components.number",
+    "homeassistant.components.climate",
+)
+
+_PROBE = """
+import importlib, json, sys, time
+for name in {baseline!r}:
+    importlib.import_module(name)
+before = len(sys.modules)
+started = time.perf_counter()
+for name in {targets!r}:
+    importlib.import_module(name)
+result = {{"import_ms": (time.perf_counter() - started) * 1000,
+          "modules": len(sys.modules) - before}}
+try:
+    catalog = importlib.import_module({package!r} + ".catalog")
+except ImportError:
+    catalog = None
+if catalog is not None:
+    started = time.perf_counter()
+    catalog.get_catalog()
+    result["catalog_first_ms"] = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    catalog.get_catalog()
+    result["catalog_cached_ms"] = (time.perf_counter() - started) * 1000
+print(json.dumps(result))
+"""
+
+
+def _probe(root: Path, targets: tuple[str, ...], baseline: tuple[str, ...]) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (str(root), env.get("PYTHONPATH")))
+    )
+    code = _PROBE.format(baseline=baseline, targets=targets, package=PACKAGE)
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=root,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def measure(root: Path, runs: int, baseline: tuple[str, ...]) -> dict[str, dict]:
+    """Median je Ziel und Kennzahl über runs frische Interpreter."""
+    results: dict[str, dict] = {}
+    for label, targets in TARGETS:
+        try:
+            samples = [_probe(root, targets, baseline) for _ in range(runs)]
+        except RuntimeError as exc:
+            results[label] = {"error": str(exc)}
+            continue
+        results[label] = {
+            key: statistics.median(sample[key] for sample in samples)
+            for key in samples[0]
+        }
+    return results
+
+
+def _export(rev: str, directory: Path) -> None:
+    """Stand rev der Integration nach directory exportieren."""
+    archive = subprocess.run(
+        ["git", "archive", rev, "custom_components"],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        check=True,
+    )
+    subprocess.run(
+        ["tar", "-x", "-C", str(directory)], input=archive.stdout, check=True
+    )
+
+
+def _report(name: str, results: dict[str, dict]) -> None:
+    print(name)
+    for label, values in results.items():
+        if "error" in values:
+            print(f"  {label:<12} Fehler: {values['error']}")
+            continue
+        line = (
+            f"  {label:<12} import={values['import_ms']:8.1f} ms"
+            f"  neue Module={values['modules']:5.0f}"
+        )
+        if "catalog_first_ms" in values:
+            line += (
+                f"  Katalog={values['catalog_first_ms']:6.2f} ms"
+                f" (danach {values['catalog_cached_ms'] * 1000:.1f} µs)"
+            )
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--compare", metavar="REV", help="Vergleich mit git-Revision, z.B. HEAD~1"
+    )
+    parser.add_argument(
+        "--without-platforms",
+        action="store_true",
+        help="Entitäts-Plattformen nicht vorab laden (nur Home-Assistant-Kern)",
+    )
+    args = parser.parse_args()
+
+    baseline = BASELINE_CORE if args.without_platforms else BASELINE_PLATFORMS
+    root = Path(__file__).resolve().parent.parent
+    print(f"Median aus {args.runs} Interpretern, vorab geladen: {len(baseline)} Module")
+    if args.compare:
+        with tempfile.TemporaryDirectory() as directory:
+            _export(args.compare, Path(directory))
+            _report(args.compare, measure(Path(directory), args.runs, baseline))
+    _report("aktueller Stand", measure(root, args.runs, baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,494 @@
+"""
+ComfoConnect PRO Modbus/TCP-Simulator für Tests und Benchmarks ohne Gerät.
+
+Stellt die Register aus ENTITIES_DICT bereit (Input-/Holding-Register, Coils,
+Discrete Inputs) und simuliert:
+- driftende Temperaturen/Feuchten, CO2-Verläufe je Zone abhängig von Belegung und Luftmenge
+- Nebenwirkungen der Coils (Preset-Coils, Boost mit Ablaufzeit, Away, Fehler quittieren)
+- konfigurierbare Latenz, abbrechende Verbindungen und leere Antworten
+  (Verhalten des ComfoConnect PRO nach der Zeitumstellung, bis zum Neustart)
+
+Start (aus dem Repository-Verzeichnis, benötigt die Abhängigkeiten der Integration):
+
+    python -m tools.simulator --port 5020 --latency 0.05 --drop-rate 0.01
+
+Programmatisch (z.B. in Benchmarks):
+
+    sim = ComfoConnectSimulator(port=0, latency=0.02)
+    await sim.start()
+    ...  # MyModbusHub gegen ("127.0.0.1", sim.port)
+    await sim.stop()
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import math
+import random
+import struct
+import time
+from typing import Any, Dict
+
+from custom_components.ha_comfoconnectpro import const
+from custom_components.ha_comfoconnectpro.const import (
+    C_REG_TYPE_COILS,
+    C_REG_TYPE_DISCRETE_INPUTS,
+    C_REG_TYPE_HOLDING_REGISTERS,
+    C_REG_TYPE_INPUT_REGISTERS,
+    ENTITIES_DICT,
+    get_entity_factor,
+    get_entity_reg,
+    get_entity_select,
+    get_entity_type,
+    get_entity_width,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Modbus-Funktionscodes -> (Registerart, Schreibzugriff)
+_FUNCTIONS: Dict[int, tuple[int, bool]] = {
+    0x01: (C_REG_TYPE_COILS, False),
+    0x02: (C_REG_TYPE_DISCRETE_INPUTS, False),
+    0x03: (C_REG_TYPE_HOLDING_REGISTERS, False),
+    0x04: (C_REG_TYPE_INPUT_REGISTERS, False),
+    0x05: (C_REG_TYPE_COILS, True),
+    0x06: (C_REG_TYPE_HOLDING_REGISTERS, True),
+    0x0F: (C_REG_TYPE_COILS, True),
+    0x10: (C_REG_TYPE_HOLDING_REGISTERS, True),
+}
+
+# Modbus-Exception-Codes
+_ILLEGAL_FUNCTION = 0x01
+_ILLEGAL_ADDRESS = 0x02
+_ILLEGAL_VALUE = 0x03
+_GATEWAY_TARGET_FAILED = 0x0B
+
+# Zuluft-Volumen je Lüftungsstufe (away, low, medium, high) und bei Boost [m³/h]
+_PRESET_AIRFLOW = (50, 100, 150, 225)
+_BOOST_AIRFLOW = 300
+_CO2_OUTDOOR = 420.0
+
+
+class ComfoConnectSimulator:
+    """Modbus/TCP-Server mit dem Registersatz des ComfoConnect PRO."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 5020,
+        device_id: int = 1,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        drop_rate: float = 0.0,
+        time_scale: float = 1.0,
+        seed: int | None = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.device_id = device_id
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.time_scale = time_scale
+        # Nach der Zeitumstellung liefert das Gerät leere Antworten, bis es neu startet
+        self.empty_responses = False
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._server: asyncio.AbstractServer | None = None
+        self._tick_task: asyncio.Task | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._handlers: set[asyncio.Task] = set()
+        self._started = time.monotonic()
+        self._last_tick = self._started
+        self._tables: Dict[int, list[int]] = {}
+        self._boost_remaining = 0.0
+        self._occupancy = [False] * 8
+        self._state: Dict[str, float] = {}
+        self.reset()
+
+    # ---- Registersatz ----------------------------------------------------------
+
+    def reset(self) -> None:
+        """Register auf Startwerte setzen (entspricht einem Neustart des Geräts)."""
+        sizes: Dict[int, int] = {}
+        for props in ENTITIES_DICT.values():
+            reg, _ = get_entity_reg(props)
+            width = get_entity_width(props)
+            if reg is None or width is None:
+                continue
+            reg_type = get_entity_type(props)
+            sizes[reg_type] = max(sizes.get(reg_type, 0), reg + width)
+        self._tables = {reg_type: [0] * size for reg_type, size in sizes.items()}
+        self.empty_responses = False
+
+        self._state = {
+            "room": 21.5,
+            "humidity": 45.0,
+            "outdoor_humidity": 70.0,
+        }
+        self._co2 = [_CO2_OUTDOOR + self._random.uniform(0, 150) for _ in range(8)]
+        self.set_value(const.C_CONNECTION_STATE, 0)
+        self.set_value(const.C_VENTILATION_PRESET, 2)
+        self.set_value(const.C_TEMPERATURE_PROFILE, 0)
+        self.set_value(const.C_TEMPERATURE_PROFILE_MODE, 0)
+        self.set_value(const.C_EXTERNAL_SETPOINT, 21.0)
+        self.set_value(const.C_BOOST_TIME, 30)
+        self.set_value(const.C_FILTER_DAYS_REMAINING, 120)
+        self.set_value(const.C_AUTO_MODE, True)
+        self._update_model(0.0)
+
+    def set_value(self, entity_key: str, value: Any) -> None:
+        """Physikalischen Wert (bzw. Label/Index bei VALUES) einer Entität setzen."""
+        props = ENTITIES_DICT[entity_key]
+        reg, dt = get_entity_reg(props)
+        table = self._tables[get_entity_type(props)]
+        if dt == const.C_DT_BITS:
+            table[reg] = 1 if value in (True, 1, "on") else 0
+            return
+
+        values = get_entity_select(props)
+        if isinstance(value, str) and values:
+            value = next(k for k, v in values.items() if v == value)
+        raw = round(value / get_entity_factor(props))
+        words = struct.unpack(
+            f">{get_entity_width(props)}H",
+            struct.pack(">" + dt.value[0], raw),
+        )
+        table[reg : reg + len(words)] = words
+
+    def get_value(self, entity_key: str) -> Any:
+        """Physikalischen Wert (bzw. Rohwert bei VALUES) einer Entität lesen."""
+        props = ENTITIES_DICT[entity_key]
+        reg, dt = get_entity_reg(props)
+        table = self._tables[get_entity_type(props)]
+        if dt == const.C_DT_BITS:
+            return bool(table[reg])
+        width = get_entity_width(props)
+        (raw,) = struct.unpack(
+            ">" + dt.value[0],
+            struct.pack(f">{width}H", *table[reg : reg + width]),
+        )
+        if get_entity_select(props):
+            return raw
+        return raw * get_entity_factor(props)
+
+    def inject_error(self, code: int) -> None:
+        """Gerätefehler (Code aus ERROR_DICT) in den ersten freien Fehler-Slot setzen."""
+        for key in (
+            const.C_ACTIVEERROR1,
+            const.C_ACTIVEERROR2,
+            const.C_ACTIVEERROR3,
+            const.C_ACTIVEERROR4,
+            const.C_ACTIVEERROR5,
+        ):
+            if self.get_value(key) == const.C_NO_ERR:
+                self.set_value(key, code)
+                break
+        self.set_value(const.C_ERROR_FLAG, True)
+
+    def simulate_dst_change(self) -> None:
+        """Ab jetzt leere Antworten liefern, bis reset() (Neustart) aufgerufen wird."""
+        self.empty_responses = True
+
+    # ---- Dynamik ----------------------------------------------------------------
+
+    def _apply_write(self, reg_type: int, address: int, count: int) -> None:
+        """Nebenwirkungen von Schreibzugriffen wie am Gerät nachbilden."""
+        written = range(address, address + count)
+        if reg_type == C_REG_TYPE_COILS:
+            coils = self._tables[C_REG_TYPE_COILS]
+            # Coil 0: Fehler quittieren (selbstrücksetzend)
+            if 0 in written and coils[0]:
+                coils[0] = 0
+                for key in (
+                    const.C_ACTIVEERROR1,
+                    const.C_ACTIVEERROR2,
+                    const.C_ACTIVEERROR3,
+                    const.C_ACTIVEERROR4,
+                    const.C_ACTIVEERROR5,
+                ):
+                    self.set_value(key, const.C_NO_ERR)
+                self.set_value(const.C_ERROR_FLAG, False)
+            # Coils 1-4: Lüftungsstufe away/1/2/3 (selbstrücksetzend)
+            for preset, coil in enumerate(range(1, 5)):
+                if coil in written and coils[coil]:
+                    coils[coil] = 0
+                    self._set_preset(preset)
+            # Coil 6: Boost für BOOST_TIME
+            if 6 in written:
+                self._boost_remaining = (
+                    self.get_value(const.C_BOOST_TIME) * 60 if coils[6] else 0.0
+                )
+            # Coil 7: Away-Funktion
+            if 7 in written:
+                if coils[7]:
+                    self._set_preset(0)
+                elif self.get_value(const.C_VENTILATION_PRESET) == 0:
+                    self._set_preset(1)
+        elif reg_type == C_REG_TYPE_HOLDING_REGISTERS:
+            # Register 0: Lüftungsstufe; manuelle Stufe beendet den Auto-Modus
+            if 0 in written:
+                self._set_preset(self.get_value(const.C_VENTILATION_PRESET))
+
+    def _set_preset(self, preset: int) -> None:
+        self.set_value(const.C_VENTILATION_PRESET, preset)
+        self.set_value(const.C_AWAY_FUNCTION, preset == 0)
+        self.set_value(const.C_AUTO_MODE, False)
+
+    def _update_model(self, dt: float) -> None:
+        """Modell um dt simulierte Sekunden fortschreiben und Input-Register setzen."""
+        rnd = self._random
+        t = (time.monotonic() - self._started) * self.time_scale
+
+        # Boost läuft ab
+        if self._boost_remaining > 0:
+            self._boost_remaining = max(self._boost_remaining - dt, 0.0)
+            if self._boost_remaining == 0:
+                self.set_value(const.C_BOOST, False)
+
+        standby = self.get_value(const.C_STANDBY)
+        if standby:
+            airflow = 0
+        elif self.get_value(const.C_BOOST):
+            airflow = _BOOST_AIRFLOW
+        else:
+            preset = self.get_value(const.C_VENTILATION_PRESET)
+            airflow = _PRESET_AIRFLOW[min(max(preset, 0), 3)]
+        self.set_value(const.C_AIRFLOW, airflow)
+
+        # Temperaturen: Tagesgang außen, Raum driftet leicht, WRG ca. 85 %
+        outdoor = 8.0 + 6.0 * math.sin(2 * math.pi * t / 86400) + rnd.gauss(0, 0.05)
+        room = self._state["room"] + rnd.gauss(0, 0.02) * math.sqrt(max(dt, 0.0))
+        room = min(max(room, 19.0), 25.0)
+        self._state["room"] = room
+        extract = room + 0.3
+        efficiency = 0.85 if airflow else 0.0
+        supply = outdoor + efficiency * (extract - outdoor)
+        if self.get_value(const.C_COMFOCOOL):
+            supply = min(supply, 18.0)
+        exhaust = extract - efficiency * (extract - outdoor)
+        self.set_value(const.C_OUTDOOR_TEMPERATURE, outdoor)
+        self.set_value(const.C_ROOM_TEMPERATURE, room)
+        self.set_value(const.C_EXTRACT_TEMPERATURE, extract)
+        self.set_value(const.C_SUPPLY_TEMPERATURE, supply)
+        self.set_value(const.C_EXHAUST_TEMPERATURE, exhaust)
+
+        # Feuchten: Random Walk in plausiblen Grenzen
+        for name, low, high in (("humidity", 30, 65), ("outdoor_humidity", 40, 95)):
+            value = self._state[name] + rnd.gauss(0, 0.1) * math.sqrt(max(dt, 0.0))
+            self._state[name] = min(max(value, low), high)
+        humidity = self._state["humidity"]
+        self.set_value(const.C_ROOM_HUMIDITY, round(humidity))
+        self.set_value(const.C_EXTRACT_HUMIDITY, round(humidity + 1))
+        self.set_value(const.C_EXHAUST_HUMIDITY, round(humidity + 8))
+        self.set_value(const.C_OUTDOOR_HUMIDITY, round(self._state["outdoor_humidity"]))
+        self.set_value(const.C_SUPPLY_HUMIDITY, round(humidity - 5))
+
+        # CO2 je Zone: Belegung wechselt zufällig, Abbau proportional zur Luftmenge
+        for zone in range(8):
+            if rnd.random() < dt / 1800:
+                self._occupancy[zone] = not self._occupancy[zone]
+            co2 = self._co2[zone]
+            co2 += dt * (0.5 if self._occupancy[zone] else 0.0)
+            co2 -= dt * airflow / 150 * 0.002 * (co2 - _CO2_OUTDOOR)
+            self._co2[zone] = min(max(co2, _CO2_OUTDOOR), 5000.0)
+            self.set_value(
+                getattr(const, f"C_CO2_SENSOR_ZONE_{zone + 1}"),
+                round(self._co2[zone] + rnd.gauss(0, 3)),
+            )
+
+        # Filter: ein Tag weniger je simuliertem Tag
+        days = max(120 - int(t // 86400), 0)
+        self.set_value(const.C_FILTER_DAYS_REMAINING, days)
+
+    async def _tick_loop(self) -> None:
+        while True:
+            await asyncio.sleep(1.0)
+            now = time.monotonic()
+            self._update_model((now - self._last_tick) * self.time_scale)
+            self._last_tick = now
+
+    # ---- Modbus/TCP ---------------------------------------------------------------
+
+    def _handle_pdu(self, pdu: bytes) -> bytes:
+        """Einen Request (PDU ohne MBAP-Header) beantworten."""
+        function = pdu[0]
+        if function not in _FUNCTIONS or len(pdu) < 5:
+            return bytes((function | 0x80, _ILLEGAL_FUNCTION))
+        reg_type, write = _FUNCTIONS[function]
+        table = self._tables.get(reg_type, [])
+        address, value = struct.unpack_from(">HH", pdu, 1)
+        bits = reg_type in (C_REG_TYPE_COILS, C_REG_TYPE_DISCRETE_INPUTS)
+
+        if not write:
+            count = value
+            if not 1 <= count <= (2000 if bits else 125):
+                return bytes((function | 0x80, _ILLEGAL_VALUE))
+            if address + count > len(table):
+                return bytes((function | 0x80, _ILLEGAL_ADDRESS))
+            if self.empty_responses:
+                return bytes((function, 0))
+            values = table[address : address + count]
+            if bits:
+                payload = bytearray((count + 7) // 8)
+                for index, bit in enumerate(values):
+                    if bit:
+                        payload[index // 8] |= 1 << (index % 8)
+                return bytes((function, len(payload))) + bytes(payload)
+            return bytes((function, count * 2)) + struct.pack(f">{count}H", *values)
+
+        if function in (0x05, 0x06):
+            if address >= len(table):
+                return bytes((function | 0x80, _ILLEGAL_ADDRESS))
+            if function == 0x05:
+                if value not in (0x0000, 0xFF00):
+                    return bytes((function | 0x80, _ILLEGAL_VALUE))
+                table[address] = 1 if value == 0xFF00 else 0
+            else:
+                table[address] = value
+            self._apply_write(reg_type, address, 1)
+            return pdu[:5]
+
+        count = value
+        if address + count > len(table) or len(pdu) < 6:
+            return bytes((function | 0x80, _ILLEGAL_ADDRESS))
+        data = pdu[6 : 6 + pdu[5]]
+        if function == 0x0F:
+            for index in range(count):
+                table[address + index] = (data[index // 8] >> (index % 8)) & 1
+        else:
+            table[address : address + count] = struct.unpack(f">{count}H", data)
+        self._apply_write(reg_type, address, count)
+        return pdu[:5]
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._writers.add(writer)
+        self._handlers.add(asyncio.current_task())
+        responses: set[asyncio.Task] = set()
+        try:
+            while True:
+                header = await reader.readexactly(7)
+                tid, pid, length, unit = struct.unpack(">HHHB", header)
+                pdu = await reader.readexactly(length - 1)
+                self.requests += 1
+
+                if self.drop_rate and self._random.random() < self.drop_rate:
+                    _LOGGER.debug("Verbindung absichtlich getrennt (tid %s)", tid)
+                    break
+                if unit != self.device_id:
+                    response = bytes((pdu[0] | 0x80, _GATEWAY_TARGET_FAILED))
+                else:
+                    response = self._handle_pdu(pdu)
+                frame = struct.pack(">HHHB", tid, pid, len(response) + 1, unit)
+                # Latenz je Request, aber nebenläufig: mehrere offene Transaktionen
+                # (pipelined Requests) überlappen sich wie auf dem Netzwerk
+                delay = self.latency + self._random.uniform(0, self.jitter)
+                if delay:
+                    task = asyncio.get_running_loop().create_task(
+                        self._send_later(writer, frame + response, delay)
+                    )
+                    responses.add(task)
+                    task.add_done_callback(responses.discard)
+                else:
+                    writer.write(frame + response)
+                    await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for task in responses:
+                task.cancel()
+            self._writers.discard(writer)
+            self._handlers.discard(asyncio.current_task())
+            writer.close()
+
+    @staticmethod
+    async def _send_later(
+        writer: asyncio.StreamWriter, frame: bytes, delay: float
+    ) -> None:
+        await asyncio.sleep(delay)
+        if not writer.is_closing():
+            writer.write(frame)
+
+    async def start(self) -> None:
+        """Server und Simulation starten. Bei port=0 wird ein freier Port gewählt."""
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._tick_task = asyncio.get_running_loop().create_task(self._tick_loop())
+        _LOGGER.info("Simulator läuft auf %s:%s", self.host, self.port)
+
+    def disconnect_all(self) -> None:
+        """Alle offenen Client-Verbindungen trennen (z.B. Gateway-Neustart)."""
+        for writer in list(self._writers):
+            writer.close()
+
+    async def stop(self) -> None:
+        if self._tick_task:
+            self._tick_task.cancel()
+            self._tick_task = None
+        self.disconnect_all()
+        # Verbindungen regulär auslaufen lassen (nicht abbrechen)
+        if self._handlers:
+            await asyncio.wait(list(self._handlers), timeout=1.0)
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+
+async def _main(args: argparse.Namespace) -> None:
+    sim = ComfoConnectSimulator(
+        host=args.host,
+        port=args.port,
+        device_id=args.device_id,
+        latency=args.latency,
+        jitter=args.jitter,
+        drop_rate=args.drop_rate,
+        time_scale=args.time_scale,
+        seed=args.seed,
+    )
+    await sim.start()
+    if args.dst_after:
+        asyncio.get_running_loop().call_later(args.dst_after, sim.simulate_dst_change)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await sim.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5020)
+    parser.add_argument("--device-id", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0, help="Sekunden")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Sekunden")
+    parser.add_argument(
+        "--drop-rate", type=float, default=0.0, help="Anteil getrennter Requests"
+    )
+    parser.add_argument(
+        "--time-scale", type=float, default=1.0, help="Zeitraffer der Dynamik"
+    )
+    parser.add_argument(
+        "--dst-after",
+        type=float,
+        default=0.0,
+        help="Nach N Sekunden leere Antworten liefern (Zeitumstellung)",
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    try:
+        asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()